@@ -526,6 +526,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         await async_register_services(hass)
 
+        # Serve the entry's metrics at /api/violet_pool_controller/metrics/<entry_id>
+        from .openmetrics import async_register_metrics_view
+
+        async_register_metrics_view(hass)
+
         # Drop registry entries the platforms no longer provide, so disabling a
         # feature, deselecting a sensor or removing a hardware module actually
         # makes the matching entities disappear instead of leaving them behind
@@ -594,6 +599,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted payload and poll history of a removed config entry.
+
+    Args:
+        hass: The Home Assistant instance.
+        entry: The removed config entry.
+    """
+    from homeassistant.helpers.storage import Store
+
+    from .device import PAYLOAD_STORAGE_VERSION, payload_storage_key, poll_ring_path
+    from .poll_ring import remove_poll_ring
+
+    await Store(hass, PAYLOAD_STORAGE_VERSION, payload_storage_key(entry.entry_id)).async_remove()
+    await hass.async_add_executor_job(remove_poll_ring, poll_ring_path(hass, entry.entry_id))
+
+
 def _structural_options(entry: ConfigEntry) -> dict[str, Any]:
     """Return the options that decide *which* entities are created.
 
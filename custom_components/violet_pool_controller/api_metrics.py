@@ -0,0 +1,103 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Sliding-window counters for the controller requests of one device.
+
+Lifetime totals divided by the uptime barely move after a few days, so a
+burst of requests from an automation or a stalled controller does not show.
+``WindowedCounters`` keeps the counts in fixed-width time buckets instead and
+sums the buckets of the requested window. Memory is constant: one ``array``
+slot per bucket and counter, reused once the bucket falls out of the horizon.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+
+def payload_size(payload: Any) -> int:
+    """Return the approximate size in bytes of a decoded JSON response.
+
+    The API only hands back the decoded payload, so the size is estimated
+    from the key and value text plus the JSON punctuation around each pair.
+    """
+    if isinstance(payload, Mapping):
+        return sum(len(str(key)) + len(str(value)) + 6 for key, value in payload.items()) + 2
+    if payload is None:
+        return 0
+    return len(str(payload))
+
+
+class WindowedCounters:
+    """Bucketed counters that answer "how many in the last N seconds"."""
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        *,
+        horizon: int = 3600,
+        resolution: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the counters.
+
+        Args:
+            fields: Names of the counters, e.g. ``("requests", "failures")``.
+            horizon: Longest window in seconds that can be queried.
+            resolution: Width of one bucket in seconds.
+            clock: Monotonic time source, replaceable in tests.
+        """
+        self.fields = tuple(fields)
+        self.resolution = resolution
+        self.horizon = horizon
+        self._clock = clock
+        self._size = math.ceil(horizon / resolution)
+        # The absolute bucket number each slot currently holds; -1 = unused.
+        self._bucket_ids = array("q", [-1]) * self._size
+        self._columns = {field: array("Q", bytes(8 * self._size)) for field in self.fields}
+
+    def _current_bucket(self) -> int:
+        return int(self._clock() // self.resolution)
+
+    def add(self, **amounts: int) -> None:
+        """Add ``amounts`` (counter name to increment) to the current bucket."""
+        bucket = self._current_bucket()
+        slot = bucket % self._size
+        if self._bucket_ids[slot] != bucket:
+            # The slot still holds a bucket from an earlier lap - reuse it.
+            self._bucket_ids[slot] = bucket
+            for column in self._columns.values():
+                column[slot] = 0
+        for field, amount in amounts.items():
+            self._columns[field][slot] += amount
+
+    def total(self, field: str, window: int) -> int:
+        """Return the sum of ``field`` over the last ``window`` seconds."""
+        return self.totals(window, (field,))[field]
+
+    def totals(self, window: int, fields: Sequence[str] | None = None) -> dict[str, int]:
+        """Return the sums over the last ``window`` seconds.
+
+        Args:
+            window: Window length in seconds, capped at the horizon. The
+                window is rounded up to whole buckets and includes the
+                current, partially filled one.
+            fields: Counters to sum; all of them by default.
+        """
+        selected = self.fields if fields is None else tuple(fields)
+        current = self._current_bucket()
+        count = min(self._size, math.ceil(window / self.resolution))
+        slots = [
+            bucket % self._size
+            for bucket in range(current - count + 1, current + 1)
+            if self._bucket_ids[bucket % self._size] == bucket
+        ]
+        return {field: sum(self._columns[field][slot] for slot in slots) for field in selected}
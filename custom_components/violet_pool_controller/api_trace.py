@@ -0,0 +1,239 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Trace of the last controller requests of one device.
+
+The windowed API metrics only count requests, the control client logs its
+commands at info/debug level and a poll only logs totals, so a slow call made
+by an automation could not be pinned down without enabling debug logging for
+the whole integration. ``ApiTrace`` keeps the last ``size`` calls in a bounded
+deque, each with
+
+* the wall-clock time the call finished,
+* the endpoint and HTTP method,
+* a fingerprint of the parameters (see ``fingerprint``),
+* the outcome: ``ok``, ``cancelled`` or the name of the exception raised,
+* the approximate response size (see api_metrics.payload_size),
+* the duration in milliseconds,
+* the failed poll streak: how many polls failed in a row before a poll
+  request. The API package's own retries are not visible here.
+
+The API package only hands back the decoded payload, so the HTTP status code
+itself is not available; a non-2xx answer surfaces as the exception it raises.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from typing import Any, TypeVar
+
+from .api_metrics import payload_size
+
+_T = TypeVar("_T")
+
+STATUS_OK = "ok"
+STATUS_CANCELLED = "cancelled"
+
+# time, endpoint, method, params fingerprint, status, bytes, duration (ms),
+# failed poll streak
+TraceRecord = tuple[float, str, str, str, str, int, float, int]
+
+
+def fingerprint(params: Any) -> str:
+    """Return a short digest of request parameters, "" without parameters.
+
+    The values are hashed rather than stored, so a setConfig body stays out of
+    the trace while identical calls still share a fingerprint. Mappings and
+    key lists are sorted first, so the order they were built in does not
+    matter.
+    """
+    if params is None or (isinstance(params, (str, Mapping, list, tuple, set)) and not params):
+        return ""
+    if isinstance(params, Mapping):
+        text = repr(sorted((str(key), str(value)) for key, value in params.items()))
+    elif isinstance(params, (list, tuple, set)):
+        text = repr(sorted(str(value) for value in params))
+    else:
+        text = str(params)
+    return hashlib.blake2s(text.encode("utf-8"), digest_size=4).hexdigest()
+
+
+class ApiTrace:
+    """Bounded trace of the most recent controller requests."""
+
+    def __init__(self, size: int, *, clock: Callable[[], float] = time.time) -> None:
+        """Initialize an empty trace.
+
+        Args:
+            size: Number of calls kept before the oldest is dropped.
+            clock: Wall-clock time source, replaceable in tests.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._calls: deque[TraceRecord] = deque(maxlen=size)
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def size(self) -> int:
+        """Return the number of calls the trace keeps."""
+        return self._calls.maxlen or 0
+
+    @property
+    def last_size(self) -> int:
+        """Return the response size of the newest call, 0 without calls.
+
+        Read right after ``call`` returns, this is the size of that call's
+        response: the caller resumes without yielding to other requests.
+        """
+        return self._calls[-1][5] if self._calls else 0
+
+    def record(
+        self,
+        endpoint: str,
+        method: str,
+        params: Any,
+        status: str,
+        size: int,
+        duration: float,
+        failed_poll_streak: int = 0,
+    ) -> None:
+        """Append one finished call.
+
+        Args:
+            endpoint: Controller endpoint, e.g. ``/getReadings``.
+            method: HTTP method.
+            params: Query or body parameters; only their fingerprint is kept.
+            status: Outcome of the call (``ok`` or the exception name).
+            size: Approximate response size in bytes.
+            duration: Duration of the call in seconds.
+            failed_poll_streak: Polls that failed in a row before this
+                request (0 outside the poll).
+        """
+        self._calls.append(
+            (
+                self._clock(),
+                endpoint,
+                method,
+                fingerprint(params),
+                status,
+                size,
+                duration * 1000,
+                failed_poll_streak,
+            )
+        )
+
+    async def call(
+        self,
+        request: Awaitable[_T],
+        endpoint: str,
+        method: str = "GET",
+        params: Any = None,
+        failed_poll_streak: int = 0,
+    ) -> _T:
+        """Await ``request`` and record it; exceptions are recorded and re-raised."""
+        started = time.perf_counter()
+        try:
+            result = await request
+        except asyncio.CancelledError:
+            self.record(
+                endpoint,
+                method,
+                params,
+                STATUS_CANCELLED,
+                0,
+                time.perf_counter() - started,
+                failed_poll_streak,
+            )
+            raise
+        except Exception as err:
+            self.record(
+                endpoint,
+                method,
+                params,
+                type(err).__name__,
+                0,
+                time.perf_counter() - started,
+                failed_poll_streak,
+            )
+            raise
+        self.record(
+            endpoint,
+            method,
+            params,
+            STATUS_OK,
+            payload_size(result),
+            time.perf_counter() - started,
+            failed_poll_streak,
+        )
+        return result
+
+    def entries(self, limit: int | None = None, endpoint: str | None = None) -> list[dict]:
+        """Return the traced calls from oldest to newest.
+
+        Args:
+            limit: Return only the newest ``limit`` calls.
+            endpoint: Only return calls whose endpoint contains this text.
+        """
+        calls = list(self._calls)
+        if endpoint:
+            calls = [call for call in calls if endpoint in call[1]]
+        if limit is not None:
+            calls = calls[-limit:] if limit > 0 else []
+        return [
+            {
+                "time": datetime.fromtimestamp(finished).isoformat(timespec="milliseconds"),
+                "endpoint": name,
+                "method": method,
+                "params": params,
+                "status": status,
+                "bytes": size,
+                "duration_ms": round(duration_ms, 1),
+                "failed_poll_streak": failed_poll_streak,
+            }
+            for finished, name, method, params, status, size, duration_ms, failed_poll_streak in calls
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """Return the call count, failures and duration statistics per endpoint."""
+        endpoints: dict[str, dict[str, Any]] = {}
+        failures = 0
+        for _, name, _, _, status, _, duration_ms, _ in self._calls:
+            stats = endpoints.setdefault(
+                name, {"calls": 0, "failures": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["calls"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            if status != STATUS_OK:
+                stats["failures"] += 1
+                failures += 1
+        return {
+            "calls": len(self._calls),
+            "size": self.size,
+            "failures": failures,
+            "endpoints": {
+                name: {
+                    "calls": stats["calls"],
+                    "failures": stats["failures"],
+                    "mean_ms": round(stats["total_ms"] / stats["calls"], 1),
+                    "max_ms": round(stats["max_ms"], 1),
+                }
+                for name, stats in sorted(endpoints.items())
+            },
+        }
+
+    def clear(self) -> None:
+        """Drop all traced calls."""
+        self._calls.clear()
@@ -27,13 +27,15 @@ from .entity import VioletPoolControllerEntity, interpret_state_as_bool
 from .entity_cleanup import track_provided_entities
 from .entity_names import EntityNameResolver
 from .entity_selection import async_get_selection
+from .key_index import classify_key
 
 _LOGGER = logging.getLogger(__name__)
 
 # Coordinator-based platforms; HA should not throttle entity state writes
 PARALLEL_UPDATES = 0
 
-# Feature mapping for binary sensors
+# Feature mapping for binary sensors; keys not listed fall back to the key
+# classification (see key_index.classify_key).
 BINARY_SENSOR_FEATURE_MAP = {
     "PUMP": "filter_control",
     "HEATER": "heating",
@@ -55,6 +57,8 @@ class VioletBinarySensor(VioletPoolControllerEntity, BinarySensorEntity):
     """Representation of a Violet Pool binary sensor."""
 
     entity_description: BinarySensorEntityDescription
+    # Named through EntityNameResolver in async_setup_entry.
+    _follow_hardware_name = True
 
     def __init__(
         self,
@@ -77,6 +81,10 @@ class VioletBinarySensor(VioletPoolControllerEntity, BinarySensorEntity):
             self._attr_unique_id,
         )
 
+    def _data_dependencies(self, entity_description) -> frozenset[str] | None:
+        """Subscribe to the sensor's own key only."""
+        return frozenset({entity_description.key})
+
     @property
     def is_on(self) -> bool | None:
         """
@@ -121,8 +129,7 @@ class VioletBinarySensor(VioletPoolControllerEntity, BinarySensorEntity):
         raw_state = self.get_value(key)
         return interpret_state_as_bool(raw_state, key)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """
         Return additional state attributes for debugging.
 
@@ -233,7 +240,10 @@ async def async_setup_entry(
             ),
         )
 
-        feature_id = BINARY_SENSOR_FEATURE_MAP.get(description.key)
+        if description.key in BINARY_SENSOR_FEATURE_MAP:
+            feature_id = BINARY_SENSOR_FEATURE_MAP[description.key]
+        else:
+            feature_id = classify_key(description.key).feature
 
         # Check if feature is active (if feature_id is specified)
         if feature_id and feature_id not in active_features:
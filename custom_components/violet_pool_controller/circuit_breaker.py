@@ -0,0 +1,168 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Circuit breaker for the controller API.
+
+A controller that is switched off or unplugged used to cost two to three
+timeouts per poll. The breaker counts failed polls and moves between three
+states:
+
+* ``closed`` - requests go out as usual,
+* ``open`` - requests are refused without touching the network until the
+  recovery timeout has passed,
+* ``half_open`` - one cheap probe request decides whether the breaker closes
+  again or re-opens with a doubled timeout.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .const import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_MAX_RECOVERY_TIMEOUT,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+)
+from .error_handler import CircuitBreakerError
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+CIRCUIT_STATES = (STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by request outcomes."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+        max_recovery_timeout: float = CIRCUIT_BREAKER_MAX_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            name: Name used in log messages.
+            failure_threshold: Consecutive failures that open the breaker.
+            recovery_timeout: Seconds the breaker stays open the first time.
+            max_recovery_timeout: Upper bound for the doubled timeout.
+            clock: Monotonic time source, replaceable in tests.
+        """
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._max_recovery_timeout = max_recovery_timeout
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._failure_count = 0
+        # Consecutive failed probes; doubles the open period each time.
+        self._reopen_count = 0
+        self._opened_at: float | None = None
+        self._retry_at: float | None = None
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Return the current state, moving from open to half-open when due."""
+        if (
+            self._state == STATE_OPEN
+            and self._retry_at is not None
+            and self._clock() >= self._retry_at
+        ):
+            self._state = STATE_HALF_OPEN
+            _LOGGER.debug("Circuit for '%s' half-open, probing", self._name)
+        return self._state
+
+    @property
+    def failure_count(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failure_count
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe, 0 unless open."""
+        if self.state != STATE_OPEN or self._retry_at is None:
+            return 0.0
+        return max(0.0, self._retry_at - self._clock())
+
+    def before_request(self) -> None:
+        """Check that a request may go out.
+
+        Raises:
+            CircuitBreakerError: If the breaker is open.
+        """
+        if self.state == STATE_OPEN:
+            self._rejected += 1
+            raise CircuitBreakerError(
+                f"Circuit for '{self._name}' is open, next probe in {self.retry_in:.0f}s",
+                state=STATE_OPEN,
+                failure_count=self._failure_count,
+            )
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        if self._state != STATE_CLOSED:
+            _LOGGER.info(
+                "Circuit for '%s' closed after %d failures", self._name, self._failure_count
+            )
+        self._state = STATE_CLOSED
+        self._failure_count = 0
+        self._reopen_count = 0
+        self._opened_at = None
+        self._retry_at = None
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        """Count a failed request and open the breaker when due.
+
+        Args:
+            retry_after: Retry delay suggested by the error classification;
+                the breaker never probes sooner than this.
+        """
+        self._failure_count += 1
+        if self.state == STATE_HALF_OPEN:
+            self._reopen_count += 1
+        elif self._failure_count < self._failure_threshold:
+            return
+
+        timeout = min(
+            self._recovery_timeout * 2**self._reopen_count, self._max_recovery_timeout
+        )
+        if retry_after is not None:
+            timeout = max(timeout, retry_after)
+        now = self._clock()
+        if self._state == STATE_CLOSED:
+            self._opened_at = now
+            _LOGGER.warning(
+                "Circuit for '%s' opened after %d failures, next probe in %.0fs",
+                self._name,
+                self._failure_count,
+                timeout,
+            )
+        self._state = STATE_OPEN
+        self._retry_at = now + timeout
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "failure_count": self._failure_count,
+            "reopen_count": self._reopen_count,
+            "retry_in_seconds": round(self.retry_in, 1),
+            "open_for_seconds": (
+                round(self._clock() - self._opened_at, 1) if self._opened_at is not None else 0.0
+            ),
+            "rejected_requests": self._rejected,
+        }
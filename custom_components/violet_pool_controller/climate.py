@@ -106,6 +106,24 @@ def _get_setpoint_fields_for_climate_type(climate_type: str) -> list[str]:
     return ["SOLAR_TARGET_TEMP", "solar_target_temp", "SOLAR_maxtemp"]
 
 
+def _get_config_key_for_climate_type(climate_type: str) -> str:
+    """Get the getConfig key a climate type's target temperature is written to.
+
+    Args:
+        climate_type: "HEATER" or "SOLAR"
+
+    Returns:
+        The config key (e.g., "HEATER_set_temp" for HEATER)
+    """
+    target_key = f"{climate_type.lower()}_target_temp"
+    for definition in SETPOINT_DEFINITIONS:
+        if definition.get("key") == target_key and definition.get("config_key"):
+            return cast(str, definition["config_key"])
+
+    # Fallback if definition not found (should not happen in normal operation)
+    return "HEATER_set_temp" if climate_type == "HEATER" else "SOLAR_maxtemp"
+
+
 WATER_TEMP_SENSORS = [
     "onewire1_value",
     "water_temp",
@@ -141,6 +159,8 @@ class VioletClimateEntity(VioletPoolControllerEntity, ClimateEntity):
     _attr_min_temp = DEFAULT_MIN_TEMP
     _attr_max_temp = DEFAULT_MAX_TEMP
     _attr_target_temperature_step = TEMP_STEP
+    # Named through EntityNameResolver in __init__.
+    _follow_hardware_name = True
 
     def __init__(
         self,
@@ -302,8 +322,7 @@ class VioletClimateEntity(VioletPoolControllerEntity, ClimateEntity):
         """Return target temperature."""
         return self._get_target_temperature()
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         if self.coordinator.data is None:
             return {
@@ -349,7 +368,10 @@ class VioletClimateEntity(VioletPoolControllerEntity, ClimateEntity):
                 temperature,
             )
 
-            result = await self.device.api.set_device_temperature(self.climate_type, temperature)
+            # Batched with other setpoint writes into one setConfig call.
+            result = await self.device.async_set_config(
+                {_get_config_key_for_climate_type(self.climate_type): temperature}
+            )
 
             if result.get("success") is True:
                 _LOGGER.debug("Temperature set successfully: %s", result)
@@ -422,6 +444,7 @@ class VioletClimateEntity(VioletPoolControllerEntity, ClimateEntity):
                 self._optimistic_hvac_mode = hvac_mode
                 self._attr_hvac_mode = hvac_mode
                 self.async_write_ha_state()
+                self.device.request_runtimes_refresh()
 
                 _LOGGER.debug(
                     "Optimistic update: %s (local cache, coordinator.data not mutated)",
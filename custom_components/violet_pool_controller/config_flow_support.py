@@ -31,6 +31,7 @@ from .const import (
     CONF_ADAPTIVE_POLLING,
     CONF_ALLOW_UNSAFE_SWITCHES,
     CONF_API_URL,
+    CONF_CONCURRENT_FETCH,
     CONF_CONTROLLER_NAME,
     CONF_DEVICE_ID,
     CONF_DEVICE_NAME,
@@ -50,6 +51,7 @@ from .const import (
     CONF_VERIFY_SSL,
     DEFAULT_ADAPTIVE_POLLING,
     DEFAULT_ALLOW_UNSAFE_SWITCHES,
+    DEFAULT_CONCURRENT_FETCH,
     DEFAULT_CONTROLLER_NAME,
     DEFAULT_DISINFECTION_METHOD,
     DEFAULT_GROUP_ENTITIES,
@@ -468,6 +470,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
                     ),
                 ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
+                vol.Optional(
+                    CONF_CONCURRENT_FETCH,
+                    default=self.current_config.get(
+                        CONF_CONCURRENT_FETCH, DEFAULT_CONCURRENT_FETCH
+                    ),
+                ): selector.BooleanSelector(selector.BooleanSelectorConfig()),
                 vol.Optional(
                     CONF_TIMEOUT_DURATION,
                     default=self.current_config.get(
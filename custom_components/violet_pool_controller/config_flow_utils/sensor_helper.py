@@ -34,7 +34,7 @@ from ..const import (
     DEFAULT_TIMEOUT_DURATION,
     DEFAULT_VERIFY_SSL,
 )
-from ..feature_keys import is_key_feature_active
+from ..key_index import classify_key
 from ..sensor_modules.base import romcode_key_rank, romcode_sensor_index
 from .validators import validate_credentials_strength
 
@@ -61,8 +61,10 @@ def group_sensor_keys(
 
     grouped: dict[str, list[str]] = {}
     for key in sorted(offered):
-        if features is not None and not is_key_feature_active(key, features):
-            continue
+        if features is not None:
+            feature_id = classify_key(key).feature
+            if feature_id is not None and feature_id not in features:
+                continue
         # Simple grouping by prefix
         group = key.split("_")[0]
         grouped.setdefault(group, []).append(key)
@@ -0,0 +1,137 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Batching of setConfig writes to the controller.
+
+An automation that sets the pH, ORP and heater targets at once, or a slider
+being dragged, used to send one setConfig request per change. Writes that
+arrive within ``window`` seconds of each other are merged into one request
+(the last value per key wins), and every caller awaits the result of the
+request its values went out with.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Coroutine, Mapping
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConfigWriteBatcher:
+    """Merges setConfig writes issued close together into one request."""
+
+    def __init__(
+        self,
+        send: Callable[[dict[str, Any]], Awaitable[Any]],
+        window: float,
+        *,
+        on_written: Callable[[dict[str, Any]], None] | None = None,
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task[None]] | None = None,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            send: Issues one setConfig request with the merged updates.
+            window: Seconds to wait for further writes after the first one.
+            on_written: Called with the merged updates after a successful
+                request.
+            create_task: Starts the task that sends a batch, e.g. as a
+                background task of the config entry so unloading it cancels
+                the batch. Defaults to a plain task on the running loop.
+        """
+        self._send = send
+        self._window = window
+        self._on_written = on_written
+        self._create_task = create_task
+        self._pending: dict[str, Any] = {}
+        self._waiters: list[asyncio.Future[Any]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        # Batches go out one after the other, in the order they were opened.
+        self._send_lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> dict[str, Any]:
+        """Return the updates waiting for the next request."""
+        return dict(self._pending)
+
+    async def write(self, updates: Mapping[str, Any]) -> Any:
+        """Queue ``updates`` and return the result of the request they went out with.
+
+        Raises:
+            Exception: Whatever the merged request raised.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.update(updates)
+        self._waiters.append(future)
+        if self._flush_task is None:
+            flush = self._flush_after_window()
+            task = self._create_task(flush) if self._create_task else loop.create_task(flush)
+            task.add_done_callback(self._flush_done)
+            self._flush_task = task
+        return await future
+
+    def _flush_done(self, task: asyncio.Task[None]) -> None:
+        """Release the open batch if its task ended before the window closed.
+
+        A task cancelled before it started never runs its cleanup, so its
+        callers are cancelled here and the next write opens a new batch.
+        """
+        if self._flush_task is not task:
+            return
+        waiters = self._waiters
+        self._pending, self._waiters = {}, []
+        self._flush_task = None
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.cancel()
+
+    async def _flush_after_window(self) -> None:
+        """Wait for the window to close and send the merged batch.
+
+        The batch's callers are always released: with the request's result,
+        with its exception, or cancelled when the task is cancelled before
+        the request completed.
+        """
+        # write() keeps adding to the open batch until the window closes.
+        updates, waiters = self._pending, self._waiters
+        result: Any = None
+        error: Exception | None = None
+        sent = False
+        try:
+            await asyncio.sleep(self._window)
+            self._pending, self._waiters = {}, []
+            self._flush_task = None
+
+            async with self._send_lock:
+                if len(waiters) > 1:
+                    _LOGGER.debug(
+                        "Merged %d setConfig writes into one request: %s",
+                        len(waiters),
+                        list(updates),
+                    )
+                try:
+                    result = await self._send(updates)
+                except Exception as err:  # noqa: BLE001
+                    error = err
+                sent = True
+
+            if error is None and result and self._on_written is not None:
+                self._on_written(updates)
+        finally:
+            for waiter in waiters:
+                if waiter.done():
+                    continue
+                if not sent:
+                    waiter.cancel()
+                elif error is not None:
+                    waiter.set_exception(error)
+                else:
+                    waiter.set_result(result)
@@ -93,6 +93,10 @@ CONF_GROUP_ENTITIES = "group_entities"
 CONF_ALLOW_UNSAFE_SWITCHES = "allow_unsafe_switches"
 # Slow the polling down while the pool equipment is idle (see device.py).
 CONF_ADAPTIVE_POLLING = "adaptive_polling"
+# Issue getReadings, getOutputRuntimes and getConfig in parallel within a poll
+# (see device.py). Can be turned off for firmware that chokes on parallel
+# connections.
+CONF_CONCURRENT_FETCH = "concurrent_fetch"
 
 # ACTION_* constants come from violet_poolcontroller_api.const_api (wildcard
 # import above) - do not redefine them here, local copies drift from the API.
@@ -111,6 +115,59 @@ FIRMWARE_VERSION_REFRESH_POLLS = 360
 # A write from Home Assistant refreshes them on the next poll regardless
 # (see VioletPoolControllerDevice.request_config_refresh).
 CONFIG_REFRESH_INTERVAL = 60
+# setConfig writes issued within this many seconds of each other are sent as
+# one request (see config_writer.ConfigWriteBatcher).
+CONFIG_WRITE_BATCH_WINDOW = 0.25
+# Seconds after a setpoint write before only the written keys are read back
+# via getConfig to confirm them (see
+# VioletPoolDataUpdateCoordinator.update_setpoint_cache).
+CONFIG_CONFIRM_DELAY = 1.0
+# How often (in seconds) getOutputRuntimes is re-read while every output in
+# ADAPTIVE_ACTIVITY_KEYS is off. The runtime counters only advance while an
+# output runs, so they are re-read on every poll while one is active, on this
+# timer otherwise, and right after a switch command from Home Assistant (see
+# VioletPoolControllerDevice.request_runtimes_refresh).
+OUTPUT_RUNTIMES_REFRESH_INTERVAL = 600
+# Polls kept in the device's poll history (see poll_history.PollHistory), and
+# how many of the most recent ones the latency average and percentiles cover
+# (360 samples = 1 hour at the default 10s polling interval).
+POLL_HISTORY_SIZE = 1000
+POLL_LATENCY_WINDOW = 360
+# Polls kept in the ring file that persists the poll history across restarts
+# (see poll_ring.PollRing); 8640 polls = 24 hours at the default 10s interval.
+POLL_RING_SIZE = 8640
+# Controller requests kept per device in the call trace (see api_trace.ApiTrace).
+API_TRACE_SIZE = 200
+# Refresh requests after a command are coalesced: requests arriving while one
+# is pending share its poll, which runs once the longest requested delay has
+# passed. A window accepts joiners for at most this many seconds after it
+# opened, so a steady stream of commands cannot postpone the poll forever.
+REFRESH_COALESCE_MAX_WAIT = 3.0
+# Windows (label -> seconds) of the sliding request/failure counters (see
+# api_metrics.WindowedCounters), and the width of one counter bucket.
+API_METRIC_WINDOWS = {"1m": 60, "5m": 300, "1h": 3600}
+API_METRIC_RESOLUTION = 5
+# Circuit breaker on the poll path (see circuit_breaker.CircuitBreaker): after
+# this many failed polls in a row the controller is left alone until the
+# recovery timeout (or the retry_after of the last error, if longer) has
+# passed. Each failed probe doubles the timeout, up to the maximum.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 30.0
+CIRCUIT_BREAKER_MAX_RECOVERY_TIMEOUT = 300.0
+# The last successful payload is persisted per entry so setup can build the
+# entities from it while the controller is slow or down (warm start, see
+# async_setup_device). It is written at most once per this many seconds.
+PAYLOAD_SAVE_INTERVAL = 300
+# The parsed hardware config (names of relays, inputs, scenes...) is persisted
+# with that payload, together with the controller and firmware it was read
+# from. A failed or outdated load is retried at most once per this many seconds.
+HARDWARE_CONFIG_RETRY_INTERVAL = 300
+# Upper bounds (ms) of the poll stage timing histograms (see
+# poll_profile.PollProfiler); slower samples land in an overflow bucket.
+POLL_PROFILE_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+# Entries of each memoized per-key classification (see key_index). A real
+# controller reports ~400 keys; the cap only matters for synthetic payloads.
+KEY_INDEX_SIZE = 8192
 DEFAULT_TIMEOUT_DURATION = 10
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_USE_SSL = False
@@ -126,6 +183,7 @@ DEFAULT_INVERT_COVER = False
 DEFAULT_GROUP_ENTITIES = True
 DEFAULT_ALLOW_UNSAFE_SWITCHES = False
 DEFAULT_ADAPTIVE_POLLING = True
+DEFAULT_CONCURRENT_FETCH = False
 
 # =============================================================================
 # SAFETY
@@ -199,6 +257,35 @@ ADAPTIVE_ACTIVITY_KEYS: tuple[str, ...] = (
 ADAPTIVE_IDLE_FACTOR = 3
 ADAPTIVE_IDLE_MAX_INTERVAL = 60
 
+# Readings whose rate of change is tracked (see poll_scheduler), with the
+# smoothed change per minute above which the reading counts as moving. While
+# one of them moves - e.g. pH still settling after a dosing run - polling stays
+# at the configured interval even with every output off.
+ADAPTIVE_TREND_THRESHOLDS: dict[str, float] = {
+    "pH_value": 0.01,
+    "orp_value": 2.0,
+    "onewire1_value": 0.05,
+}
+# Weight of the newest change in the exponentially weighted moving average.
+ADAPTIVE_TREND_SMOOTHING = 0.3
+# Monitoring states whose flip keeps polling at the configured interval for
+# ADAPTIVE_ALARM_HOLD_POLLS polls, so the follow-up is seen quickly.
+ADAPTIVE_ALARM_KEYS: tuple[str, ...] = (
+    "CIRCULATION_STATE",
+    "ELECTRODE_FLOW_STATE",
+    "PRESSURE_STATE",
+    "CAN_RANGE_STATE",
+    "OVERFLOW_OVERFILL_STATE",
+    "OVERFLOW_DRYRUN_STATE",
+)
+ADAPTIVE_ALARM_HOLD_POLLS = 3
+# After this many consecutive idle polls without moving readings or alarm
+# flips, the interval is stretched by ADAPTIVE_STABLE_FACTOR instead (up to
+# ADAPTIVE_STABLE_MAX_INTERVAL seconds).
+ADAPTIVE_STABLE_POLLS = 30
+ADAPTIVE_STABLE_FACTOR = 6
+ADAPTIVE_STABLE_MAX_INTERVAL = 120
+
 # Lowest polling interval the integration still accepts. The config flow offers
 # 10s as its minimum; this lower floor exists so entries created by older
 # versions (which allowed 5s) keep working instead of being clamped upwards.
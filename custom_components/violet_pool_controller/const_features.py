@@ -573,6 +573,8 @@ SETPOINT_DEFINITIONS = [
             "pH_target",
             "DOSAGE_phminus_setpoint",
         ],
+        # getConfig key the setpoint is written to and read back from.
+        "config_key": "DOSAGE_phminus_setpoint",
         "indicator_fields": ["pH_value", "pH_VALUE", "DOS_4_PHM", "DOS_5_PHP"],
     },
     {
@@ -597,6 +599,7 @@ SETPOINT_DEFINITIONS = [
             "ORP_target",
             "DOSAGE_chlorine_setpoint_orp",
         ],
+        "config_key": "DOSAGE_chlorine_setpoint_orp",
         # A pool that produces its chlorine in an electrolysis cell keeps the
         # setpoint in the electrolysis channel; the chlorine keys then hold an
         # unused value (see dosing_channel.py).
@@ -623,6 +626,7 @@ SETPOINT_DEFINITIONS = [
             "pot_setpoint",
             "DOSAGE_chlorine_lowerval_cl",
         ],
+        "config_key": "DOSAGE_chlorine_lowerval_cl",
         "electrolysis_key": "DOSAGE_electrolysis_setpoint_chlorine",
         "indicator_fields": ["pot_value", "POT_VALUE", "DOS_1_CL", "DOS_2_ELO"],
     },
@@ -645,6 +649,7 @@ SETPOINT_DEFINITIONS = [
             "heater_target_temp",
             "HEATER_set_temp",
         ],
+        "config_key": "HEATER_set_temp",
         "indicator_fields": ["HEATER", "onewire5_value"],
     },
     {
@@ -666,6 +671,7 @@ SETPOINT_DEFINITIONS = [
             "solar_target_temp",
             "SOLAR_maxtemp",
         ],
+        "config_key": "SOLAR_maxtemp",
         "indicator_fields": ["SOLAR", "onewire3_value"],
     },
     {
@@ -10,14 +10,14 @@
 from __future__ import annotations
 
 import asyncio
-import collections
 import logging
 import time
+from collections.abc import Awaitable, Iterable, Mapping
 from datetime import datetime, timedelta
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -26,6 +26,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from violet_poolcontroller_api.api import VioletPoolAPI, VioletPoolAPIError
 
@@ -37,25 +38,23 @@ except ImportError:
         """Compatibility fallback for older violet-poolcontroller-api releases."""
 
 
-try:
-    from violet_poolcontroller_api.readings import VioletReadings
-except ImportError:
-
-    class VioletReadings(dict):  # type: ignore[no-redef]
-        """Compatibility fallback for older violet-poolcontroller-api releases."""
-
-
+from .api_metrics import WindowedCounters
+from .api_trace import ApiTrace
+from .circuit_breaker import STATE_HALF_OPEN, CircuitBreaker
 from .config_entry_helpers import (
     extract_api_host,
     get_entry_value,
     with_non_default_port,
 )
 from .config_flow_utils.constants import MAX_POLLING_INTERVAL
+from .config_writer import ConfigWriteBatcher
 from .const import (
     ADAPTIVE_ACTIVITY_KEYS,
-    ADAPTIVE_IDLE_FACTOR,
-    ADAPTIVE_IDLE_MAX_INTERVAL,
+    API_METRIC_RESOLUTION,
+    API_METRIC_WINDOWS,
+    API_TRACE_SIZE,
     CONF_ADAPTIVE_POLLING,
+    CONF_CONCURRENT_FETCH,
     CONF_CONTROLLER_NAME,
     CONF_DEVICE_ID,
     CONF_DEVICE_NAME,
@@ -67,8 +66,11 @@ from .const import (
     CONF_USE_SSL,
     CONF_USERNAME,
     CONF_VERIFY_SSL,
+    CONFIG_CONFIRM_DELAY,
     CONFIG_REFRESH_INTERVAL,
+    CONFIG_WRITE_BATCH_WINDOW,
     DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CONCURRENT_FETCH,
     DEFAULT_CONTROLLER_NAME,
     DEFAULT_POLLING_INTERVAL,
     DEFAULT_PORT,
@@ -78,13 +80,43 @@ from .const import (
     DEFAULT_VERIFY_SSL,
     DOMAIN,
     FIRMWARE_VERSION_REFRESH_POLLS,
+    HARDWARE_CONFIG_RETRY_INTERVAL,
     MIN_SUPPORTED_POLLING_INTERVAL,
+    OUTPUT_RUNTIMES_REFRESH_INTERVAL,
+    PAYLOAD_SAVE_INTERVAL,
+    POLL_HISTORY_SIZE,
+    POLL_LATENCY_WINDOW,
+    POLL_RING_SIZE,
+    REFRESH_COALESCE_MAX_WAIT,
+)
+from .entity_profile import EntityProfiler
+from .error_handler import (
+    CircuitBreakerError,
+    EnhancedErrorHandler,
+    ErrorSeverity,
+    ErrorType,
+    IntegrationError,
 )
+from .hardware_config import HardwareConfig
+from .http_control import VioletControlClient
+from .poll_history import PollHistory
+from .poll_profile import PollProfiler
+from .poll_ring import PollRing
+from .poll_scheduler import AdaptivePollScheduler
+from .readings_snapshot import EMPTY_SNAPSHOT, ReadingsSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
 FAILURE_LOG_INTERVAL = 300  # Log repeated failures at most every 5 minutes
 
+# Counters of the sliding API metrics (see api_metrics_summary).
+API_METRIC_FIELDS = ("requests", "failures", "bytes", "repeated_polls")
+
+# hass.storage version of the persisted last payload (see restore_payload).
+PAYLOAD_STORAGE_VERSION = 1
+
+_T = TypeVar("_T")
+
 
 def _clamp_polling_interval(seconds: Any) -> int:
     """Return a polling interval inside the supported range.
@@ -99,6 +131,109 @@ def _clamp_polling_interval(seconds: Any) -> int:
     return max(MIN_SUPPORTED_POLLING_INTERVAL, min(MAX_POLLING_INTERVAL, value))
 
 
+async def _gather_settled(*aws: Any) -> list[Any]:
+    """Await all awaitables together and raise the first error afterwards.
+
+    Unlike a plain ``asyncio.gather`` this lets every request settle before an
+    error propagates, so no request keeps running outside the API lock.
+    """
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _outputs_active(data: dict[str, Any]) -> bool:
+    """Return True if any pool output in ``data`` is currently running.
+
+    Values arrive as ints, numeric strings or composite strings such as
+    ``"3|PUMP_ANTI_FREEZE"``, so they are interpreted with the same helper
+    the switch entities use instead of being compared numerically.
+    """
+    from .entity import interpret_state_as_bool
+
+    return any(interpret_state_as_bool(data.get(key), key) for key in ADAPTIVE_ACTIVITY_KEYS)
+
+
+# Optional hardware modules and the key prefix their readings share.
+MODULE_KEY_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("DOSING", "DOS_"),
+    ("EXT1", "EXT1_"),
+    ("EXT2", "EXT2_"),
+    ("DMX", "DMX_"),
+    ("DIRULE", "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_"),
+)
+# The first four characters tell the module prefixes apart, so a key is
+# classified with one dict lookup instead of a startswith() per module.
+_MODULE_PREFIX_HEADS: dict[str, tuple[str, str]] = {
+    prefix[:4]: (tag, prefix) for tag, prefix in MODULE_KEY_PREFIXES
+}
+
+
+def _is_valid_value(value: Any) -> bool:
+    """Return True if a reading carries a real value (not missing or N/A)."""
+    return value is not None and str(value).strip().upper() != "N/A"
+
+
+def _is_alive_count(value: Any) -> bool:
+    """Return True if a module alive counter is a positive number."""
+    if value is None:
+        return False
+    try:
+        return float(str(value).strip()) > 0
+    except (ValueError, TypeError):
+        return False
+
+
+def _classify_module_keys(data: dict[str, Any]) -> tuple[dict[str, list[str]], set[str]]:
+    """Bucket the optional-module keys of a payload in a single pass.
+
+    Args:
+        data: The merged controller payload.
+
+    Returns:
+        The keys of each module (by tag from MODULE_KEY_PREFIXES) and the
+        tags of the modules that reported at least one valid value.
+    """
+    buckets: dict[str, list[str]] = {tag: [] for tag, _prefix in MODULE_KEY_PREFIXES}
+    present: set[str] = set()
+    heads = _MODULE_PREFIX_HEADS
+    for key, value in data.items():
+        # All module prefixes start with D or E; most keys are rejected here.
+        if key[:1] not in "DE":
+            continue
+        match = heads.get(key[:4])
+        if match is None:
+            continue
+        tag, prefix = match
+        if not key.startswith(prefix):
+            continue
+        buckets[tag].append(key)
+        if tag not in present and _is_valid_value(value):
+            present.add(tag)
+    return buckets, present
+
+
+_MISSING = object()
+
+
+def _changed_keys(previous: Mapping[str, Any] | None, current: Mapping[str, Any]) -> set[str]:
+    """Return the keys whose value differs between two polls.
+
+    Keys that disappeared from the payload count as changed too, so entities
+    bound to them pick up the missing value.
+    """
+    if previous is current:
+        # A failed poll hands back the previous snapshot unchanged.
+        return set()
+    if not previous:
+        return set(current)
+    changed = {key for key, value in current.items() if previous.get(key, _MISSING) != value}
+    changed.update(key for key in previous if key not in current)
+    return changed
+
+
 POLL_SNAPSHOT_FIELDS = (
     "Pool Temp",
     "Redox",
@@ -120,7 +255,8 @@ class VioletPoolControllerDevice:
         self.api = api
         self._available = False
         self._session = async_get_clientsession(hass)
-        self._data: dict[str, Any] = {}
+        # The frozen snapshot of the last successful poll (see ReadingsSnapshot).
+        self._data: Mapping[str, Any] = EMPTY_SNAPSHOT
         self._firmware_version: str | None = None
         self._last_error: str | None = None
         self._api_lock = asyncio.Lock()
@@ -136,11 +272,33 @@ class VioletPoolControllerDevice:
         self._config_cache: dict[str, Any] = {}
         self._last_config_fetch = 0.0
         self._force_config_fetch = False
-        # Store poll snapshots as fixed-position tuples to reduce per-entry overhead.
-        self._poll_history: collections.deque[tuple[datetime, int, float, tuple[Any, ...]]] = (
-            collections.deque(maxlen=1000)
+        # setConfig writes are merged per short window (see async_set_config).
+        self._config_writer = ConfigWriteBatcher(
+            self._send_config,
+            CONFIG_WRITE_BATCH_WINDOW,
+            on_written=self._on_config_written,
+            # Unloading the entry cancels a batch that is still open.
+            create_task=lambda flush: config_entry.async_create_background_task(
+                hass, flush, f"{config_entry.title} config write"
+            ),
+        )
+        # Same idea for getOutputRuntimes: the counters only move while an
+        # output runs (see _output_runtimes_fetch_due).
+        self._runtimes_cache: dict[str, Any] = {}
+        self._last_runtimes_fetch: float | None = None
+        self._force_runtimes_fetch = False
+        # Columnar ring buffer of recent polls; also backs the latency statistics.
+        self._poll_history = PollHistory(
+            POLL_HISTORY_SIZE, POLL_SNAPSHOT_FIELDS, latency_window=POLL_LATENCY_WINDOW
         )
         self._first_poll: datetime | None = None
+        # The same samples, persisted across restarts (see async_open_poll_ring).
+        self._poll_ring: PollRing | None = None
+        # Appends still queued in the executor; closing the ring waits for them.
+        self._poll_ring_appends: set[asyncio.Future[None]] = set()
+        # Per-stage timing histograms of the poll cycle; the coordinator
+        # records its dispatch here too.
+        self._profiler = PollProfiler()
 
         self._last_failure_log = 0.0  # Timestamp for throttling
         self._first_failure_logged = False  # Flag for first warning
@@ -159,16 +317,41 @@ class VioletPoolControllerDevice:
         # would disappear from coordinator.data and switch entities would silently
         # revert to OFF even though the relay board is physically present.
         self._hw_detected: set[str] = set()
+        # Module keys of the previous payload (see _classify_module_keys), so a
+        # module that drops out can be restored without rescanning _data.
+        self._module_key_index: dict[str, list[str]] = {}
+        # device_info of the current snapshot (see device_info): the snapshot
+        # it was built from, (firmware, controller name), and the info itself.
+        self._device_info_cache: (
+            tuple[Mapping[str, Any], tuple[Any, ...], DeviceInfo] | None
+        ) = None
 
         # ✅ DIAGNOSTIC SENSORS: Advanced metrics
         self._api_request_count = 0  # Total API requests
         self._api_request_start_time = time.monotonic()  # For rate calculation
-        # 360 samples = 1 hour of history (at default 10s polling interval)
-        self._latency_history: collections.deque[float] = collections.deque(maxlen=360)
+        # Requests, failures, payload bytes and polls repeating a failed one
+        # per time bucket
+        # (see api_metrics.WindowedCounters and api_metrics_summary).
+        self._api_metrics = WindowedCounters(
+            API_METRIC_FIELDS,
+            horizon=max(API_METRIC_WINDOWS.values()),
+            resolution=API_METRIC_RESOLUTION,
+        )
+        # The same counters since setup, for monotonic counters (see openmetrics).
+        self._api_totals = dict.fromkeys(API_METRIC_FIELDS, 0)
+        # The last API_TRACE_SIZE requests one by one (see api_trace.ApiTrace).
+        self._api_trace = ApiTrace(API_TRACE_SIZE)
 
         # ✅ HARDWARE CONFIGURATION: Cache all hardware configs (DI, relays, scenes, etc.)
         self._hardware_config: dict[str, Any] | None = None
         self._hardware_config_loaded = False
+        # The getConfig response the parsed config was built from, the
+        # controller/firmware it was read from, and a counter bumped whenever
+        # it changes (entities compare it to pick up renamed outputs).
+        self._hardware_config_raw: dict[str, Any] | None = None
+        self._hardware_config_identity: dict[str, Any] | None = None
+        self._hardware_config_generation = 0
+        self._hardware_config_attempt: float | None = None
 
         entry_data = config_entry.data
         self.api_url = with_non_default_port(
@@ -192,6 +375,16 @@ class VioletPoolControllerDevice:
             self.use_ssl,
             self.device_id,
         )
+        # Stops polling a dead controller until a probe succeeds (see
+        # circuit_breaker.CircuitBreaker). The error handler keeps this
+        # entry's error history and supplies the retry_after of each failure.
+        self._circuit = CircuitBreaker(self.device_name)
+        self._error_handler = EnhancedErrorHandler()
+        # Persisted last payload for the warm start (see restore_payload).
+        # True while _data still comes from it and no live poll succeeded.
+        self._payload_store: Store[dict[str, Any]] | None = None
+        self._last_payload_save: float | None = None
+        self._stale = False
 
     async def update_api_config(self, new_config_entry: ConfigEntry) -> bool:
         """Update API configuration dynamically without full reload.
@@ -321,7 +514,7 @@ class VioletPoolControllerDevice:
             return True
         return False
 
-    async def _fetch_controller_data(self) -> dict[str, Any]:
+    async def _fetch_controller_data(self) -> ReadingsSnapshot:
         """Fetch all controller data.
 
         Always uses full refresh (?ALL) because the controller returns all
@@ -334,98 +527,98 @@ class VioletPoolControllerDevice:
         which is reliable because the API filter only removes keys whose
         module is absent.
         """
-        _readings = await self.api.get_readings()
-        data: dict[str, Any] = dict(_readings) if _readings is not None else {}
-
-        try:
-            runtimes = await self.api.get_output_runtimes()
-            if runtimes:
-                for key, value in runtimes.items():
-                    if key not in data:
-                        data[key] = value
-        except Exception as err:  # noqa: BLE001
-            _LOGGER.debug(
-                "Optional getOutputRuntimes fetch failed for '%s': %s",
-                self.device_name,
-                err,
+        if self.concurrent_fetch:
+            _readings, runtimes = await _gather_settled(
+                self._api_call(self.api.get_readings(), "http_readings", endpoint="/getReadings"),
+                self._fetch_output_runtimes(),
             )
-
+        else:
+            _readings = await self._api_call(
+                self.api.get_readings(), "http_readings", endpoint="/getReadings"
+            )
+            runtimes = await self._fetch_output_runtimes()
+        started = time.perf_counter()
+        # The one allocation of the poll: the snapshot is filled in place and
+        # frozen in async_update once the config values are merged.
+        data = ReadingsSnapshot(_readings) if _readings is not None else ReadingsSnapshot()
+
+        # Readings win: runtimes only fill in keys getReadings did not return.
+        for key, value in runtimes.items():
+            if key not in data:
+                data[key] = value
+        self._profiler.record("snapshot", time.perf_counter() - started)
+
+        started = time.perf_counter()
         if data and isinstance(data, dict):
-
-            def is_valid(val: Any) -> bool:
-                return val is not None and str(val).strip().upper() != "N/A"
-
-            def is_alive_count(key: str) -> bool:
-                val = data.get(key)
-                if val is None:
-                    return False
-                try:
-                    return float(str(val).strip()) > 0
-                except (ValueError, TypeError):
-                    return False
+            # One pass buckets every optional-module key and notes which
+            # modules reported at least one real value.
+            module_keys, modules_now = _classify_module_keys(data)
 
             # --- Dosing module ---
-            has_dosing_now = is_valid(data.get("SYSTEM_dosagemodule_cpu_temperature")) or any(
-                k.startswith("DOS_") and is_valid(v) for k, v in data.items()
+            has_dosing_now = "DOSING" in modules_now or _is_valid_value(
+                data.get("SYSTEM_dosagemodule_cpu_temperature")
             )
             if self.api.dosing_standalone or has_dosing_now:
                 self._hw_detected.add("DOSING")
             has_dosing = "DOSING" in self._hw_detected or self.api.dosing_standalone
 
-            # --- Extension module 1 ---
-            has_ext1_now = is_alive_count("SYSTEM_ext1module_alive_count") or any(
-                k.startswith("EXT1_") and is_valid(v) for k, v in data.items()
+            # --- Extension modules 1 and 2 ---
+            has_ext1_now = "EXT1" in modules_now or _is_alive_count(
+                data.get("SYSTEM_ext1module_alive_count")
             )
             if has_ext1_now:
                 self._hw_detected.add("EXT1")
             has_ext1 = "EXT1" in self._hw_detected
 
-            # --- Extension module 2 ---
-            has_ext2_now = is_alive_count("SYSTEM_ext2module_alive_count") or any(
-                k.startswith("EXT2_") and is_valid(v) for k, v in data.items()
+            has_ext2_now = "EXT2" in modules_now or _is_alive_count(
+                data.get("SYSTEM_ext2module_alive_count")
             )
             if has_ext2_now:
                 self._hw_detected.add("EXT2")
             has_ext2 = "EXT2" in self._hw_detected
 
-            # --- DMX lighting module ---
-            has_dmx_now = any(k.startswith("DMX_") and is_valid(v) for k, v in data.items())
+            # --- DMX lighting module / digital input rules ---
+            has_dmx_now = "DMX" in modules_now
             if has_dmx_now:
                 self._hw_detected.add("DMX")
             has_dmx = "DMX" in self._hw_detected
 
-            # --- Digital input rules ---
-            has_dirule_now = any(
-                k.startswith("DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_") and is_valid(v)
-                for k, v in data.items()
-            )
+            has_dirule_now = "DIRULE" in modules_now
             if has_dirule_now:
                 self._hw_detected.add("DIRULE")
             has_dirule = "DIRULE" in self._hw_detected
 
             # ---- Generic key restoration for all optional modules ----
-            _optional_modules: list[tuple[str, str, bool]] = [
-                ("DOSING", "DOS_", has_dosing_now),
-                ("EXT1", "EXT1_", has_ext1_now),
-                ("EXT2", "EXT2_", has_ext2_now),
-                ("DMX", "DMX_", has_dmx_now),
-                ("DIRULE", "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_", has_dirule_now),
-            ]
-            for _tag, _prefix, _present_now in _optional_modules:
-                if _tag in self._hw_detected and not _present_now:
-                    restored = 0
-                    for prev_key, prev_val in self._data.items():
-                        if prev_key.startswith(_prefix) and prev_key not in data:
-                            data[prev_key] = prev_val
-                            restored += 1
-                    if restored:
-                        _LOGGER.debug(
-                            "%s module temporarily absent from API response; "
-                            "restored %d %s* keys from previous poll",
-                            _tag,
-                            restored,
-                            _prefix,
-                        )
+            # The index of the previous payload lists each module's keys, so
+            # restoring one module never walks the other ~400 keys.
+            present_now = {
+                "DOSING": has_dosing_now,
+                "EXT1": has_ext1_now,
+                "EXT2": has_ext2_now,
+                "DMX": has_dmx_now,
+                "DIRULE": has_dirule_now,
+            }
+            previous = self._data
+            for tag, prefix in MODULE_KEY_PREFIXES:
+                if tag not in self._hw_detected or present_now[tag]:
+                    continue
+                restored = [
+                    key
+                    for key in self._module_key_index.get(tag, ())
+                    if key in previous and key not in data
+                ]
+                for key in restored:
+                    data[key] = previous[key]
+                if restored:
+                    module_keys[tag].extend(restored)
+                    _LOGGER.debug(
+                        "%s module temporarily absent from API response; "
+                        "restored %d %s* keys from previous poll",
+                        tag,
+                        len(restored),
+                        prefix,
+                    )
+            self._module_key_index = module_keys
 
             is_standalone = self.api.dosing_standalone
 
@@ -437,7 +630,140 @@ class VioletPoolControllerDevice:
             data["HW_DIRULE_MODULE"] = has_dirule
             data["HW_STANDALONE_MODE"] = is_standalone
 
-        return cast(dict[str, Any], data)
+        self._profiler.record("detection", time.perf_counter() - started)
+        return data
+
+    def request_runtimes_refresh(self) -> None:
+        """Force the next poll to re-read the output runtimes.
+
+        Called after a switch command so the runtime of an output that was
+        just turned on or off is confirmed on the following poll instead of
+        after the idle refresh interval.
+        """
+        self._force_runtimes_fetch = True
+
+    def _output_runtimes_fetch_due(self) -> bool:
+        """Return True if getOutputRuntimes should be requested on this poll.
+
+        Activity is judged on the previous poll - the current readings may
+        still be in flight. That also captures the final counter values on
+        the first poll after the last output switched off.
+        """
+        if self._force_runtimes_fetch or self._last_runtimes_fetch is None:
+            return True
+        if _outputs_active(self._data):
+            return True
+        return (
+            time.monotonic() - self._last_runtimes_fetch
+        ) >= OUTPUT_RUNTIMES_REFRESH_INTERVAL
+
+    async def _fetch_output_runtimes(self) -> Mapping[str, Any]:
+        """Return the output runtimes, refreshing them when due.
+
+        The runtimes are optional extras on top of the readings, so a failed
+        fetch must never fail the poll - the last known values are served
+        instead. While every output is off the counters cannot move, so the
+        request is skipped on most idle polls.
+        """
+        if not self._output_runtimes_fetch_due():
+            return self._runtimes_cache
+
+        # Count failed attempts too, so a controller without the endpoint is
+        # not asked again on every idle poll.
+        self._last_runtimes_fetch = time.monotonic()
+        self._force_runtimes_fetch = False
+        try:
+            runtimes = await self._api_call(
+                self.api.get_output_runtimes(), "http_runtimes", endpoint="/getOutputRuntimes"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug(
+                "Optional getOutputRuntimes fetch failed for '%s': %s",
+                self.device_name,
+                err,
+            )
+            return self._runtimes_cache
+
+        if runtimes:
+            self._runtimes_cache = dict(runtimes)
+        return self._runtimes_cache
+
+    @property
+    def concurrent_fetch(self) -> bool:
+        """Return whether the requests of a poll are issued in parallel.
+
+        Read from the entry on every poll so toggling the option takes effect
+        without a reload.
+        """
+        return bool(
+            get_entry_value(self.config_entry, CONF_CONCURRENT_FETCH, DEFAULT_CONCURRENT_FETCH)
+        )
+
+    async def _api_call(
+        self,
+        request: Awaitable[_T],
+        stage: str | None = None,
+        *,
+        endpoint: str,
+        method: str = "GET",
+        params: Any = None,
+    ) -> _T:
+        """Await one controller request, count it and record it in the trace.
+
+        Args:
+            request: The API coroutine.
+            stage: Poll profile stage the request's duration is recorded
+                under (see poll_profile.POLL_STAGES), if any.
+            endpoint: Controller endpoint of the request, for the call trace.
+            method: HTTP method of the request.
+            params: Parameters of the request; the trace keeps a fingerprint.
+        """
+        # Failed polls since the last success; not retries of this request.
+        failed_poll_streak = self._consecutive_failures if stage is not None else 0
+        started = time.perf_counter()
+        try:
+            result = await self._api_trace.call(
+                request, endpoint, method, params, failed_poll_streak
+            )
+        except Exception:
+            self._count_api(requests=1, failures=1)
+            raise
+        finally:
+            if stage is not None:
+                self._profiler.record(stage, time.perf_counter() - started)
+        # The trace already sized the response; no await since it recorded it.
+        self._count_api(requests=1, bytes=self._api_trace.last_size)
+        return result
+
+    def _count_api(self, **amounts: int) -> None:
+        """Add to the windowed API metrics and the totals since setup."""
+        self._api_metrics.add(**amounts)
+        for field, amount in amounts.items():
+            self._api_totals[field] += amount
+
+    async def _fetch_poll_data(
+        self,
+    ) -> tuple[ReadingsSnapshot, Mapping[str, Any] | None]:
+        """Fetch the readings and, in concurrent mode, the config values too.
+
+        getReadings, getOutputRuntimes and getConfig do not depend on each
+        other, so on a slow link issuing them together saves two round trips
+        per poll. The merge order is the same in both modes - the caller
+        layers the config values on top of the readings.
+
+        Returns:
+            The readings and the config values, or None for the latter when
+            they still have to be fetched sequentially.
+        """
+        if not self.concurrent_fetch:
+            return await self._fetch_controller_data(), None
+
+        data, config_values = await _gather_settled(
+            self._fetch_controller_data(), self._fetch_config_values()
+        )
+        return data, config_values
 
     def _build_config_keys(self) -> list[str]:
         """Build the getConfig key list for the current poll cycle.
@@ -476,6 +802,61 @@ class VioletPoolControllerDevice:
         self._firmware_version_poll_counter += 1
         return keys
 
+    async def async_set_config(self, updates: Mapping[str, Any]) -> Any:
+        """Write configuration values, merged with writes issued alongside.
+
+        Writes arriving within CONFIG_WRITE_BATCH_WINDOW seconds go out as
+        one setConfig request; for a key written twice the later value wins.
+
+        Returns:
+            The API result of the request the updates were sent with.
+
+        Raises:
+            VioletPoolAPIError: If that request fails.
+        """
+        return await self._config_writer.write(updates)
+
+    async def _send_config(self, updates: dict[str, Any]) -> Any:
+        """Send one merged setConfig request."""
+        return await self._api_call(
+            self.api.set_config(updates), endpoint="/setConfig", method="POST", params=updates
+        )
+
+    def _on_config_written(self, updates: dict[str, Any]) -> None:
+        """Confirm the written values on the next poll."""
+        self.request_config_refresh()
+
+    async def async_confirm_config(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Read back only ``keys`` via getConfig and publish their values.
+
+        Confirms a setpoint write with one small request instead of waiting
+        for the next full poll. The values are merged into the config cache
+        and into a new snapshot that replaces ``data``.
+
+        Returns:
+            The confirmed values; keys the controller did not return are
+            left out.
+        """
+        wanted = sorted(set(keys))
+        async with self._api_lock:
+            values = await self._api_call(
+                self.api.get_config(wanted), endpoint="/getConfig", params=wanted
+            )
+        if not isinstance(values, dict):
+            return {}
+
+        confirmed = {key: values[key] for key in wanted if key in values}
+        if not confirmed:
+            return {}
+        self._config_cache.update(confirmed)
+        if self._data:
+            snapshot = ReadingsSnapshot(self._data)
+            snapshot.update(confirmed)
+            # A confirm read is not a poll, so it keeps the poll counter and
+            # the generation of the poll the snapshot was derived from.
+            self._data = snapshot.freeze(self._update_counter)
+        return confirmed
+
     def request_config_refresh(self) -> None:
         """Force the next poll to re-read the setpoints from the controller.
 
@@ -491,7 +872,7 @@ class VioletPoolControllerDevice:
             return True
         return (time.monotonic() - self._last_config_fetch) >= CONFIG_REFRESH_INTERVAL
 
-    async def _fetch_config_values(self) -> dict[str, Any]:
+    async def _fetch_config_values(self) -> Mapping[str, Any]:
         """Return the setpoint/firmware values, refreshing them when due.
 
         These values live behind a second HTTP request and only change when
@@ -499,12 +880,20 @@ class VioletPoolControllerDevice:
         CONFIG_REFRESH_INTERVAL seconds. In between, the previously fetched
         values are reused, which removes one request per poll cycle - at the
         default 10s interval that is five of every six requests.
+
+        The cache itself is returned; callers only read from it.
         """
         if not self._config_fetch_due():
-            return dict(self._config_cache)
+            return self._config_cache
 
         try:
-            config_data = await self.api.get_config(self._build_config_keys())
+            config_keys = self._build_config_keys()
+            config_data = await self._api_call(
+                self.api.get_config(config_keys),
+                "http_config",
+                endpoint="/getConfig",
+                params=config_keys,
+            )
         except asyncio.CancelledError:
             raise
         except Exception as err:  # noqa: BLE001
@@ -514,7 +903,7 @@ class VioletPoolControllerDevice:
                 err,
             )
             # Keep serving the last known values instead of dropping the keys.
-            return dict(self._config_cache)
+            return self._config_cache
 
         self._last_config_fetch = time.monotonic()
         self._force_config_fetch = False
@@ -523,19 +912,30 @@ class VioletPoolControllerDevice:
             # some fetches and must survive the cycles that omit it.
             self._config_cache.update(config_data)
 
-        return dict(self._config_cache)
+        return self._config_cache
 
-    async def async_update(self) -> dict[str, Any]:
-        """Fetch and return updated device data from the controller."""
+    async def async_update(self) -> Mapping[str, Any]:
+        """Fetch and return updated device data from the controller.
+
+        Returns the frozen snapshot of this poll, or the previous one when the
+        poll failed without exhausting the failure budget.
+        """
         try:
             async with self._api_lock:
+                self._circuit.before_request()
+                if self._circuit.state == STATE_HALF_OPEN:
+                    await self._probe_controller()
                 start_time = time.monotonic()
+                poll_started = time.perf_counter()
                 self._api_request_count += 1
-                data = await self._fetch_controller_data()
+                if self._consecutive_failures:
+                    # This poll repeats one that failed.
+                    self._count_api(repeated_polls=1)
+                data, config_values = await self._fetch_poll_data()
                 self._connection_latency = (time.monotonic() - start_time) * 1000
-                self._latency_history.append(self._connection_latency)
 
                 if not data or not isinstance(data, dict):
+                    self._record_failure(None)
                     self._consecutive_failures += 1
                     # Allow the recovery message/issue cleanup to fire again
                     # after this new outage
@@ -579,13 +979,17 @@ class VioletPoolControllerDevice:
                             self._max_consecutive_failures,
                         )
                     self._system_health = max(0.0, 100.0 - (self._consecutive_failures * 20.0))
-                    return dict(self._data) if self._data else {}
+                    return self._data
 
                 # Merge the config-based setpoints and the firmware version.
                 # They are re-read only every CONFIG_REFRESH_INTERVAL seconds
                 # (see _fetch_config_values) because each read is a second HTTP
                 # request and the values only change on a write.
-                data.update(await self._fetch_config_values())
+                if config_values is None:
+                    config_values = await self._fetch_config_values()
+                started = time.perf_counter()
+                data.update(config_values)
+                self._profiler.record("merge", time.perf_counter() - started)
 
                 if self._consecutive_failures > 0 and not self._recovery_logged:
                     _LOGGER.info(
@@ -602,13 +1006,19 @@ class VioletPoolControllerDevice:
                         f"controller_unavailable_{self.config_entry.entry_id}",
                     )
 
-                self._data = dict(data)
+                if not isinstance(data, ReadingsSnapshot):
+                    data = ReadingsSnapshot(data)
+                self._data = data.freeze(self._update_counter + 1)
+                self._circuit.record_success()
+                self._error_handler.record_success()
                 self._available = True
+                self._stale = False
                 self._consecutive_failures = 0
                 self._last_error = None
                 self._last_update_time = time.monotonic()
                 self._system_health = 100.0
 
+                started = time.perf_counter()
                 fw_candidates = [
                     data.get("SYSTEM_swversion"),
                     data.get("FW"),
@@ -650,7 +1060,20 @@ class VioletPoolControllerDevice:
                     flow_value,
                     data.get("IMP1_value"),
                 )
-                self._poll_history.append((now_dt, len(data), self._connection_latency, snapshot))
+                self._poll_history.append(now_dt, len(data), self._connection_latency, snapshot)
+                if self._poll_ring is not None:
+                    append = self.hass.async_add_executor_job(
+                        self._poll_ring.append,
+                        now_dt.timestamp(),
+                        len(data),
+                        self._connection_latency,
+                        snapshot,
+                    )
+                    self._poll_ring_appends.add(append)
+                    append.add_done_callback(self._poll_ring_appends.discard)
+                self._schedule_payload_save()
+                self._profiler.record("firmware", time.perf_counter() - started)
+                self._profiler.record("poll", time.perf_counter() - poll_started)
 
                 _LOGGER.debug(
                     "Update #%d for '%s': %d keys fetched in %.3fs",
@@ -660,7 +1083,7 @@ class VioletPoolControllerDevice:
                     self._connection_latency / 1000,
                 )
 
-                return dict(self._data)
+                return self._data
 
         except UpdateFailed:
             # Already counted and logged where it was raised - the generic
@@ -669,7 +1092,17 @@ class VioletPoolControllerDevice:
         except VioletAuthError:
             # Auth errors must surface immediately so HA can trigger re-auth
             raise
+        except CircuitBreakerError as err:
+            # No request went out, but the controller still counts as down.
+            self._last_error = str(err)
+            self._consecutive_failures += 1
+            _LOGGER.debug("Skipped poll of '%s': %s", self.device_name, err)
+            if self._consecutive_failures >= self._max_consecutive_failures:
+                self._available = False
+                raise UpdateFailed(f"Controller unreachable: {err}") from err
+            return self._data
         except VioletPoolAPIError as err:
+            self._record_failure(err)
             self._last_error = str(err)
             self._consecutive_failures += 1
             self._recovery_logged = False
@@ -697,9 +1130,10 @@ class VioletPoolControllerDevice:
                     self._consecutive_failures,
                     self._max_consecutive_failures,
                 )
-            return dict(self._data) if self._data else {}
+            return self._data
 
         except Exception as err:
+            self._record_failure(err)
             self._last_error = str(err)
             self._consecutive_failures += 1
             self._recovery_logged = False
@@ -724,7 +1158,134 @@ class VioletPoolControllerDevice:
                     self._consecutive_failures,
                     self._max_consecutive_failures,
                 )
-            return dict(self._data) if self._data else {}
+            return self._data
+
+    async def _probe_controller(self) -> None:
+        """Send the single cheap request that decides a half-open circuit.
+
+        SYSTEM_swversion is a locally cached value on the controller, so this
+        costs far less than a full poll. A failure propagates and re-opens the
+        circuit through the caller's error handling.
+        """
+        await self._api_call(
+            self.api.get_config(["SYSTEM_swversion"]),
+            endpoint="/getConfig",
+            params=["SYSTEM_swversion"],
+        )
+        self._circuit.record_success()
+
+    def _record_failure(self, err: Exception | None) -> None:
+        """Record a failed poll in the error history and the circuit breaker.
+
+        Args:
+            err: The exception, or None if the controller answered with
+                empty or invalid data.
+        """
+        if err is None:
+            error_info = IntegrationError(
+                error_type=ErrorType.SERVER_ERROR,
+                severity=ErrorSeverity.MEDIUM,
+                message="Controller returned empty or invalid data",
+            )
+        else:
+            error_info = self._error_handler.classify_error(err)
+        self._error_handler.record_error(error_info)
+        self._circuit.record_failure(error_info.retry_after)
+
+    @property
+    def error_handler(self) -> EnhancedErrorHandler:
+        """Return the error history of this controller."""
+        return self._error_handler
+
+    def attach_payload_store(self, store: Store[dict[str, Any]]) -> None:
+        """Persist the payload of successful polls to ``store`` from now on."""
+        self._payload_store = store
+
+    def _schedule_payload_save(self, *, force: bool = False) -> None:
+        """Write the current payload at most every PAYLOAD_SAVE_INTERVAL seconds.
+
+        Args:
+            force: Write now regardless of the interval (the hardware config
+                changed).
+        """
+        if self._payload_store is None:
+            return
+        now = time.monotonic()
+        if (
+            not force
+            and self._last_payload_save is not None
+            and now - self._last_payload_save < PAYLOAD_SAVE_INTERVAL
+        ):
+            return
+        self._last_payload_save = now
+        self._payload_store.async_delay_save(self._stored_payload, 0)
+
+    def _stored_payload(self) -> dict[str, Any]:
+        """Return the state a warm start needs, as JSON-serializable data."""
+        return {
+            "saved_at": time.time(),
+            "firmware_version": self._firmware_version,
+            "data": dict(self._data),
+            "config": dict(self._config_cache),
+            "hw_detected": sorted(self._hw_detected),
+            # The raw getConfig response; the parsed config holds parser objects.
+            "hardware_config": (
+                {"identity": self._hardware_config_identity, "config": self._hardware_config_raw}
+                if self._hardware_config_raw is not None
+                else None
+            ),
+        }
+
+    def restore_payload(self, payload: Mapping[str, Any]) -> bool:
+        """Serve a persisted payload until the first live poll succeeds.
+
+        The readings, config values, detected modules and hardware config
+        are restored, the device reports itself available and ``is_stale``
+        stays True until a poll replaces the data. The hardware config is only
+        used if it was read from this controller with the payload's firmware.
+
+        Returns:
+            False if the payload holds no readings; nothing is restored then.
+        """
+        data = payload.get("data")
+        if not isinstance(data, dict) or not data:
+            return False
+
+        self._config_cache = dict(payload.get("config") or {})
+        self._hw_detected = set(payload.get("hw_detected") or ())
+        self._firmware_version = payload.get("firmware_version")
+        hardware = payload.get("hardware_config")
+        if (
+            isinstance(hardware, dict)
+            and isinstance(hardware.get("config"), dict)
+            and hardware.get("identity") == self.hardware_config_identity
+        ):
+            self._apply_hardware_config(hardware["config"], hardware["identity"])
+        self._module_key_index = _classify_module_keys(data)[0]
+        self._update_counter += 1
+        self._data = ReadingsSnapshot(data).freeze(self._update_counter)
+        # Let last_event_age count from when the payload was polled.
+        age = max(0.0, time.time() - float(payload.get("saved_at") or time.time()))
+        self._last_update_time = time.monotonic() - age
+        self._available = True
+        self._stale = True
+        _LOGGER.info(
+            "Restored %d data points for '%s' from a payload %.0fs old",
+            len(data),
+            self.device_name,
+            age,
+        )
+        return True
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True while the data comes from the persisted payload."""
+        return self._stale
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker guarding the poll requests."""
+        return self._circuit
 
     @property
     def available(self) -> bool:
@@ -737,7 +1298,7 @@ class VioletPoolControllerDevice:
         return self._firmware_version
 
     @property
-    def data(self) -> dict[str, Any]:
+    def data(self) -> Mapping[str, Any]:
         """Return the current data."""
         return self._data
 
@@ -752,42 +1313,56 @@ class VioletPoolControllerDevice:
         return self._consecutive_failures
 
     def _detect_current_hardware_modules(self) -> list[str]:
-        """Detect currently present hardware modules from API data (not cached).
+        """Detect currently present hardware modules from API data (not sticky).
 
         Returns list of module names based on actual API keys present,
         not on historical detections.
         """
+        data = self._data
         extra_modules = []
+        # One pass over the payload buckets the keys of every module.
+        module_keys, _present = _classify_module_keys(data)
 
-        def has_keys(prefix: str) -> bool:
-            """Check if any valid keys start with the given prefix."""
-            return any(k.startswith(prefix) and self._data.get(k) is not None for k in self._data)
+        def has_keys(tag: str) -> bool:
+            """Check if the module reported any non-None value."""
+            return any(data.get(k) is not None for k in module_keys[tag])
 
         # Check standalone mode vs dosing module
-        if self._data.get("HW_STANDALONE_MODE"):
+        if data.get("HW_STANDALONE_MODE"):
             extra_modules.append("Dosing-Standalone")
-        elif has_keys("DOS_"):
+        elif has_keys("DOSING"):
             extra_modules.append("Dosing")
 
         # Check extension modules
-        if has_keys("EXT1_"):
+        if has_keys("EXT1"):
             extra_modules.append("Ext1")
-        if has_keys("EXT2_"):
+        if has_keys("EXT2"):
             extra_modules.append("Ext2")
 
         # Check DMX module
-        if has_keys("DMX_"):
+        if has_keys("DMX"):
             extra_modules.append("DMX")
 
         # Check Digital Input Rules module
-        if has_keys("DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_"):
+        if has_keys("DIRULE"):
             extra_modules.append("DiRule")
 
         return extra_modules
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device information for Home Assistant."""
+        """Return device information for Home Assistant.
+
+        Every entity reads this during setup, so it is built once per poll
+        generation and rebuilt when the firmware or the controller name
+        changes. Callers must not modify the returned dict.
+        """
+        data = self._data
+        identity = (self._firmware_version, self.controller_name)
+        cached = self._device_info_cache
+        if cached is not None and cached[0] is data and cached[1] == identity:
+            return cached[2]
+
         # Build a readable model string from currently detected hardware modules.
         # "Base" is omitted when it is the only module to avoid redundancy.
         extra_modules = self._detect_current_hardware_modules()
@@ -807,10 +1382,11 @@ class VioletPoolControllerDevice:
             suggested_area=self.controller_name,
         )
         for _serial_key in ("SERIAL", "SERIAL_NUMBER", "serial", "serial_number", "HW_SERIAL"):
-            _serial_val = self._data.get(_serial_key)
+            _serial_val = data.get(_serial_key)
             if _serial_val:
                 info["serial_number"] = str(_serial_val)
                 break
+        self._device_info_cache = (data, identity, info)
         return info
 
     @property
@@ -842,17 +1418,62 @@ class VioletPoolControllerDevice:
             return 0.0
         return time.monotonic() - self._last_update_time
 
+    @property
+    def poll_count(self) -> int:
+        """Return the number of poll attempts since setup."""
+        return self._api_request_count
+
     @property
     def api_request_rate(self) -> float:
         """
-        Return API requests per minute.
+        Return API requests per minute over the last minute.
 
         ✅ DIAGNOSTIC SENSOR: API request rate.
         """
-        elapsed = time.monotonic() - self._api_request_start_time
+        window = API_METRIC_WINDOWS["1m"]
+        elapsed = min(window, time.monotonic() - self._api_request_start_time)
         if elapsed < 1:
             return 0.0
-        return (self._api_request_count / elapsed) * 60
+        return self._api_metrics.total("requests", window) / elapsed * 60
+
+    @property
+    def api_totals(self) -> dict[str, int]:
+        """Return the API_METRIC_FIELDS counters since setup."""
+        return dict(self._api_totals)
+
+    @property
+    def api_trace(self) -> ApiTrace:
+        """Return the trace of the most recent controller requests."""
+        return self._api_trace
+
+    def control_client(self) -> VioletControlClient:
+        """Return a control client bound to this device.
+
+        Its config writes go through the batching ``async_set_config`` and
+        its requests are recorded in ``api_trace``.
+        """
+        return VioletControlClient(
+            self.api, config_writer=self.async_set_config, trace=self._api_trace
+        )
+
+    def api_metrics_summary(self) -> dict[str, dict[str, Any]]:
+        """Return the request counters of every window in API_METRIC_WINDOWS.
+
+        Each window reports its request, failure, byte and repeated poll
+        totals, plus the request rate per minute and the share of failed
+        requests.
+        """
+        summary: dict[str, dict[str, Any]] = {}
+        uptime = time.monotonic() - self._api_request_start_time
+        for label, window in API_METRIC_WINDOWS.items():
+            totals: dict[str, Any] = self._api_metrics.totals(window)
+            minutes = max(1.0, min(window, uptime)) / 60
+            totals["requests_per_min"] = round(totals["requests"] / minutes, 2)
+            totals["error_rate"] = (
+                round(totals["failures"] / totals["requests"], 3) if totals["requests"] else 0.0
+            )
+            summary[label] = totals
+        return summary
 
     @property
     def average_latency(self) -> float:
@@ -861,16 +1482,116 @@ class VioletPoolControllerDevice:
 
         ✅ DIAGNOSTIC SENSOR: Rolling average latency.
         """
-        if not self._latency_history:
-            return 0.0
-        return sum(self._latency_history) / len(self._latency_history)
+        return self._poll_history.average_latency
+
+    @property
+    def latency_percentiles(self) -> dict[int, float]:
+        """Return the p50/p95/p99 connection latency in milliseconds."""
+        return self._poll_history.latency_percentiles()
+
+    @property
+    def poll_history(self) -> PollHistory:
+        """Return the ring buffer of recent polls."""
+        return self._poll_history
+
+    @property
+    def poll_ring(self) -> PollRing | None:
+        """Return the persisted poll history, None until it is opened."""
+        return self._poll_ring
+
+    async def async_open_poll_ring(self, path: str) -> None:
+        """Open the persisted poll history and seed the poll history from it.
+
+        Every poll is appended to the ring file from then on. A file that
+        cannot be opened only costs the persistence.
+
+        Args:
+            path: Location of the ring file (see poll_ring_path).
+        """
+        ring = PollRing(path, POLL_RING_SIZE, POLL_SNAPSHOT_FIELDS)
+        try:
+            await self.hass.async_add_executor_job(ring.open)
+            records = await self.hass.async_add_executor_job(ring.records, POLL_HISTORY_SIZE)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Could not open the poll history file %s: %s", path, err)
+            return
+        for timestamp, count, latency, values in records:
+            self._poll_history.append(timestamp, count, latency, values)
+        self._poll_ring = ring
+        _LOGGER.debug("Restored %d polls of '%s' from %s", len(records), self.device_name, path)
+
+    async def async_close_poll_ring(self) -> None:
+        """Stop persisting polls and close the ring file in the executor.
+
+        Appends still queued are written first, so none of them hits the
+        closed mapping.
+        """
+        if self._poll_ring is None:
+            return
+        ring, self._poll_ring = self._poll_ring, None
+        if self._poll_ring_appends:
+            await asyncio.wait(self._poll_ring_appends)
+        await self.hass.async_add_executor_job(ring.close)
+
+    @property
+    def poll_profiler(self) -> PollProfiler:
+        """Return the per-stage timing histograms of the poll cycle."""
+        return self._profiler
 
     @property
     def hardware_config(self) -> dict[str, Any] | None:
         """Get cached complete hardware configuration."""
         return self._hardware_config
 
-    async def load_hardware_config(self) -> dict[str, Any] | None:
+    @property
+    def hardware_config_identity(self) -> dict[str, Any]:
+        """Return the controller and firmware a hardware config is valid for."""
+        return {
+            "controller": f"{self.api_url}_{self.device_id}",
+            "firmware_version": self._firmware_version,
+        }
+
+    @property
+    def hardware_config_generation(self) -> int:
+        """Return a counter that changes whenever the hardware config does."""
+        return self._hardware_config_generation
+
+    @property
+    def hardware_config_due(self) -> bool:
+        """Return True if the hardware config failed to load or is outdated.
+
+        Outdated means it was read from other firmware. Setup does the first
+        load; a failed load is retried after HARDWARE_CONFIG_RETRY_INTERVAL
+        seconds.
+        """
+        if self._hardware_config_loaded:
+            if self._hardware_config_identity == self.hardware_config_identity:
+                return False
+        elif self._hardware_config_attempt is None:
+            return False
+        return (
+            self._hardware_config_attempt is None
+            or time.monotonic() - self._hardware_config_attempt >= HARDWARE_CONFIG_RETRY_INTERVAL
+        )
+
+    def _apply_hardware_config(
+        self, raw: dict[str, Any], identity: dict[str, Any]
+    ) -> HardwareConfig:
+        """Parse a getConfig response and make it the current hardware config.
+
+        Returns:
+            The HardwareConfig parsed from ``raw``.
+        """
+        hw_config = HardwareConfig(raw)
+        if raw != self._hardware_config_raw:
+            self._hardware_config_generation += 1
+        self._hardware_config = hw_config.get_all_configs()
+        self._hardware_config_raw = raw
+        self._hardware_config_identity = identity
+        self._hardware_config_loaded = True
+        return hw_config
+
+    async def load_hardware_config(self, *, refresh: bool = False) -> dict[str, Any] | None:
         """Load complete hardware configuration from controller.
 
         Reads ALL configurable names and parameters:
@@ -883,14 +1604,18 @@ class VioletPoolControllerDevice:
         - Output Parameters (Pump, Heater, Solar, etc.)
         - Pool Configuration
 
-        Caches result in _hardware_config.
+        Caches result in _hardware_config. A config restored from the
+        persisted payload counts as loaded; ``refresh`` re-reads it anyway and
+        logs what changed. A failed load keeps the cached config (if any).
+
+        Args:
+            refresh: Read the config even if one is cached.
         """
-        if self._hardware_config_loaded:
+        if self._hardware_config_loaded and not refresh:
             return self._hardware_config
 
+        self._hardware_config_attempt = time.monotonic()
         try:
-            from .hardware_config import HardwareConfig
-
             # Request all configuration keys (wildcard patterns)
             config_keys = [
                 "NAMES_",  # All named elements
@@ -908,22 +1633,34 @@ class VioletPoolControllerDevice:
                 "BACKWASH_",  # Outputs
             ]
 
-            config_response = await self.api.get_config(config_keys)
+            config_response = await self._api_call(
+                self.api.get_config(config_keys), endpoint="/getConfig", params=config_keys
+            )
 
             if not config_response:
                 _LOGGER.warning("No hardware configuration returned from controller")
-                self._hardware_config_loaded = True
-                return None
+                return self._hardware_config
 
-            # Parse complete hardware configuration
-            hw_config = HardwareConfig(config_response)
-            self._hardware_config = hw_config.get_all_configs()
+            previous = self._hardware_config_raw
+            raw = dict(config_response)
+            hw_config = self._apply_hardware_config(raw, self.hardware_config_identity)
 
-            # Log summary
-            _LOGGER.info(
-                "Loaded hardware configuration:\n%s",
-                hw_config.summary(),
-            )
+            if previous is None:
+                # Log summary
+                _LOGGER.info(
+                    "Loaded hardware configuration:\n%s",
+                    hw_config.summary(),
+                )
+            else:
+                changed = sorted(
+                    key for key in previous.keys() | raw.keys() if previous.get(key) != raw.get(key)
+                )
+                if changed:
+                    _LOGGER.info(
+                        "Hardware configuration of '%s' changed: %s",
+                        self.device_name,
+                        ", ".join(changed),
+                    )
 
             enabled = hw_config.get_enabled_features()
             _LOGGER.debug(
@@ -934,13 +1671,13 @@ class VioletPoolControllerDevice:
                 len(enabled["dmx_scenes"]),
             )
 
-            self._hardware_config_loaded = True
+            if raw != previous:
+                self._schedule_payload_save(force=True)
             return self._hardware_config
 
         except Exception as err:
             _LOGGER.error("Failed to load hardware configuration: %s", err)
-            self._hardware_config_loaded = True
-            return None
+            return self._hardware_config
 
     # Convenience property for backward compatibility
     @property
@@ -951,7 +1688,19 @@ class VioletPoolControllerDevice:
         return None
 
 
-class VioletPoolDataUpdateCoordinator(DataUpdateCoordinator[VioletReadings]):
+class _RefreshWindow:
+    """One coalesced post-command refresh: the callers share its future."""
+
+    __slots__ = ("deadline", "future", "opened", "task")
+
+    def __init__(self, opened: float, deadline: float, future: asyncio.Future[bool]) -> None:
+        self.opened = opened
+        self.deadline = deadline
+        self.future = future
+        self.task: asyncio.Task[None] | None = None
+
+
+class VioletPoolDataUpdateCoordinator(DataUpdateCoordinator[ReadingsSnapshot]):
     """Data update coordinator for the Violet Pool Controller."""
 
     def __init__(
@@ -972,10 +1721,31 @@ class VioletPoolDataUpdateCoordinator(DataUpdateCoordinator[VioletReadings]):
         )
         self.device = device
         self._setpoint_cache: dict[str, float] = {}
+        # Keys that changed in the poll being dispatched. None means "notify
+        # every listener" (first refresh, failures, manual updates).
+        self._pending_changed_keys: set[str] | None = None
+        self._last_changed_keys: frozenset[str] = frozenset()
+        # (last_update_success, device.available, device.is_stale, hardware
+        # config generation) at the last dispatch. Any change affects every
+        # entity's availability, stale flag or name, so it forces a full one.
+        self._dispatched_availability: tuple[bool, bool, bool, int] | None = None
         # The configured interval. update_interval may be stretched beyond it
         # while the controller is idle, but never falls below it.
         self._base_interval = _clamp_polling_interval(polling_interval)
         self._adaptive_polling = bool(adaptive_polling)
+        self._poll_scheduler = AdaptivePollScheduler()
+        # The post-command refresh that still accepts joiners (see
+        # async_request_coalesced_refresh).
+        self._refresh_window: _RefreshWindow | None = None
+        # Setpoint keys waiting to be read back after a write, and the task
+        # that reads them (see update_setpoint_cache).
+        self._confirm_keys: set[str] = set()
+        self._confirm_task: asyncio.Task[None] | None = None
+        # Background re-read of the hardware config (see
+        # schedule_hardware_config_refresh).
+        self._hardware_task: asyncio.Task[None] | None = None
+        # Opt-in timing of the entities' state properties (profile_entities).
+        self._entity_profiler = EntityProfiler()
 
         _LOGGER.info(
             "Coordinator initialized for '%s' (polling every %ds, adaptive: %s)",
@@ -1019,50 +1789,233 @@ class VioletPoolDataUpdateCoordinator(DataUpdateCoordinator[VioletReadings]):
         return True
 
     def _is_controller_active(self, data: dict[str, Any]) -> bool:
-        """Return True if any pool output is currently running.
-
-        Values arrive as ints, numeric strings or composite strings such as
-        ``"3|PUMP_ANTI_FREEZE"``, so they are interpreted with the same helper
-        the switch entities use instead of being compared numerically.
-        """
-        from .entity import interpret_state_as_bool
+        """Return True if any pool output is currently running."""
+        return _outputs_active(data)
 
-        return any(interpret_state_as_bool(data.get(key), key) for key in ADAPTIVE_ACTIVITY_KEYS)
+    @property
+    def poll_scheduler(self) -> AdaptivePollScheduler:
+        """Return the scheduler that picks the adaptive polling interval."""
+        return self._poll_scheduler
 
     def _resolve_update_interval(self, is_active: bool) -> timedelta:
         """Return the interval to use until the next poll.
 
         The configured interval is the fastest rate; while nothing is running
-        the controller is polled less often to keep load off its web server.
+        and the readings are steady the controller is polled less often to
+        keep load off its web server (see AdaptivePollScheduler).
         """
-        if not self._adaptive_polling or is_active:
+        if not self._adaptive_polling:
             return timedelta(seconds=self._base_interval)
+        return timedelta(seconds=self._poll_scheduler.interval(self._base_interval, is_active))
+
+    async def async_request_coalesced_refresh(self, delay: float) -> bool:
+        """Refresh ``delay`` seconds from now, sharing the poll with other callers.
 
-        idle_interval = min(self._base_interval * ADAPTIVE_IDLE_FACTOR, ADAPTIVE_IDLE_MAX_INTERVAL)
-        return timedelta(seconds=max(self._base_interval, idle_interval))
+        A scene that switches eight relays used to start eight delayed
+        refreshes. Requests that arrive while a refresh is pending now join
+        it: the poll runs once the longest requested delay has passed and
+        every caller awaits the same result. A request whose delay would
+        push the poll past REFRESH_COALESCE_MAX_WAIT opens the next window.
+
+        Returns:
+            Whether the shared poll succeeded.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        target = now + delay
+        window = self._refresh_window
+        if window is None or target > window.opened + REFRESH_COALESCE_MAX_WAIT:
+            window = _RefreshWindow(now, target, loop.create_future())
+            self._refresh_window = window
+            # Tied to the entry, so unloading it cancels a pending window.
+            window.task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_run_refresh_window(window),
+                f"{self.name} coalesced refresh",
+            )
+        else:
+            window.deadline = max(window.deadline, target)
+        # Shielded so one caller being cancelled does not cancel the others.
+        return await asyncio.shield(window.future)
+
+    async def _async_run_refresh_window(self, window: _RefreshWindow) -> None:
+        """Wait for the window's deadline, poll once and resolve its future."""
+        loop = asyncio.get_running_loop()
+        try:
+            # The task may start eagerly inside the first caller. Yield once
+            # even for a zero delay, so callers already scheduled in this
+            # loop iteration join the window before it closes.
+            await asyncio.sleep(0)
+            # Joiners may move the deadline while we sleep.
+            while (remaining := window.deadline - loop.time()) > 0:
+                await asyncio.sleep(remaining)
+            if self._refresh_window is window:
+                self._refresh_window = None
+            await self.async_refresh()
+        except asyncio.CancelledError:
+            if self._refresh_window is window:
+                self._refresh_window = None
+            window.future.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Coalesced refresh for '%s' failed: %s", self.name, err)
+            window.future.set_result(False)
+        else:
+            window.future.set_result(bool(self.last_update_success))
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending refresh window, then shut the coordinator down.
+
+        The window's future is cancelled too: a task cancelled before it
+        started would otherwise leave its callers waiting.
+        """
+        window = self._refresh_window
+        if window is not None:
+            self._refresh_window = None
+            window.future.cancel()
+            if window.task is not None:
+                window.task.cancel()
+        await super().async_shutdown()
+
+    @property
+    def last_changed_keys(self) -> frozenset[str]:
+        """Return the keys that changed in the most recent successful poll."""
+        return self._last_changed_keys
 
     def update_setpoint_cache(self, key: str, value: float) -> None:
-        """Cache a setpoint write and immediately notify all listeners.
+        """Cache a setpoint write and immediately notify the affected listeners.
 
         This lets entities show the new value without waiting for the next
-        poll cycle. The cache entry persists until the next successful poll
-        returns the key, at which point coordinator.data takes precedence.
+        poll cycle. The cache entry persists until the key is read back - by
+        the confirm read scheduled here, or else by the next successful poll -
+        at which point coordinator.data takes precedence.
         """
         self._setpoint_cache[key] = value
-        # Setpoints are read on a timer; confirm this write on the next poll.
-        self.device.request_config_refresh()
+        self._confirm_keys.add(key)
+        if self._confirm_task is None:
+            # Tied to the entry, so unloading it cancels a pending confirm.
+            self._confirm_task = self.config_entry.async_create_background_task(
+                self.hass, self._async_confirm_setpoints(), f"{self.name} setpoint confirm"
+            )
+        self._pending_changed_keys = {key}
         self.async_update_listeners()
 
-    async def _async_update_data(self) -> VioletReadings:
+    async def _async_confirm_setpoints(self) -> None:
+        """Read back the written setpoints once CONFIG_CONFIRM_DELAY has passed.
+
+        Only the written keys are requested. If the read fails or misses a
+        key, the next poll re-reads the full config set instead.
+        """
+        try:
+            await asyncio.sleep(CONFIG_CONFIRM_DELAY)
+        finally:
+            keys, self._confirm_keys = self._confirm_keys, set()
+            self._confirm_task = None
+
+        try:
+            confirmed = await self.device.async_confirm_config(keys)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Setpoint confirm read for %s failed: %s", sorted(keys), err)
+            confirmed = {}
+
+        if keys.difference(confirmed):
+            self.device.request_config_refresh()
+        if not confirmed:
+            return
+
+        for key in confirmed:
+            self._setpoint_cache.pop(key, None)
+        self._pending_changed_keys = set(confirmed)
+        # async_set_updated_data would reset the poll timer and cancel a
+        # refresh that is already scheduled; only the listeners need to know.
+        self.data = self.device.data
+        self.async_update_listeners()
+
+    @property
+    def entity_profiler(self) -> EntityProfiler:
+        """Return the opt-in profiler of the entities' state properties."""
+        return self._entity_profiler
+
+    @callback
+    def schedule_hardware_config_refresh(self) -> None:
+        """Re-read the hardware config in the background.
+
+        Used after a warm start, after a firmware change and to retry a
+        failed load, so neither setup nor a poll waits for it.
+        """
+        if self._hardware_task is None:
+            # Tied to the entry, so unloading it cancels a pending refresh.
+            self._hardware_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_refresh_hardware_config(),
+                f"{self.device.device_name} hardware config",
+            )
+
+    async def _async_refresh_hardware_config(self) -> None:
+        """Re-read the hardware config and rename entities if it changed."""
+        generation = self.device.hardware_config_generation
+        try:
+            await self.device.load_hardware_config(refresh=True)
+        finally:
+            self._hardware_task = None
+        if self.device.hardware_config_generation != generation:
+            # The generation is part of the dispatched state, so every entity
+            # is woken and re-resolves its name.
+            self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose data keys changed.
+
+        Entities pass the keys they render as their coordinator context (see
+        ``VioletPoolControllerEntity._data_dependencies``). Listeners without a
+        context are always notified. Most of the ~400 keys are static between
+        polls, so this skips the state write - and the recorder row - for the
+        bulk of the entities on a typical poll.
+        """
+        changed = self._pending_changed_keys
+        self._pending_changed_keys = None
+
+        availability = (
+            self.last_update_success,
+            bool(self.device.available),
+            self.device.is_stale,
+            self.device.hardware_config_generation,
+        )
+        availability_changed = availability != self._dispatched_availability
+        self._dispatched_availability = availability
+
+        notify_all = changed is None or availability_changed or not self.last_update_success
+
+        # Same loop as DataUpdateCoordinator.async_update_listeners, timed
+        # for the poll profile.
+        profiler = self.device.poll_profiler
+        started = time.perf_counter()
+        writes = 0.0
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                notify_all
+                or not isinstance(context, frozenset)
+                or not context.isdisjoint(cast(set[str], changed))
+            ):
+                write_started = time.perf_counter()
+                update_callback()
+                writes += time.perf_counter() - write_started
+        profiler.record("entity_writes", writes)
+        profiler.record("dispatch", time.perf_counter() - started)
+        self._entity_profiler.update_done()
+
+    async def _async_update_data(self) -> ReadingsSnapshot:
         """
         Update data from the device.
 
-        Returns a VioletReadings snapshot on every call so that
-        HA's DataUpdateCoordinator always sees a new data object and
-        triggers entity listener callbacks.
+        Returns the device's read-only ReadingsSnapshot, so device.data and
+        coordinator.data are the same object.
 
         Returns:
-            A VioletReadings snapshot of the updated data.
+            The frozen ReadingsSnapshot of the updated data.
 
         Raises:
             ConfigEntryAuthFailed: On HTTP 401/403 (triggers re-auth flow).
@@ -1073,26 +2026,46 @@ class VioletPoolDataUpdateCoordinator(DataUpdateCoordinator[VioletReadings]):
             if not data:
                 raise UpdateFailed(f"Empty data returned for '{self.device.device_name}'")
 
-            # Stretch the interval while the pool equipment is idle. Never
-            # polls faster than the interval the user configured.
+            # Stretch the interval while the pool equipment is idle and the
+            # readings are steady. Never polls faster than the interval the
+            # user configured.
             is_active = self._is_controller_active(data)
+            self._poll_scheduler.observe(data, is_active)
             new_interval = self._resolve_update_interval(is_active)
             if self.update_interval != new_interval:
                 self.update_interval = new_interval
                 _LOGGER.debug(
-                    "Polling interval changed to %ds (configured: %ds, active: %s)",
+                    "Polling interval changed to %ds (configured: %ds, active: %s, "
+                    "moving: %s, alarm: %s, stable polls: %d)",
                     new_interval.total_seconds(),
                     self._base_interval,
                     is_active,
+                    self._poll_scheduler.moving,
+                    self._poll_scheduler.alarm_recent,
+                    self._poll_scheduler.stable_polls,
                 )
 
+            changed = _changed_keys(self.data, data)
+
             # Invalidate setpoint cache entries that now exist in fresh data.
             # This ensures: after writes show cached values, but polls restore live data.
             for key in list(self._setpoint_cache.keys()):
                 if key in data:
                     del self._setpoint_cache[key]
-
-            return VioletReadings(data)
+                    # The entity showed the cached value; re-render it even
+                    # if the polled value did not move.
+                    changed.add(key)
+
+            self._last_changed_keys = frozenset(changed)
+            self._pending_changed_keys = changed
+
+            if self.device.hardware_config_due:
+                self.schedule_hardware_config_refresh()
+            # The device's frozen snapshot is handed on as-is; wrapping it
+            # would copy ~400 keys per poll for nothing.
+            if not isinstance(data, ReadingsSnapshot):
+                data = ReadingsSnapshot(data)
+            return data
         except ConfigEntryAuthFailed:
             raise
         except VioletAuthError as err:
@@ -1110,9 +2083,34 @@ class VioletPoolDataUpdateCoordinator(DataUpdateCoordinator[VioletReadings]):
 async def async_setup_device(
     hass: HomeAssistant, config_entry: ConfigEntry, api: VioletPoolAPI
 ) -> VioletPoolDataUpdateCoordinator:
-    """Set up the Violet Pool Controller device and return a coordinator."""
+    """Set up the Violet Pool Controller device and return a coordinator.
+
+    If a payload of an earlier session was persisted, the coordinator starts
+    from it and the first live poll runs in the background, so setup does not
+    wait for the controller. Otherwise setup polls until the controller
+    answers.
+    """
     try:
         device = VioletPoolControllerDevice(hass, config_entry, api)
+        store: Store[dict[str, Any]] = Store(
+            hass, PAYLOAD_STORAGE_VERSION, payload_storage_key(config_entry.entry_id)
+        )
+        try:
+            payload = await store.async_load()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Could not load the persisted payload: %s", err)
+            payload = None
+        device.attach_payload_store(store)
+        await device.async_open_poll_ring(poll_ring_path(hass, config_entry.entry_id))
+        config_entry.async_on_unload(device.async_close_poll_ring)
+
+        if isinstance(payload, dict) and device.restore_payload(payload):
+            coordinator = _create_coordinator(hass, config_entry, device)
+            coordinator.async_set_updated_data(cast(ReadingsSnapshot, device.data))
+            config_entry.async_create_background_task(
+                hass, _async_live_start(coordinator), f"{device.device_name} live start"
+            )
+            return coordinator
 
         max_retries = 3
         last_error = None
@@ -1153,24 +2151,7 @@ async def async_setup_device(
         # Load complete hardware configuration for dynamic entity naming
         await device.load_hardware_config()
 
-        polling_interval = get_entry_value(
-            config_entry,
-            CONF_POLLING_INTERVAL,
-            DEFAULT_POLLING_INTERVAL,
-        )
-        adaptive_polling = get_entry_value(
-            config_entry,
-            CONF_ADAPTIVE_POLLING,
-            DEFAULT_ADAPTIVE_POLLING,
-        )
-
-        coordinator = VioletPoolDataUpdateCoordinator(
-            hass,
-            device,
-            config_entry.data.get(CONF_DEVICE_NAME, "Violet Pool Controller"),
-            polling_interval,
-            adaptive_polling,
-        )
+        coordinator = _create_coordinator(hass, config_entry, device)
 
         await coordinator.async_config_entry_first_refresh()
 
@@ -1189,3 +2170,32 @@ async def async_setup_device(
     except Exception as err:
         _LOGGER.exception("Device setup failed: %s", err)
         raise ConfigEntryNotReady(f"Setup error: {err}") from err
+
+
+def payload_storage_key(entry_id: str) -> str:
+    """Return the hass.storage key of the persisted payload of an entry."""
+    return f"{DOMAIN}.payload.{entry_id}"
+
+
+def poll_ring_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Return the location of the persisted poll history of an entry."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.polls.{entry_id}")
+
+
+def _create_coordinator(
+    hass: HomeAssistant, config_entry: ConfigEntry, device: VioletPoolControllerDevice
+) -> VioletPoolDataUpdateCoordinator:
+    """Create the coordinator with the polling options of the entry."""
+    return VioletPoolDataUpdateCoordinator(
+        hass,
+        device,
+        config_entry.data.get(CONF_DEVICE_NAME, "Violet Pool Controller"),
+        get_entry_value(config_entry, CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL),
+        get_entry_value(config_entry, CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+    )
+
+
+async def _async_live_start(coordinator: VioletPoolDataUpdateCoordinator) -> None:
+    """Replace a restored payload with live data after a warm start."""
+    await coordinator.async_refresh()
+    coordinator.schedule_hardware_config_refresh()
@@ -43,6 +43,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import CONF_GROUP_ENTITIES, DEFAULT_GROUP_ENTITIES, DOMAIN, MANUFACTURER
+from .key_index import classify_key
 from .runtime_data import get_runtime_data
 
 if TYPE_CHECKING:
@@ -194,6 +195,8 @@ def is_grouping_enabled(entry: ConfigEntry) -> bool:
 def resolve_group(key: str) -> str | None:
     """Return the sub-device id for a controller key, or None for the main device.
 
+    Answered from the memoized key index (see key_index.classify_key).
+
     Args:
         key: The raw controller key (or synthetic entity key) of an entity.
 
@@ -201,6 +204,14 @@ def resolve_group(key: str) -> str | None:
         The id of the owning sub-device, or ``None`` when the entity has no
         obvious home and should stay on the controller device itself.
     """
+    return classify_key(key).group
+
+
+def match_group(key: str) -> str | None:
+    """Work out the sub-device id of a key from the pattern tables.
+
+    Uncached; use :func:`resolve_group`.
+    """
     if not key:
         return None
 
@@ -9,7 +9,6 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any
 
 from homeassistant.components.diagnostics import async_redact_data
@@ -17,7 +16,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, INTEGRATION_VERSION
-from .error_handler import get_enhanced_error_handler
 from .state_constants import get_state_name
 
 # Fields redacted from config entry data (sensitive / privacy-relevant)
@@ -38,35 +36,41 @@ async def async_get_config_entry_diagnostics(
 
     # --- Poll history statistics ---
     poll_stats: dict[str, Any] = {"total_polls": 0}
-    history = device._poll_history
+    history = device.poll_history
     if history:
-        first_poll = history[0][0]
-        last_poll = history[-1][0]
-        data_counts = [count for _, count, *_ in history]
+        first_poll = history.first_timestamp
+        last_poll = history.last_timestamp
         poll_stats = {
             "total_polls": len(history),
-            "first_poll": first_poll.isoformat()
-            if isinstance(first_poll, datetime)
-            else str(first_poll),
-            "last_poll": last_poll.isoformat()
-            if isinstance(last_poll, datetime)
-            else str(last_poll),
-            "avg_data_points": round(sum(data_counts) / len(data_counts), 1),
+            "first_poll": first_poll.isoformat() if first_poll else None,
+            "last_poll": last_poll.isoformat() if last_poll else None,
+            "avg_data_points": round(history.average_count, 1),
         }
+    ring = device.poll_ring
+    poll_stats["persisted"] = (
+        await hass.async_add_executor_job(ring.summary) if ring is not None else None
+    )
 
     # --- Connection metrics ---
     connection: dict[str, Any] = {
         "system_health_pct": round(device.system_health, 1),
         "last_latency_ms": round(device.connection_latency, 1),
         "average_latency_ms": round(device.average_latency, 1),
+        **{
+            f"p{pct}_latency_ms": round(value, 1)
+            for pct, value in device.latency_percentiles.items()
+        },
         "total_api_requests": device._api_request_count,
         "api_request_rate_per_min": round(device.api_request_rate, 2),
+        "api_metrics": device.api_metrics_summary(),
+        "circuit_breaker": device.circuit_breaker.as_dict(),
         "seconds_since_last_update": round(device.last_event_age, 1),
+        "stale_data": device.is_stale,
         "last_update_success": coordinator.last_update_success,
     }
 
     # --- Error handler statistics ---
-    error_handler = get_enhanced_error_handler()
+    error_handler = device.error_handler
     error_summary = error_handler.get_error_summary()
     recent_errors = [e.to_dict() for e in error_handler.get_recent_errors(5)]
 
@@ -93,8 +97,16 @@ async def async_get_config_entry_diagnostics(
             "last_error": device.last_error,
         },
         "connection": connection,
-        "current_data": dict(coordinator.data) if coordinator.data else {},
+        # The coordinator's read-only snapshot is serialized as-is; it is the
+        # same object the device and the entities read from.
+        "current_data": coordinator.data or {},
+        "data_generation": getattr(coordinator.data, "generation", None),
         "poll_statistics": poll_stats,
+        "poll_profile": device.poll_profiler.as_dict(),
+        "api_trace": {
+            **device.api_trace.summary(),
+            "recent_calls": device.api_trace.entries(),
+        },
         "error_statistics": error_summary,
         "recent_errors": recent_errors,
         "state_hierarchy_reference": {
@@ -25,6 +25,7 @@ from homeassistant.util import slugify
 from .const import RELABELLED_ENTITY_IDS
 from .device import VioletPoolDataUpdateCoordinator
 from .device_hierarchy import build_device_info
+from .entity_names import EntityNameResolver
 from .state_constants import get_state_definition
 
 # CoordinatorEntity is generic in the type stubs but not subscriptable at runtime.
@@ -245,6 +246,11 @@ class VioletPoolControllerEntity(_VioletCoordinatorEntity):
 
     coordinator: VioletPoolDataUpdateCoordinator
 
+    # Set by platforms that name their entities through EntityNameResolver at
+    # setup; only those follow a rename on the controller. Everything else
+    # keeps its translation-key name.
+    _follow_hardware_name = False
+
     def __init__(
         self,
         coordinator: VioletPoolDataUpdateCoordinator,
@@ -259,7 +265,9 @@ class VioletPoolControllerEntity(_VioletCoordinatorEntity):
             config_entry: The config entry.
             entity_description: The entity description.
         """
-        super().__init__(coordinator)
+        # The declared data keys become the coordinator listener context, so
+        # the coordinator only wakes this entity when one of them changed.
+        super().__init__(coordinator, context=self._data_dependencies(entity_description))
 
         self.config_entry = config_entry
         self.entity_description = entity_description
@@ -286,6 +294,10 @@ class VioletPoolControllerEntity(_VioletCoordinatorEntity):
             self._attr_name = sanitized_name
 
         self._attr_unique_id = f"{config_entry.entry_id}_{entity_description.key}"
+        # Name the controller's hardware config gives this entity (relays,
+        # inputs, scenes...); renamed live, see _handle_coordinator_update.
+        self._hardware_config_generation = coordinator.device.hardware_config_generation
+        self._hardware_name = self._resolve_hardware_name() if self._follow_hardware_name else None
         self._attr_device_info = cast(DeviceInfo, coordinator.device.device_info)
         # Replaced with the sub-device in add_to_platform_start(), where hass is
         # available; the controller device is the correct fallback until then.
@@ -297,6 +309,57 @@ class VioletPoolControllerEntity(_VioletCoordinatorEntity):
             self._attr_unique_id,
         )
 
+    def _data_dependencies(self, entity_description) -> frozenset[str] | None:
+        """Return the coordinator data keys this entity's state is built from.
+
+        ``None`` (the default) subscribes the entity to every coordinator
+        update, which is right for entities that read device properties,
+        optimistic state or an open-ended set of keys. Entities whose state and
+        attributes come from a fixed set of keys override this so polls that
+        leave those keys untouched do not write a new state.
+
+        Args:
+            entity_description: The entity description being initialized.
+
+        Returns:
+            The keys to subscribe to, or None to receive every update.
+        """
+        return None
+
+    def _resolve_hardware_name(self) -> str | None:
+        """Return the name configured on the controller for this entity's key."""
+        hw_config = self.coordinator.device.hardware_config
+        if not isinstance(hw_config, dict):
+            return None
+        return EntityNameResolver(hw_config).hardware_name(self.entity_description.key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply outputs renamed on the controller, then write the state.
+
+        The coordinator wakes every entity when the hardware config changed
+        (see VioletPoolDataUpdateCoordinator.schedule_hardware_config_refresh).
+        During an entity profiling run the state properties are timed first
+        (see entity_profile.EntityProfiler).
+        """
+        generation = self.coordinator.device.hardware_config_generation
+        if self._follow_hardware_name and generation != self._hardware_config_generation:
+            self._hardware_config_generation = generation
+            name = self._resolve_hardware_name()
+            if name and name != self._hardware_name:
+                _LOGGER.debug(
+                    "Entity %s renamed on the controller: '%s' -> '%s'",
+                    self.entity_description.key,
+                    self._hardware_name,
+                    name,
+                )
+                self._attr_name = name
+            self._hardware_name = name
+        profiler = self.coordinator.entity_profiler
+        if profiler.active:
+            profiler.sample(self)
+        super()._handle_coordinator_update()
+
     @callback
     def add_to_platform_start(self, hass, platform, parallel_updates) -> None:
         """Attach the entity to its sub-device and pin its entity id.
@@ -470,6 +533,24 @@ class VioletPoolControllerEntity(_VioletCoordinatorEntity):
 
         return is_available
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the platform attributes, flagging restored values as stale.
+
+        Platforms provide their attributes through ``_extra_attributes``, so
+        the flag is added for every entity. After a warm start the entities
+        show the last payload of the previous session until the first live
+        poll succeeds (see ``VioletPoolControllerDevice.restore_payload``).
+        """
+        attributes = self._extra_attributes()
+        if self.device.is_stale:
+            return {**(attributes or {}), "stale": True}
+        return attributes
+
+    def _extra_attributes(self) -> dict[str, Any] | None:
+        """Return the platform's extra state attributes, none by default."""
+        return None
+
     def get_value(self, key: str, default: Any = None) -> Any:
         """
         Get value directly from coordinator data.
@@ -577,9 +658,8 @@ class VioletPoolControllerEntity(_VioletCoordinatorEntity):
         ✅ SHARED CODE: Reduces duplication across switch, climate, and select entities.
         """
         try:
-            await asyncio.sleep(delay)
-            await self.coordinator.async_request_refresh()
-            return bool(self.coordinator.last_update_success)
+            # Refreshes requested close together share one poll.
+            return await self.coordinator.async_request_coalesced_refresh(delay)
         except asyncio.CancelledError:
             raise  # Never swallow CancelledError - propagate task cancellation
         except Exception as err:
@@ -76,6 +76,10 @@ class EntityNameResolver:
 
         return default_name
 
+    def hardware_name(self, key: str) -> str | None:
+        """Return the name the hardware config gives ``key``, or None."""
+        return self.resolve_entity_name("", key, "") or None
+
     def _resolve_relay_name(self, key: str) -> str | None:
         """Resolve extension relay name."""
         if not self.hw_config:
@@ -0,0 +1,125 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Opt-in profiling of the state properties of the entities.
+
+A controller has ~300 entities and some of them cost far more per update than
+others. While a profiling run is active (see the ``profile_entities``
+service), every entity woken by the coordinator times its ``native_value``,
+``is_on`` and ``extra_state_attributes`` before it writes its state. The run
+ends on its own after the requested number of coordinator updates.
+
+The properties are evaluated once more per update while profiling, so a run
+should be kept short; when no run is active nothing is timed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+import time
+from array import array
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILED_PROPERTIES = ("native_value", "is_on", "extra_state_attributes")
+
+
+class EntityProfiler:
+    """Property timings of the entities of one coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize an inactive profiler."""
+        self._updates_left = 0
+        self._updates_done = 0
+        # (entity, property) -> durations in microseconds
+        self._samples: dict[tuple[str, str], array[float]] = {}
+
+    @property
+    def active(self) -> bool:
+        """Return True while a profiling run is in progress."""
+        return self._updates_left > 0
+
+    def start(self, updates: int) -> None:
+        """Drop earlier samples and profile the next ``updates`` updates."""
+        self._samples = {}
+        self._updates_done = 0
+        self._updates_left = max(1, updates)
+        _LOGGER.info("Entity profiling started for %d coordinator updates", self._updates_left)
+
+    def stop(self) -> None:
+        """End the run early; the samples so far are kept."""
+        self._updates_left = 0
+
+    def sample(self, entity: Any) -> None:
+        """Time the state properties ``entity`` defines.
+
+        Args:
+            entity: The entity about to write its state.
+        """
+        name = entity.entity_id or entity.entity_description.key
+        entity_type = type(entity)
+        for prop in PROFILED_PROPERTIES:
+            if not hasattr(entity_type, prop):
+                continue
+            started = time.perf_counter()
+            # The state write reports the error; only the cost counts here.
+            with contextlib.suppress(Exception):
+                getattr(entity, prop)
+            elapsed_us = (time.perf_counter() - started) * 1e6
+            samples = self._samples.get((name, prop))
+            if samples is None:
+                samples = self._samples[(name, prop)] = array("d")
+            samples.append(elapsed_us)
+
+    def update_done(self) -> None:
+        """Count one coordinator update of the run."""
+        if not self._updates_left:
+            return
+        self._updates_left -= 1
+        self._updates_done += 1
+        if not self._updates_left:
+            _LOGGER.info("Entity profiling finished after %d updates", self._updates_done)
+
+    def summary(self, top: int) -> dict[str, Any]:
+        """Return the ``top`` entities with the highest mean cost per update.
+
+        Each entity lists the sample count, mean and nearest-rank p95 of
+        every property it defines, in microseconds; the entities are ranked
+        by the sum of their property means.
+        """
+        entities: dict[str, dict[str, dict[str, float]]] = {}
+        for (name, prop), samples in self._samples.items():
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, max(0, math.ceil(0.95 * len(ordered)) - 1))]
+            entities.setdefault(name, {})[prop] = {
+                "samples": len(ordered),
+                "mean_us": round(sum(ordered) / len(ordered), 1),
+                "p95_us": round(p95, 1),
+            }
+
+        ranked = sorted(
+            (
+                {
+                    "entity": name,
+                    "mean_us": round(sum(stats["mean_us"] for stats in props.values()), 1),
+                    "properties": props,
+                }
+                for name, props in entities.items()
+            ),
+            key=lambda row: row["mean_us"],
+            reverse=True,
+        )
+        return {
+            "active": self.active,
+            "updates_profiled": self._updates_done,
+            "updates_left": self._updates_left,
+            "entities_profiled": len(entities),
+            "top": ranked[:top],
+        }
@@ -12,7 +12,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 import aiohttp
@@ -307,12 +309,24 @@ class IntegrationError:
 
 
 class EnhancedErrorHandler:
-    """Enhanced error handling with offline resilience and auto-recovery."""
+    """Enhanced error handling with offline resilience and auto-recovery.
 
-    def __init__(self) -> None:
-        """Initialize enhanced error handler."""
-        self._error_history: list[IntegrationError] = []
-        self._max_history = 100
+    Each controller device owns one handler (see
+    VioletPoolControllerDevice.error_handler), so the history and counters of
+    one config entry never mix with another's. All timestamps come from
+    time.monotonic().
+    """
+
+    def __init__(self, max_history: int = 100) -> None:
+        """Initialize enhanced error handler.
+
+        Args:
+            max_history: Number of errors kept in the history.
+        """
+        self._max_history = max_history
+        self._error_history: deque[IntegrationError] = deque(maxlen=max_history)
+        # Errors per type in the history, updated as errors enter and leave it.
+        self._error_counts: dict[ErrorType, int] = {}
         self._consecutive_errors = 0
         self._last_error_time = 0.0
         self._offline_since: float | None = None
@@ -442,11 +456,16 @@ class EnhancedErrorHandler:
         Args:
             error_info: The error to record.
         """
+        # The deque drops its oldest entry when full; keep the counts in step.
+        if len(self._error_history) == self._max_history:
+            evicted = self._error_history[0].error_type
+            self._error_counts[evicted] -= 1
+            if not self._error_counts[evicted]:
+                del self._error_counts[evicted]
         self._error_history.append(error_info)
-
-        # Keep history at max size
-        if len(self._error_history) > self._max_history:
-            self._error_history.pop(0)
+        self._error_counts[error_info.error_type] = (
+            self._error_counts.get(error_info.error_type, 0) + 1
+        )
 
         # Update consecutive error counter
         now = time.monotonic()
@@ -491,7 +510,9 @@ class EnhancedErrorHandler:
         Returns:
             List of recent errors.
         """
-        return self._error_history[-count:]
+        recent = list(islice(reversed(self._error_history), count))
+        recent.reverse()
+        return recent
 
     def get_error_summary(self) -> dict[str, Any]:
         """Get a summary of error statistics.
@@ -499,15 +520,9 @@ class EnhancedErrorHandler:
         Returns:
             Dictionary with error statistics.
         """
-        # Count errors by type
-        error_counts: dict[ErrorType, int] = {}
-        for error in self._error_history:
-            error_counts[error.error_type] = error_counts.get(error.error_type, 0) + 1
-
-        # Calculate offline duration
         offline_duration = 0.0
-        if self._offline_since:
-            offline_duration = time.time() - self._offline_since
+        if self._offline_since is not None:
+            offline_duration = time.monotonic() - self._offline_since
 
         return {
             "total_errors": len(self._error_history),
@@ -515,13 +530,14 @@ class EnhancedErrorHandler:
             "auth_errors": self._auth_errors,
             "offline_duration_seconds": offline_duration,
             "is_offline": self._offline_since is not None,
-            "error_counts": {k.value: v for k, v in error_counts.items()},
+            "error_counts": {k.value: v for k, v in self._error_counts.items()},
             "last_error": (self._error_history[-1].to_dict() if self._error_history else None),
         }
 
     def clear_history(self) -> None:
         """Clear error history (e.g., after successful recovery)."""
         self._error_history.clear()
+        self._error_counts.clear()
         self._consecutive_errors = 0
         self._offline_since = None
         _LOGGER.debug("Error history cleared")
@@ -534,7 +550,9 @@ class EnhancedErrorHandler:
         """
         # Trigger if we've had multiple recent auth errors
         recent_auth_errors = sum(
-            1 for e in self._error_history[-10:] if e.error_type == ErrorType.AUTH_ERROR
+            1
+            for e in islice(reversed(self._error_history), 10)
+            if e.error_type == ErrorType.AUTH_ERROR
         )
 
         return recent_auth_errors >= 2
@@ -607,18 +625,3 @@ class EnhancedErrorHandler:
 
         return None
 
-
-# Global enhanced error handler instance
-_enhanced_error_handler: EnhancedErrorHandler | None = None
-
-
-def get_enhanced_error_handler() -> EnhancedErrorHandler:
-    """Get the global enhanced error handler instance.
-
-    Returns:
-        The global EnhancedErrorHandler instance.
-    """
-    global _enhanced_error_handler
-    if _enhanced_error_handler is None:
-        _enhanced_error_handler = EnhancedErrorHandler()
-    return _enhanced_error_handler
@@ -91,7 +91,10 @@ def is_key_feature_active(key: str, active_features: Iterable[str]) -> bool:
     Returns:
         True when the key has no feature or its feature is enabled.
     """
-    feature_id = feature_for_key(key)
+    # key_index memoizes feature_for_key and imports this module.
+    from .key_index import classify_key
+
+    feature_id = classify_key(key).feature
     if feature_id is None:
         return True
     return feature_id in set(active_features)
@@ -10,24 +10,43 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from violet_poolcontroller_api.api import VioletPoolAPI, VioletPoolAPIError
 from violet_poolcontroller_api.utils_sanitizer import InputSanitizer
 
+from .api_trace import ApiTrace
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class VioletControlClient:
     """HTTP client for pool controller manual commands and configuration."""
 
-    def __init__(self, api: VioletPoolAPI) -> None:
+    def __init__(
+        self,
+        api: VioletPoolAPI,
+        config_writer: Callable[[dict[str, Any]], Awaitable[Any]] | None = None,
+        trace: ApiTrace | None = None,
+    ) -> None:
         """Initialize control client.
 
         Args:
             api: VioletPoolAPI instance for HTTP communication.
+            config_writer: Sends setConfig updates instead of ``api.set_config``,
+                e.g. the device's batching ``async_set_config``.
+            trace: The device's call trace the requests are recorded in.
         """
         self.api = api
+        self._config_writer = config_writer
+        self._trace = trace
+
+    async def _send(self, request: Awaitable[Any], endpoint: str, method: str, params: Any) -> Any:
+        """Await one request, recording it in the call trace if there is one."""
+        if self._trace is None:
+            return await request
+        return await self._trace.call(request, endpoint, method, params)
 
     async def set_function_manually(
         self,
@@ -65,9 +84,14 @@ class VioletControlClient:
             _LOGGER.debug("Executing command: setFunctionManually?%s", cmd)
 
             # Send command via API
-            response = await self.api._request(
-                f"/setFunctionManually?{cmd}",
-                method="GET",
+            response = await self._send(
+                self.api._request(
+                    f"/setFunctionManually?{cmd}",
+                    method="GET",
+                ),
+                "/setFunctionManually",
+                "GET",
+                cmd,
             )
 
             # Check response (non-empty text response indicates success)
@@ -346,10 +370,15 @@ class VioletControlClient:
                 "runtime_formatted": runtime_formatted,
             }
 
-            response = await self.api._request(
+            response = await self._send(
+                self.api._request(
+                    "/triggerManualDosing",
+                    method="POST",
+                    data=form_data,
+                ),
                 "/triggerManualDosing",
-                method="POST",
-                data=form_data,
+                "POST",
+                form_data,
             )
 
             response_text = str(response).strip() if response else ""
@@ -431,7 +460,16 @@ class VioletControlClient:
                     # All other values pass through unchanged
                     normalized_updates[key] = value
 
-            result = await self.api.set_config(normalized_updates)
+            if self._config_writer is not None:
+                # The device records the merged request it sends in its trace.
+                result = await self._config_writer(normalized_updates)
+            else:
+                result = await self._send(
+                    self.api.set_config(normalized_updates),
+                    "/setConfig",
+                    "POST",
+                    normalized_updates,
+                )
 
             if result:
                 _LOGGER.info(
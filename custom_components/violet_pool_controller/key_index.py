@@ -0,0 +1,81 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Memoized classification of controller keys.
+
+Which feature a key belongs to, which sub-device it is grouped under and how
+its sensor is described only depend on the key (and, for the sensor, on
+whether the controller reports a boolean for it). Every platform setup, every
+reload and the config flow used to work all of this out again by walking the
+regex tables. The answers are now computed once per key and shared:
+
+* :func:`classify_key` - feature and sub-device group, used by the sensor,
+  binary sensor and switch platforms, ``is_key_feature_active``,
+  ``build_device_info`` (and with it every platform) and the config flow's
+  ``group_sensor_keys``,
+* :func:`sensor_traits` - unit, device/state class, default icon, category,
+  enabled default and display precision of a generic sensor.
+
+Both caches are capped at ``KEY_INDEX_SIZE`` entries (least recently used
+entries are dropped first).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from .const import KEY_INDEX_SIZE
+from .feature_keys import feature_for_key
+
+if TYPE_CHECKING:
+    from .sensor_modules.base import SensorTraits
+
+
+class KeyClass(NamedTuple):
+    """Feature and sub-device group of one controller key."""
+
+    feature: str | None
+    group: str | None
+
+
+@lru_cache(maxsize=KEY_INDEX_SIZE)
+def classify_key(key: str) -> KeyClass:
+    """Return the feature and sub-device group of ``key``.
+
+    Args:
+        key: The raw controller key (or synthetic entity key).
+
+    Returns:
+        The feature id (None if the key belongs to no feature) and the
+        sub-device id (None for the controller device itself).
+    """
+    # device_hierarchy reads its groups from this index.
+    from .device_hierarchy import match_group
+
+    return KeyClass(feature_for_key(key), match_group(key))
+
+
+@lru_cache(maxsize=KEY_INDEX_SIZE)
+def sensor_traits(key: str, boolean_value: bool) -> SensorTraits:
+    """Return the key-derived parts of the sensor description of ``key``.
+
+    Args:
+        key: The raw controller key.
+        boolean_value: Whether the controller reports a boolean-like value
+            for it, which turns the sensor into a unitless state.
+    """
+    # sensor_modules.base builds its descriptions from this index.
+    from .sensor_modules.base import derive_sensor_traits
+
+    return derive_sensor_traits(key, boolean_value)
+
+
+def clear_key_index() -> None:
+    """Drop every memoized classification."""
+    classify_key.cache_clear()
+    sensor_traits.cache_clear()
@@ -87,6 +87,9 @@ class VioletNumber(VioletPoolControllerEntity, NumberEntity):
         self._indicator_fields = setpoint_config["indicator_fields"]
         self._default_value = setpoint_config["default_value"]
         self._api_key = setpoint_config["api_key"]
+        # getConfig key of the setpoint; writes to it go through the batched
+        # config writer of the device.
+        self._config_key: str | None = setpoint_config.get("config_key")
         # Config key holding this setpoint when the pool doses via electrolysis
         # instead of a chlorine pump (see dosing_channel.py).
         self._electrolysis_key: str | None = setpoint_config.get("electrolysis_key")
@@ -345,38 +348,16 @@ class VioletNumber(VioletPoolControllerEntity, NumberEntity):
             )
 
             api_key = self._api_key
-            electrolysis_key = self._active_electrolysis_key
+            config_key = self._active_electrolysis_key or self._config_key
 
-            if electrolysis_key is not None:
-                _LOGGER.debug(
-                    "Using set_target_value for electrolysis key %s (sanitized: %.2f)",
-                    electrolysis_key,
-                    sanitized_value,
-                )
-                result = await self.device.api.set_target_value(
-                    electrolysis_key,
-                    int(sanitized_value) if api_key == "ORP" else sanitized_value,
-                )
-            elif api_key == "pH":
-                _LOGGER.debug("Using set_ph_target (sanitized: %.2f)", sanitized_value)
-                result = await self.device.api.set_ph_target(sanitized_value)
-            elif api_key == "ORP":
-                _LOGGER.debug("Using set_orp_target (sanitized: %.1f)", sanitized_value)
-                result = await self.device.api.set_orp_target(sanitized_value)
-            elif api_key == "MinChlorine":
-                _LOGGER.debug("Using set_min_chlorine_level (sanitized: %.2f)", sanitized_value)
-                result = await self.device.api.set_min_chlorine_level(sanitized_value)
+            if config_key is not None:
+                write_value = int(sanitized_value) if api_key == "ORP" else sanitized_value
+                _LOGGER.debug("Using set_config for %s (sanitized: %s)", config_key, write_value)
+                # Setpoints changed together are merged into one setConfig call.
+                result = await self.device.async_set_config({config_key: write_value})
             elif api_key == "PUMP_SPEED":
                 _LOGGER.debug("Using set_pump_speed (sanitized: %d)", int(sanitized_value))
                 result = await self.device.api.set_pump_speed(int(sanitized_value))
-            elif api_key in ("HEATER_TARGET_TEMP", "SOLAR_TARGET_TEMP"):
-                _LOGGER.debug(
-                    "Using set_device_temperature for %s (sanitized: %.1f)",
-                    api_key.replace("_TARGET_TEMP", ""),
-                    sanitized_value,
-                )
-                climate_key = api_key.replace("_TARGET_TEMP", "")
-                result = await self.device.api.set_device_temperature(climate_key, sanitized_value)
             elif api_key.endswith("_TOTAL_CAN_AMOUNT_ML"):
                 _LOGGER.debug(
                     "Using set_dosing_parameters for %s (sanitized: %.0f ml)",
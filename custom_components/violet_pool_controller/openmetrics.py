@@ -0,0 +1,237 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""OpenMetrics exposition of a controller's health and readings.
+
+``GET /api/violet_pool_controller/metrics/<entry_id>`` returns the state of one
+loaded config entry in the OpenMetrics text format, for Prometheus to scrape
+with a long-lived access token:
+
+* availability, staleness, consecutive failures, system health and the
+  circuit breaker state,
+* request, failure, byte and retry counters since setup,
+* the latency percentiles of the poll history and the poll stage histograms,
+* the active safety locks and armed auto-stop timers,
+* every numeric reading of the current data.
+
+Everything is rendered from the in-memory state of the device; the recorder
+is not touched.
+"""
+
+from __future__ import annotations
+
+import math
+from http import HTTPStatus
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
+from .const import DOMAIN
+from .runtime_data import METRICS_VIEW_KEY, SERVICE_MANAGER_KEY
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_PREFIX = "violet_"
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    """Format a sample value (integers without a fraction)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _numeric(value: Any) -> float | None:
+    """Return a reading as a finite float, None if it is not numeric."""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value.strip())
+        except ValueError:
+            return None
+    else:
+        return None
+    return number if math.isfinite(number) else None
+
+
+class _MetricsWriter:
+    """Accumulates metric families in exposition order."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        """Start a metric family; its samples must follow directly."""
+        self._lines.append(f"# TYPE {_PREFIX}{name} {kind}")
+        self._lines.append(f"# HELP {_PREFIX}{name} {help_text}")
+
+    def sample(self, name: str, value: float, labels: dict[str, Any] | None = None) -> None:
+        """Add one sample of the current family."""
+        label_text = ""
+        if labels:
+            label_text = (
+                "{" + ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items()) + "}"
+            )
+        self._lines.append(f"{_PREFIX}{name}{label_text} {_format_number(value)}")
+
+    def text(self) -> str:
+        """Return the exposition, terminated by ``# EOF``."""
+        return "\n".join([*self._lines, "# EOF"]) + "\n"
+
+
+def render_openmetrics(coordinator: Any, safety_guard: Any = None) -> str:
+    """Render the metrics of one coordinator in the OpenMetrics text format.
+
+    Args:
+        coordinator: The coordinator of a loaded config entry.
+        safety_guard: The integration's SafetyGuard, if the services are set up.
+    """
+    device = coordinator.device
+    out = _MetricsWriter()
+
+    out.family("controller", "info", "Controller identity.")
+    out.sample(
+        "controller_info",
+        1,
+        {
+            "name": device.device_name,
+            "controller": device.controller_name,
+            "firmware": device.firmware_version or "unknown",
+        },
+    )
+
+    gauges = (
+        ("up", "Whether the controller answered the last poll.", float(bool(device.available))),
+        ("stale", "Whether the data comes from the persisted payload.", float(device.is_stale)),
+        (
+            "last_update_success",
+            "Whether the coordinator's last update succeeded.",
+            float(bool(coordinator.last_update_success)),
+        ),
+        (
+            "consecutive_failures",
+            "Failed polls since the last successful one.",
+            device.consecutive_failures,
+        ),
+        ("system_health_percent", "Computed system health.", device.system_health),
+        (
+            "last_update_age_seconds",
+            "Seconds since the last successful poll.",
+            device.last_event_age,
+        ),
+        (
+            "connection_latency_seconds",
+            "Request latency of the last poll.",
+            device.connection_latency / 1000,
+        ),
+    )
+    for name, help_text, value in gauges:
+        out.family(name, "gauge", help_text)
+        out.sample(name, value)
+
+    breaker_state = device.circuit_breaker.state
+    out.family("circuit_breaker", "stateset", "State of the poll circuit breaker.")
+    for state in (STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN):
+        out.sample(
+            "circuit_breaker", float(breaker_state == state), {f"{_PREFIX}circuit_breaker": state}
+        )
+
+    counters = (
+        ("api_requests", "requests", "Controller requests since setup."),
+        ("api_failures", "failures", "Failed controller requests since setup."),
+        ("api_response_bytes", "bytes", "Approximate response bytes since setup."),
+        ("repeated_polls", "repeated_polls", "Polls that repeated a failed one since setup."),
+    )
+    totals = device.api_totals
+    for name, field, help_text in counters:
+        out.family(name, "counter", help_text)
+        out.sample(f"{name}_total", totals.get(field, 0))
+    out.family("polls", "counter", "Poll attempts since setup.")
+    out.sample("polls_total", device.poll_count)
+
+    out.family(
+        "poll_latency_quantile_seconds",
+        "gauge",
+        "Request latency percentiles over the recent polls.",
+    )
+    for pct, value in device.latency_percentiles.items():
+        out.sample("poll_latency_quantile_seconds", value / 1000, {"quantile": pct / 100})
+
+    out.family("poll_stage_duration_seconds", "histogram", "Duration of each poll stage.")
+    for stage, histogram in device.poll_profiler.stages.items():
+        for bound_ms, count in histogram.cumulative_buckets():
+            le = "+Inf" if math.isinf(bound_ms) else _format_number(bound_ms / 1000)
+            out.sample("poll_stage_duration_seconds_bucket", count, {"stage": stage, "le": le})
+        out.sample("poll_stage_duration_seconds_count", histogram.count, {"stage": stage})
+        out.sample(
+            "poll_stage_duration_seconds_sum", histogram.total_ms / 1000, {"stage": stage}
+        )
+
+    if safety_guard is not None:
+        out.family(
+            "safety_lock_remaining_seconds",
+            "gauge",
+            "Remaining cooldown of each active safety lock.",
+        )
+        for key, remaining in sorted(safety_guard.active_locks().items()):
+            out.sample("safety_lock_remaining_seconds", remaining, {"key": key})
+        out.family("safety_auto_stop_armed", "gauge", "Pending auto-stop timers.")
+        for key in safety_guard.armed_auto_stops():
+            out.sample("safety_auto_stop_armed", 1, {"key": key})
+
+    out.family("reading", "gauge", "Numeric values reported by the controller.")
+    for key, value in sorted((coordinator.data or {}).items()):
+        number = _numeric(value)
+        if number is not None:
+            out.sample("reading", number, {"key": key})
+
+    return out.text()
+
+
+class VioletMetricsView(HomeAssistantView):
+    """Serve the OpenMetrics exposition of one config entry."""
+
+    url = f"/api/{DOMAIN}/metrics/{{entry_id}}"
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    async def get(self, request: web.Request, entry_id: str) -> web.Response:
+        """Return the metrics of a loaded config entry."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN or entry.state is not ConfigEntryState.LOADED:
+            return self.json_message("Config entry not found", HTTPStatus.NOT_FOUND)
+
+        manager = hass.data.get(DOMAIN, {}).get(SERVICE_MANAGER_KEY)
+        body = render_openmetrics(
+            entry.runtime_data.coordinator, getattr(manager, "safety_guard", None)
+        )
+        return web.Response(body=body.encode("utf-8"), headers={"Content-Type": CONTENT_TYPE})
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once per Home Assistant run."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(METRICS_VIEW_KEY) or hass.http is None:
+        return
+    hass.http.register_view(VioletMetricsView())
+    domain_data[METRICS_VIEW_KEY] = True
@@ -0,0 +1,200 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Columnar ring buffer for the per-poll history of a controller.
+
+Each poll stores its wall-clock time, the number of keys fetched, the request
+latency and a handful of readings (see ``POLL_SNAPSHOT_FIELDS`` in device.py).
+The columns are preallocated ``array`` objects, so a stored poll costs a few
+dozen bytes instead of a tuple of boxed Python objects, and the averages the
+diagnostic sensors read are kept as running sums.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from .reading_values import reading_to_float
+
+# (timestamp, key count, latency in ms, snapshot values)
+PollRecord = tuple[datetime, int, float, tuple[float | None, ...]]
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class PollHistory:
+    """Fixed-size ring buffer of poll samples, one typed column per field.
+
+    Latency statistics cover the last ``latency_window`` polls, the remaining
+    columns the whole buffer.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fields: Sequence[str],
+        *,
+        latency_window: int | None = None,
+    ) -> None:
+        """Initialize an empty history.
+
+        Args:
+            capacity: Number of polls kept before the oldest is overwritten.
+            fields: Names of the snapshot columns, in ``append`` order.
+            latency_window: Number of most recent polls the latency statistics
+                cover. Defaults to the full capacity.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self.latency_window = min(latency_window or capacity, capacity)
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._latencies = array("d", bytes(8 * capacity))
+        self._counts = array("I", bytes(4 * capacity))
+        # NaN marks a missing reading.
+        self._columns = [array("d", [math.nan]) * capacity for _ in self.fields]
+        self._next = 0
+        self._size = 0
+        self._count_sum = 0
+        self._latency_sum = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of stored polls."""
+        return self._size
+
+    def __bool__(self) -> bool:
+        """Return whether any poll has been stored."""
+        return self._size > 0
+
+    def _slot(self, index: int) -> int:
+        """Map a position (0 = oldest, negative from the newest) to a slot."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("poll history index out of range")
+        return (self._next - self._size + index) % self.capacity
+
+    def append(
+        self,
+        timestamp: datetime,
+        count: int,
+        latency: float,
+        values: Sequence[Any] = (),
+    ) -> None:
+        """Store one poll, overwriting the oldest once the buffer is full.
+
+        Args:
+            timestamp: When the poll finished.
+            count: Number of keys the poll returned.
+            latency: Request latency in milliseconds.
+            values: Snapshot readings in ``fields`` order; missing or
+                non-numeric readings are stored as NaN.
+        """
+        slot = self._next
+        if self._size >= self.latency_window:
+            # The oldest sample of the latency window drops out.
+            self._latency_sum -= self._latencies[(slot - self.latency_window) % self.capacity]
+        if self._size == self.capacity:
+            self._count_sum -= self._counts[slot]
+        else:
+            self._size += 1
+
+        self._timestamps[slot] = timestamp.timestamp()
+        self._counts[slot] = max(0, count)
+        self._latencies[slot] = latency
+        for column, value in zip(self._columns, values):
+            column[slot] = reading_to_float(value)
+
+        self._count_sum += self._counts[slot]
+        self._latency_sum += latency
+        self._next = (slot + 1) % self.capacity
+
+    def _record(self, slot: int) -> PollRecord:
+        values = tuple(
+            None if math.isnan(column[slot]) else column[slot] for column in self._columns
+        )
+        return (
+            datetime.fromtimestamp(self._timestamps[slot]),
+            self._counts[slot],
+            self._latencies[slot],
+            values,
+        )
+
+    def __getitem__(self, index: int) -> PollRecord:
+        """Return the poll at ``index`` as ``(timestamp, count, latency, values)``."""
+        return self._record(self._slot(index))
+
+    def __iter__(self) -> Iterator[PollRecord]:
+        """Iterate the stored polls from oldest to newest."""
+        start = self._next - self._size
+        for offset in range(self._size):
+            yield self._record((start + offset) % self.capacity)
+
+    def clear(self) -> None:
+        """Forget every stored poll."""
+        self._next = 0
+        self._size = 0
+        self._count_sum = 0
+        self._latency_sum = 0.0
+
+    @property
+    def first_timestamp(self) -> datetime | None:
+        """Return the time of the oldest stored poll."""
+        return self[0][0] if self._size else None
+
+    @property
+    def last_timestamp(self) -> datetime | None:
+        """Return the time of the newest stored poll."""
+        return self[-1][0] if self._size else None
+
+    @property
+    def average_count(self) -> float:
+        """Return the average number of keys per stored poll."""
+        return self._count_sum / self._size if self._size else 0.0
+
+    @property
+    def latency_samples(self) -> int:
+        """Return the number of polls the latency statistics cover."""
+        return min(self._size, self.latency_window)
+
+    @property
+    def average_latency(self) -> float:
+        """Return the average latency in milliseconds over the latency window."""
+        samples = self.latency_samples
+        return self._latency_sum / samples if samples else 0.0
+
+    def recent_latencies(self) -> list[float]:
+        """Return the latencies of the latency window, oldest first."""
+        samples = self.latency_samples
+        start = self._next - samples
+        return [self._latencies[(start + offset) % self.capacity] for offset in range(samples)]
+
+    def latency_percentiles(
+        self, percentiles: Sequence[int] = DEFAULT_PERCENTILES
+    ) -> dict[int, float]:
+        """Return nearest-rank latency percentiles over the latency window.
+
+        Args:
+            percentiles: Percentiles to compute, each between 1 and 100.
+
+        Returns:
+            Mapping of percentile to latency in milliseconds; empty when no
+            poll has been stored yet.
+        """
+        ordered = sorted(self.recent_latencies())
+        if not ordered:
+            return {}
+        last = len(ordered) - 1
+        return {
+            pct: ordered[min(last, max(0, math.ceil(pct / 100 * len(ordered)) - 1))]
+            for pct in percentiles
+        }
@@ -0,0 +1,154 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Per-stage timing histograms of the poll cycle.
+
+The connection latency covers the whole fetch, which mixes HTTP time with the
+work done on the payload afterwards. The device and the coordinator record
+each stage separately:
+
+* ``http_readings``, ``http_runtimes``, ``http_config`` - one request each,
+  including the JSON decoding in the API package,
+* ``snapshot`` - building the readings snapshot and filling in the runtimes,
+* ``detection`` - optional-module detection, key restoration and HW_* flags,
+* ``merge`` - layering the config values on top of the readings,
+* ``firmware`` - the firmware scan and the poll history bookkeeping,
+* ``poll`` - the whole device update,
+* ``dispatch`` - the coordinator's listener dispatch,
+* ``entity_writes`` - the part of the dispatch spent in entity callbacks.
+
+Each stage keeps a fixed-bucket histogram, so memory does not grow with the
+number of polls.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from .const import POLL_PROFILE_BUCKETS_MS
+
+POLL_STAGES = (
+    "http_readings",
+    "http_runtimes",
+    "http_config",
+    "snapshot",
+    "detection",
+    "merge",
+    "firmware",
+    "poll",
+    "dispatch",
+    "entity_writes",
+)
+
+
+class StageHistogram:
+    """Count, sum, maximum and bucket counts of one stage's durations."""
+
+    __slots__ = ("_bounds", "_buckets", "count", "max_ms", "total_ms")
+
+    def __init__(self, bounds_ms: Sequence[float]) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            bounds_ms: Ascending bucket upper bounds in milliseconds. One
+                overflow bucket follows the last bound.
+        """
+        self._bounds = tuple(bounds_ms)
+        self._buckets = array("I", bytes(4 * (len(self._bounds) + 1)))
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """Record one duration in milliseconds."""
+        index = 0
+        for bound in self._bounds:
+            if duration_ms <= bound:
+                break
+            index += 1
+        self._buckets[index] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+
+    def cumulative_buckets(self) -> list[tuple[float, int]]:
+        """Return ``(upper bound ms, samples at or below it)`` per bucket.
+
+        The overflow bucket is reported with an infinite bound.
+        """
+        result = []
+        seen = 0
+        for bound, hits in zip((*self._bounds, math.inf), self._buckets, strict=True):
+            seen += hits
+            result.append((bound, seen))
+        return result
+
+    def percentile(self, pct: int) -> float:
+        """Return the bucket bound below which ``pct`` percent of samples fall.
+
+        Samples in the overflow bucket are reported as the maximum.
+        """
+        if not self.count:
+            return 0.0
+        wanted = pct / 100 * self.count
+        seen = 0
+        for bound, hits in zip(self._bounds, self._buckets, strict=False):
+            seen += hits
+            if seen >= wanted:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        labels = [f"<={bound:g}ms" for bound in self._bounds]
+        labels.append(f">{self._bounds[-1]:g}ms")
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {
+                label: hits for label, hits in zip(labels, self._buckets, strict=True) if hits
+            },
+        }
+
+
+class PollProfiler:
+    """Stage histograms of one controller's poll cycle."""
+
+    def __init__(self, bounds_ms: Sequence[float] = POLL_PROFILE_BUCKETS_MS) -> None:
+        """Initialize one empty histogram per stage in POLL_STAGES."""
+        self._bounds = tuple(bounds_ms)
+        self._stages = {stage: StageHistogram(self._bounds) for stage in POLL_STAGES}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one duration of ``stage``.
+
+        Args:
+            stage: Stage name from POLL_STAGES.
+            seconds: Duration as measured with ``time.perf_counter``.
+        """
+        self._stages[stage].add(seconds * 1000)
+
+    @property
+    def stages(self) -> dict[str, StageHistogram]:
+        """Return the histogram of every stage in POLL_STAGES."""
+        return dict(self._stages)
+
+    def reset(self) -> None:
+        """Drop every recorded sample."""
+        self._stages = {stage: StageHistogram(self._bounds) for stage in POLL_STAGES}
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the histograms of the stages that recorded a sample."""
+        return {stage: hist.as_dict() for stage, hist in self._stages.items() if hist.count}
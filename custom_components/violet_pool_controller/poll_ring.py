@@ -0,0 +1,236 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Persistent ring file of the per-poll history.
+
+PollHistory only lives in memory, so the poll history and the latency
+statistics started empty after every restart or reload. Each poll is now also
+appended to a fixed-record ring file per config entry in the ``.storage``
+directory, which seeds the history on the next start and backs the poll
+history of the diagnostics and the export service.
+
+The file holds a 32-byte header (magic, version, field count, capacity, next
+slot, stored records) followed by ``capacity`` records of
+
+* the poll time (double, seconds since the epoch),
+* the number of keys fetched (uint32),
+* the request latency in milliseconds (double),
+* one double per snapshot field, NaN for a missing reading.
+
+The file is memory-mapped, so an append writes one record and the header in
+place. All methods block on file I/O and belong in the executor; a lock
+serializes them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from .poll_history import PollRecord
+from .reading_values import reading_to_float
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAGIC = b"VPPR"
+_VERSION = 1
+# magic, version, field count, capacity, next slot, stored records
+_HEADER = struct.Struct("<4sHHIII")
+_HEADER_SIZE = 32
+
+
+class PollRing:
+    """Fixed-size ring of poll records in a memory-mapped file."""
+
+    def __init__(self, path: str, capacity: int, fields: Sequence[str]) -> None:
+        """Initialize a closed ring.
+
+        Args:
+            path: Location of the ring file.
+            capacity: Number of polls kept before the oldest is overwritten.
+            fields: Names of the snapshot columns, in ``append`` order. The
+                record width follows from their number.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.path = path
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._record = struct.Struct("<dId" + "d" * len(self.fields))
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._map: mmap.mmap | None = None
+        self._next = 0
+        self._size = 0
+
+    @property
+    def file_size(self) -> int:
+        """Return the size of the ring file in bytes."""
+        return _HEADER_SIZE + self.capacity * self._record.size
+
+    def open(self) -> None:
+        """Open the ring file, creating or resetting it if it does not match.
+
+        A file written for another capacity or field count starts empty.
+        """
+        with self._lock:
+            if self._map is not None:
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            mode = "r+b" if os.path.exists(self.path) else "w+b"
+            handle = open(self.path, mode)  # noqa: SIM115 - kept open for the mmap
+            try:
+                header = handle.read(_HEADER.size)
+                valid = os.fstat(handle.fileno()).st_size == self.file_size and (
+                    self._parse_header(header)
+                )
+                if not valid:
+                    if header:
+                        _LOGGER.info("Resetting poll ring file %s (layout changed)", self.path)
+                    handle.truncate(0)
+                    handle.truncate(self.file_size)
+                    self._next = 0
+                    self._size = 0
+                self._map = mmap.mmap(handle.fileno(), self.file_size)
+            except Exception:
+                handle.close()
+                raise
+            self._file = handle
+            if not valid:
+                self._write_header()
+
+    def _parse_header(self, header: bytes) -> bool:
+        """Adopt the position of a matching header; False if it does not match."""
+        if len(header) != _HEADER.size:
+            return False
+        magic, version, field_count, capacity, next_slot, size = _HEADER.unpack(header)
+        if (
+            magic != _MAGIC
+            or version != _VERSION
+            or field_count != len(self.fields)
+            or capacity != self.capacity
+            or next_slot >= capacity
+            or size > capacity
+        ):
+            return False
+        self._next = next_slot
+        self._size = size
+        return True
+
+    def _write_header(self) -> None:
+        assert self._map is not None
+        _HEADER.pack_into(
+            self._map,
+            0,
+            _MAGIC,
+            _VERSION,
+            len(self.fields),
+            self.capacity,
+            self._next,
+            self._size,
+        )
+
+    def append(self, timestamp: float, count: int, latency: float, values: Sequence[Any]) -> None:
+        """Store one poll, overwriting the oldest once the ring is full.
+
+        Does nothing while the ring is closed.
+
+        Args:
+            timestamp: When the poll finished, in seconds since the epoch.
+            count: Number of keys the poll returned.
+            latency: Request latency in milliseconds.
+            values: Snapshot readings in ``fields`` order.
+        """
+        readings = [reading_to_float(value) for value in values[: len(self.fields)]]
+        readings.extend([math.nan] * (len(self.fields) - len(readings)))
+        with self._lock:
+            if self._map is None:
+                return
+            self._record.pack_into(
+                self._map,
+                _HEADER_SIZE + self._next * self._record.size,
+                timestamp,
+                max(0, count),
+                latency,
+                *readings,
+            )
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            self._write_header()
+
+    def records(self, limit: int | None = None) -> list[PollRecord]:
+        """Return the stored polls from oldest to newest.
+
+        Args:
+            limit: Return only the newest ``limit`` polls.
+        """
+        with self._lock:
+            if self._map is None or not self._size:
+                return []
+            count = self._size if limit is None else min(limit, self._size)
+            start = (self._next - count) % self.capacity
+            slots = [(start + offset) % self.capacity for offset in range(count)]
+            raw = [
+                self._record.unpack_from(self._map, _HEADER_SIZE + slot * self._record.size)
+                for slot in slots
+            ]
+        return [
+            (
+                datetime.fromtimestamp(timestamp),
+                keys,
+                latency,
+                tuple(None if math.isnan(value) else value for value in readings),
+            )
+            for timestamp, keys, latency, *readings in raw
+        ]
+
+    def summary(self) -> dict[str, Any]:
+        """Return the fill level and time span of the ring for diagnostics."""
+        with self._lock:
+            size = self._size
+            first = last = None
+            if self._map is not None and size:
+                first_slot = (self._next - size) % self.capacity
+                last_slot = (self._next - 1) % self.capacity
+                first = self._record.unpack_from(
+                    self._map, _HEADER_SIZE + first_slot * self._record.size
+                )[0]
+                last = self._record.unpack_from(
+                    self._map, _HEADER_SIZE + last_slot * self._record.size
+                )[0]
+        return {
+            "stored_polls": size,
+            "capacity": self.capacity,
+            "file_size": self.file_size,
+            "first_poll": datetime.fromtimestamp(first).isoformat() if first else None,
+            "last_poll": datetime.fromtimestamp(last).isoformat() if last else None,
+        }
+
+    def close(self) -> None:
+        """Flush and close the ring file."""
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def remove_poll_ring(path: str) -> None:
+    """Delete a ring file if it exists."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
@@ -0,0 +1,149 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Adaptive polling interval for the data update coordinator.
+
+The configured interval is the fastest rate. On top of the output-activity
+check, the scheduler tracks how quickly the chemistry and water temperature
+readings change and whether a monitoring state flipped:
+
+* an active output, a moving reading or a recent alarm flip keeps the
+  configured interval,
+* otherwise the interval is stretched by ``ADAPTIVE_IDLE_FACTOR``,
+* and after ``ADAPTIVE_STABLE_POLLS`` calm polls by ``ADAPTIVE_STABLE_FACTOR``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .config_flow_utils.constants import MAX_POLLING_INTERVAL
+from .const import (
+    ADAPTIVE_ALARM_HOLD_POLLS,
+    ADAPTIVE_ALARM_KEYS,
+    ADAPTIVE_IDLE_FACTOR,
+    ADAPTIVE_IDLE_MAX_INTERVAL,
+    ADAPTIVE_STABLE_FACTOR,
+    ADAPTIVE_STABLE_MAX_INTERVAL,
+    ADAPTIVE_STABLE_POLLS,
+    ADAPTIVE_TREND_SMOOTHING,
+    ADAPTIVE_TREND_THRESHOLDS,
+)
+
+
+def _as_float(value: Any) -> float | None:
+    """Return ``value`` as float, or None when it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptivePollScheduler:
+    """Chooses the polling interval from output activity and reading trends."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            clock: Monotonic time source, replaceable in tests.
+        """
+        self._clock = clock
+        self._last_observed: float | None = None
+        self._last_values: dict[str, float] = {}
+        # Smoothed absolute change per minute of each ADAPTIVE_TREND_THRESHOLDS key.
+        self._trends: dict[str, float] = {}
+        self._last_alarm_states: dict[str, Any] = {}
+        self._alarm_hold = 0
+        self._stable_polls = 0
+
+    @property
+    def trends(self) -> dict[str, float]:
+        """Return the smoothed change per minute of the tracked readings."""
+        return dict(self._trends)
+
+    @property
+    def moving(self) -> bool:
+        """Return True if a tracked reading changes faster than its threshold."""
+        return any(
+            self._trends.get(key, 0.0) > threshold
+            for key, threshold in ADAPTIVE_TREND_THRESHOLDS.items()
+        )
+
+    @property
+    def alarm_recent(self) -> bool:
+        """Return True while an alarm flip is held."""
+        return self._alarm_hold > 0
+
+    @property
+    def stable_polls(self) -> int:
+        """Return the number of consecutive calm, idle polls."""
+        return self._stable_polls
+
+    def observe(self, data: Mapping[str, Any], is_active: bool) -> None:
+        """Feed the payload of a successful poll into the trend tracking.
+
+        Args:
+            data: The readings of the poll.
+            is_active: Whether any ADAPTIVE_ACTIVITY_KEYS output is on.
+        """
+        now = self._clock()
+        elapsed_min = (
+            max(1.0, now - self._last_observed) / 60 if self._last_observed is not None else None
+        )
+        self._last_observed = now
+
+        for key in ADAPTIVE_TREND_THRESHOLDS:
+            value = _as_float(data.get(key))
+            if value is None:
+                continue
+            previous = self._last_values.get(key)
+            self._last_values[key] = value
+            if previous is None or elapsed_min is None:
+                continue
+            rate = abs(value - previous) / elapsed_min
+            trend = self._trends.get(key)
+            self._trends[key] = (
+                rate
+                if trend is None
+                else ADAPTIVE_TREND_SMOOTHING * rate + (1 - ADAPTIVE_TREND_SMOOTHING) * trend
+            )
+
+        flipped = False
+        for key in ADAPTIVE_ALARM_KEYS:
+            if key not in data:
+                continue
+            state = data[key]
+            if key in self._last_alarm_states and self._last_alarm_states[key] != state:
+                flipped = True
+            self._last_alarm_states[key] = state
+        if flipped:
+            self._alarm_hold = ADAPTIVE_ALARM_HOLD_POLLS
+        elif self._alarm_hold:
+            self._alarm_hold -= 1
+
+        if is_active or flipped or self.alarm_recent or self.moving:
+            self._stable_polls = 0
+        else:
+            self._stable_polls += 1
+
+    def interval(self, base_interval: int, is_active: bool) -> int:
+        """Return the interval in seconds until the next poll.
+
+        Never below ``base_interval`` (the configured, fastest rate) and never
+        above MAX_POLLING_INTERVAL unless the configured interval itself is.
+        """
+        if is_active or self.alarm_recent or self.moving:
+            return base_interval
+
+        if self._stable_polls >= ADAPTIVE_STABLE_POLLS:
+            stretched = min(base_interval * ADAPTIVE_STABLE_FACTOR, ADAPTIVE_STABLE_MAX_INTERVAL)
+        else:
+            stretched = min(base_interval * ADAPTIVE_IDLE_FACTOR, ADAPTIVE_IDLE_MAX_INTERVAL)
+        return max(base_interval, min(stretched, MAX_POLLING_INTERVAL))
@@ -0,0 +1,28 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Conversion of raw controller readings for the typed poll history columns.
+
+The in-memory history (poll_history.py) and its ring file (poll_ring.py) store
+every reading as a double, with NaN marking a missing one, and must convert
+the raw values the same way.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+def reading_to_float(value: Any) -> float:
+    """Convert a raw reading to float, NaN when it is missing or not numeric."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
@@ -0,0 +1,92 @@
+# =============================================================================
+# Violet Pool Controller – Home Assistant Custom Integration
+# Copyright © 2026 Xerolux
+# Developed and created by Xerolux
+# https://github.com/Xerolux/violet-hass
+# =============================================================================
+
+"""Read-only snapshot of the merged payload of one poll.
+
+The device builds the snapshot in place while merging readings, runtimes and
+config values, then freezes it. From then on the same object is
+``device.data``, ``coordinator.data`` and what diagnostics report - no layer
+takes its own copy.
+
+The snapshot is a plain ``dict`` subclass on purpose. The API package's
+``VioletReadings`` is an immutable mapping built from the raw payload, so it
+cannot be filled in place; it is accepted as the source of a snapshot like
+any other mapping. Being a ``dict`` keeps the snapshot JSON-serializable for
+the diagnostics and passes the ``isinstance(data, dict)`` checks of the
+device.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class ReadingsSnapshot(dict[str, Any]):
+    """The merged payload of one poll, shared read-only by every consumer.
+
+    ``generation`` is the poll counter the snapshot was frozen at, so
+    consumers can cache values derived from it.
+    """
+
+    _frozen = False
+    generation = 0
+
+    def freeze(self, generation: int) -> ReadingsSnapshot:
+        """Seal the snapshot and stamp it with its poll generation."""
+        self.generation = generation
+        self._frozen = True
+        return self
+
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise TypeError("ReadingsSnapshot is read-only once frozen")
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._check_mutable()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._check_mutable()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> ReadingsSnapshot:  # type: ignore[override,misc]
+        self._check_mutable()
+        super().update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._check_mutable()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._check_mutable()
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        self._check_mutable()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[str, Any]:
+        self._check_mutable()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._check_mutable()
+        super().clear()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # copy/deepcopy/pickle would otherwise refill a frozen instance.
+        return (_restore_snapshot, (dict(self), self.generation, self._frozen))
+
+
+def _restore_snapshot(data: dict[str, Any], generation: int, frozen: bool) -> ReadingsSnapshot:
+    """Rebuild a snapshot from its ``__reduce__`` state."""
+    snapshot = ReadingsSnapshot(data)
+    return snapshot.freeze(generation) if frozen else snapshot
+
+
+EMPTY_SNAPSHOT = ReadingsSnapshot().freeze(0)
@@ -15,8 +15,6 @@ from typing import Any
 from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 
-from .http_control import VioletControlClient
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -46,7 +44,7 @@ class VioletRefillOverflowServiceHandlers:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Refill system type %d configured on %s",
@@ -92,7 +90,7 @@ class VioletRefillOverflowServiceHandlers:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Overflow protection configured on %s",
@@ -33,6 +33,8 @@ if TYPE_CHECKING:
 
 # Key under which the integration-wide service manager lives in hass.data.
 SERVICE_MANAGER_KEY = "service_manager"
+# Marks the OpenMetrics view (see openmetrics.py) as registered.
+METRICS_VIEW_KEY = "metrics_view"
 
 
 @dataclass(slots=True)
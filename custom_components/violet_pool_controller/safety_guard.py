@@ -198,6 +198,18 @@ class SafetyGuard:
                 f"Safety interval active for {device_key}: {remaining}s remaining"
             )
 
+    def active_locks(self) -> dict[str, int]:
+        """Return the remaining cooldown seconds of every active lock."""
+        return {
+            device_key: self.remaining_lock_time(device_key)
+            for device_key in list(self._locks)
+            if self.check_lock(device_key)
+        }
+
+    def armed_auto_stops(self) -> list[str]:
+        """Return the device keys with a pending auto-stop timer."""
+        return sorted(key for key, task in self._auto_stop_tasks.items() if not task.done())
+
     def set_lock(self, device_key: str, duration_seconds: int) -> None:
         """Arm a cooldown lock of *duration_seconds* for *device_key*."""
         if duration_seconds <= 0:
@@ -190,8 +190,7 @@ class VioletSelect(VioletPoolControllerEntity, SelectEntity):
             )
             return MODE_OFF if self._is_binary else MODE_AUTO
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
         if self.coordinator.data is None:
             return {}
@@ -265,7 +264,7 @@ class VioletSelect(VioletPoolControllerEntity, SelectEntity):
             if self._is_binary and self._device_key in BINARY_DOSING_CONFIG_KEYS:
                 config_key = BINARY_DOSING_CONFIG_KEYS[self._device_key]
                 config_val = "1" if option == MODE_ON else "0"
-                result = await self.device.api.set_config({config_key: config_val})
+                result = await self.device.async_set_config({config_key: config_val})
             elif self._device_key in DOSING_CONFIG_KEYS:
                 dosing_info = DOSING_CONFIG_KEYS[self._device_key]
                 dosing_type = dosing_info["type"]
@@ -282,6 +281,7 @@ class VioletSelect(VioletPoolControllerEntity, SelectEntity):
                 # Optimistic update
                 self._optimistic_mode = option
                 self.async_write_ha_state()
+                self.device.request_runtimes_refresh()
 
                 # Delayed refresh
                 task = asyncio.create_task(self._delayed_refresh())
@@ -42,13 +42,14 @@ from .const import (
 )
 from .device import VioletPoolDataUpdateCoordinator
 from .entity_cleanup import track_provided_entities
-from .feature_keys import feature_for_key
+from .key_index import classify_key
 
 # Import sensor classes from submodules
 from .sensor_modules import (
     VioletActiveErrorsSensor,
     VioletAPIRequestRateSensor,
     VioletAverageLatencySensor,
+    VioletCircuitBreakerSensor,
     VioletConnectionLatencySensor,
     VioletCSISensor,
     VioletDosingStateSensor,
@@ -157,6 +158,7 @@ def _create_special_sensors(
             VioletLastEventAgeSensor(coordinator, config_entry),
             VioletAPIRequestRateSensor(coordinator, config_entry),
             VioletAverageLatencySensor(coordinator, config_entry),
+            VioletCircuitBreakerSensor(coordinator, config_entry),
         ]
     )
     handled_keys.update(
@@ -166,6 +168,7 @@ def _create_special_sensors(
             "last_event_age",
             "api_request_rate",
             "average_latency",
+            "api_circuit_state",
         }
     )
     _LOGGER.debug(
@@ -214,7 +217,7 @@ def _create_special_sensors(
     for key, sensor_config in DOSING_STATE_SENSORS.items():
         if key in coordinator.data:
             # Check if feature is enabled
-            feature_id = feature_for_key(key)
+            feature_id = classify_key(key).feature
             if feature_id and feature_id not in config["active_features"]:
                 continue
 
@@ -239,7 +242,7 @@ def _create_special_sensors(
     for key, sensor_config in COMPOSITE_STATE_SENSORS.items():
         if key in coordinator.data:
             # Check if feature is enabled
-            feature_id = feature_for_key(key)
+            feature_id = classify_key(key).feature
             if feature_id and feature_id not in config["active_features"]:
                 continue
 
@@ -263,7 +266,7 @@ def _create_special_sensors(
     # Runtime Sensors (PUMP_RUNTIME, SOLAR_RUNTIME, etc.)
     for key, sensor_config in RUNTIME_SENSORS.items():
         if key in coordinator.data:
-            feature_id = feature_for_key(key)
+            feature_id = classify_key(key).feature
             if feature_id and feature_id not in config["active_features"]:
                 continue
             if not config["create_all"] and key not in config["selected_sensors"]:
@@ -287,7 +290,7 @@ def _create_special_sensors(
     # Dosing Statistics Sensors
     for key, sensor_config in DOSING_STATS_SENSORS.items():
         if key in coordinator.data:
-            feature_id = feature_for_key(key)
+            feature_id = classify_key(key).feature
             if feature_id and feature_id not in config["active_features"]:
                 continue
             if not config["create_all"] and key not in config["selected_sensors"]:
@@ -312,7 +315,7 @@ def _create_special_sensors(
     # OmniTronic valve state, backwash last-run timestamps, etc.)
     for key, sensor_config in EXTRA_DIAGNOSTIC_SENSORS.items():
         if key in coordinator.data:
-            feature_id = feature_for_key(key)
+            feature_id = classify_key(key).feature
             if feature_id and feature_id not in config["active_features"]:
                 continue
             if not config["create_all"] and key not in config["selected_sensors"]:
@@ -438,7 +441,7 @@ def _create_standard_sensors(
             # Already a binary sensor; see _HARDWARE_FLAG_KEYS.
             continue
 
-        feature_id = feature_for_key(key)
+        feature_id = classify_key(key).feature
         if feature_id and feature_id not in config["active_features"]:
             continue
 
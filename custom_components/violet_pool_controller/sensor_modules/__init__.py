@@ -15,6 +15,7 @@ from .base import (
     _TIMESTAMP_KEYS,
     _TIMESTAMP_SUFFIXES,
     _build_sensor_description,
+    compile_value_format,
     is_text_sensor,
     romcode_key_rank,
     romcode_sensor_index,
@@ -30,6 +31,7 @@ from .generic import (
 from .monitoring import (
     VioletAPIRequestRateSensor,
     VioletAverageLatencySensor,
+    VioletCircuitBreakerSensor,
     VioletConnectionLatencySensor,
     VioletLastEventAgeSensor,
     VioletSystemHealthSensor,
@@ -51,6 +53,7 @@ __all__ = [
     "_TIMESTAMP_KEYS",
     "_TIMESTAMP_SUFFIXES",
     "_build_sensor_description",
+    "compile_value_format",
     "is_text_sensor",
     "romcode_key_rank",
     "romcode_sensor_index",
@@ -61,6 +64,7 @@ __all__ = [
     # Monitoring
     "VioletAPIRequestRateSensor",
     "VioletAverageLatencySensor",
+    "VioletCircuitBreakerSensor",
     "VioletConnectionLatencySensor",
     "VioletLastEventAgeSensor",
     "VioletSystemHealthSensor",
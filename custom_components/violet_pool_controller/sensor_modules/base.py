@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any
+from typing import Any, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -22,6 +22,7 @@ from ..const import (
     NO_UNIT_SENSORS,
     UNIT_MAP,
 )
+from ..key_index import sensor_traits
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -339,6 +340,68 @@ def format_seconds_to_readable(seconds: float) -> str:
         return "0s"
 
 
+# Rendering plans for generic sensor values, see compile_value_format().
+VALUE_FORMAT_TIMESTAMP = "timestamp"
+VALUE_FORMAT_TEXT = "text"
+VALUE_FORMAT_STOPWATCH = "stopwatch"
+VALUE_FORMAT_ROUNDED = "rounded"
+VALUE_FORMAT_NUMBER = "number"
+
+
+class ValueFormat(NamedTuple):
+    """How a generic sensor renders its raw value.
+
+    ``digits`` is only used by ``VALUE_FORMAT_ROUNDED``. ``VALUE_FORMAT_NUMBER``
+    returns whole numbers as int and rounds everything else to two digits.
+    """
+
+    kind: str
+    digits: int = 2
+
+
+def compile_value_format(key: str) -> ValueFormat:
+    """Decide once how the value of ``key`` is rendered.
+
+    The answer only depends on the key, so it is computed when the sensor is
+    created instead of on every state write.
+    """
+    is_timestamp_key = key in _TIMESTAMP_KEYS or key.upper().endswith(_TIMESTAMP_SUFFIXES)
+    if is_timestamp_key and key not in _TIME_FORMAT_KEYS:
+        return ValueFormat(VALUE_FORMAT_TIMESTAMP)
+
+    if is_text_sensor(key):
+        return ValueFormat(VALUE_FORMAT_TEXT)
+
+    # DI-Rule stopwatch remaining time (seconds) is shown as '1h 2m 3s'
+    if "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_STOPWATCH" in key:
+        return ValueFormat(VALUE_FORMAT_STOPWATCH)
+
+    # Water chemistry values (pH, ORP, Chlorine) - 2 decimal places for precision
+    if key in {"pH_value", "orp_value", "pot_value"}:
+        return ValueFormat(VALUE_FORMAT_ROUNDED, 2)
+
+    # Temperature sensors (all onewire, CPU temps) - 2 decimal places
+    # IMPORTANT: Exclude freezecount, faultcount - these are counters, NOT temperatures!
+    key_lower = key.lower()
+    if (
+        ("temp" in key_lower or "onewire" in key_lower)
+        and "freezecount" not in key_lower
+        and "faultcount" not in key_lower
+    ):
+        return ValueFormat(VALUE_FORMAT_ROUNDED, 2)
+
+    # Analog sensors (ADC, IMP) - 2 decimal places for precision
+    if key.startswith(("ADC", "IMP")):
+        return ValueFormat(VALUE_FORMAT_ROUNDED, 2)
+
+    # Percentage values - 1 decimal place
+    if key.startswith("SYSTEM_") or "_" in key and key.split("_")[-1] in ("PERCENT", "PERCENTAGE"):
+        return ValueFormat(VALUE_FORMAT_ROUNDED, 1)
+
+    # Counts, RPM, etc. - integer if whole, otherwise 2 decimal places
+    return ValueFormat(VALUE_FORMAT_NUMBER)
+
+
 def determine_device_class(key: str, unit: str | None, raw_value: Any) -> SensorDeviceClass | None:
     """Determines the appropriate device class for a sensor."""
     if key in _BOOLEAN_VALUE_KEYS or (_is_boolean_value(raw_value) and key not in UNIT_MAP):
@@ -448,34 +511,40 @@ def should_skip_sensor(key: str, raw_value: Any) -> bool:
     )
 
 
-def _build_sensor_description(
-    key: str,
-    raw_value: Any,
-    predefined: dict[str, Any],
-    *,
-    translation_key: str | None = None,
-) -> SensorEntityDescription:
-    """Builds a SensorEntityDescription for a given sensor key."""
-    predefined_info = predefined.get(key)
-    # Prefer translation key logic if implemented fully,
-    # but for dynamic sensors derived from API keys, we need dynamic names.
-    # We stick to name here but could use key as translation key
-    # if we updated strings.json
-    name = predefined_info["name"] if predefined_info else key.replace("_", " ").title()
-    icon = predefined_info.get("icon") if predefined_info else None
+class SensorTraits(NamedTuple):
+    """The parts of a sensor description that only depend on the key.
 
-    # A ROM code identifies the probe, it is not a reading. Every spelling the
-    # firmware uses gets the same name and no unit, so none of them can end up
-    # as a temperature.
-    romcode_index = romcode_sensor_index(key)
-    if romcode_index is not None:
-        name = f"OneWire ROM Code {romcode_index}"
-        icon = "mdi:identifier"
+    Memoized per key by key_index.sensor_traits.
+    """
+
+    unit: str | None
+    device_class: SensorDeviceClass | None
+    state_class: SensorStateClass | None
+    icon: str
+    entity_category: EntityCategory | None
+    enabled_default: bool
+    precision: int | None
+
+
+def derive_sensor_traits(key: str, boolean_value: bool) -> SensorTraits:
+    """Work out unit, classes, icon and defaults of a generic sensor.
+
+    Uncached; use key_index.sensor_traits.
+
+    Args:
+        key: The raw controller key.
+        boolean_value: Whether the controller reports a boolean-like value.
+    """
+    # A ROM code identifies the probe, it is not a reading, so it never gets
+    # a unit and can never end up as a temperature.
+    is_romcode = romcode_sensor_index(key) is not None
+    # Any boolean-like value stands in for the raw value below.
+    raw_value: Any = True if boolean_value else None
 
-    unit = None if romcode_index is not None else UNIT_MAP.get(key)
+    unit = None if is_romcode else UNIT_MAP.get(key)
     if key in NO_UNIT_SENSORS:
         unit = None
-    if _is_boolean_value(raw_value) and key not in UNIT_MAP:
+    if boolean_value and key not in UNIT_MAP:
         unit = None
 
     # Force no unit for count/fault sensors (they are counters, not measurements)
@@ -486,7 +555,7 @@ def _build_sensor_description(
     if "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_STOPWATCH" in key:
         unit = None
 
-    if unit is None and key not in NO_UNIT_SENSORS and romcode_index is None:
+    if unit is None and key not in NO_UNIT_SENSORS and not is_romcode:
         for suffix in [
             "_min",
             "_max",
@@ -517,30 +586,62 @@ def _build_sensor_description(
     if "contact" in key.lower():
         state_class = None
 
-    # Entity category: DIAGNOSTIC for system/internal sensors, otherwise
-    # allow the predefined dict to override (e.g. for extra diagnostic
-    # sensors that don't start with SYSTEM_).
+    return SensorTraits(
+        unit=unit,
+        device_class=determine_device_class(key, unit, raw_value),
+        state_class=state_class,
+        icon="mdi:identifier" if is_romcode else get_icon(key, unit, raw_value),
+        # DIAGNOSTIC for system/internal sensors unless predefined otherwise.
+        entity_category=EntityCategory.DIAGNOSTIC if key.startswith("SYSTEM_") else None,
+        enabled_default=_should_enable_by_default(key),
+        precision=_PRECISION_MAP.get(unit) if unit else None,
+    )
+
+
+def _build_sensor_description(
+    key: str,
+    raw_value: Any,
+    predefined: dict[str, Any],
+    *,
+    translation_key: str | None = None,
+) -> SensorEntityDescription:
+    """Builds a SensorEntityDescription for a given sensor key."""
+    traits = sensor_traits(key, _is_boolean_value(raw_value))
+    predefined_info = predefined.get(key)
+    # Prefer translation key logic if implemented fully,
+    # but for dynamic sensors derived from API keys, we need dynamic names.
+    # We stick to name here but could use key as translation key
+    # if we updated strings.json
+    name = predefined_info["name"] if predefined_info else key.replace("_", " ").title()
+    icon = predefined_info.get("icon") if predefined_info else None
+
+    # Every spelling of a ROM code gets the same name (see derive_sensor_traits).
+    romcode_index = romcode_sensor_index(key)
+    if romcode_index is not None:
+        name = f"OneWire ROM Code {romcode_index}"
+        icon = "mdi:identifier"
+
+    # Entity category: allow the predefined dict to override (e.g. for extra
+    # diagnostic sensors that don't start with SYSTEM_).
     predefined_category = (predefined_info or {}).get("entity_category")
     if predefined_category == "diagnostic":
         category: EntityCategory | None = EntityCategory.DIAGNOSTIC
     elif predefined_category == "config":
         category = EntityCategory.CONFIG
-    elif key.startswith("SYSTEM_"):
-        category = EntityCategory.DIAGNOSTIC
     else:
-        category = None
+        category = traits.entity_category
 
     return SensorEntityDescription(
         key=key,
         name=name,
-        icon=icon or get_icon(key, unit, raw_value),
-        native_unit_of_measurement=unit,
-        device_class=determine_device_class(key, unit, raw_value),
-        state_class=state_class,
+        icon=icon or traits.icon,
+        native_unit_of_measurement=traits.unit,
+        device_class=traits.device_class,
+        state_class=traits.state_class,
         entity_category=category,
         translation_key=translation_key,
-        entity_registry_enabled_default=_should_enable_by_default(key),
-        suggested_display_precision=_PRECISION_MAP.get(unit) if unit else None,
+        entity_registry_enabled_default=traits.enabled_default,
+        suggested_display_precision=traits.precision,
     )
 
 
@@ -61,8 +61,7 @@ class VioletPumpPowerSensor(VioletPoolControllerEntity, SensorEntity):
             return 0.0
         return _PUMP_SPEED_WATT.get(speed, 0.0)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str | int | None]:
+    def _extra_attributes(self) -> dict[str, str | int | None]:
         speed = self._get_active_speed()
         return {
             "speed_level": speed,
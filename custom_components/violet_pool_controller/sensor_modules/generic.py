@@ -23,11 +23,12 @@ from ..const import DOMAIN
 from ..device import VioletPoolDataUpdateCoordinator
 from ..entity import VioletPoolControllerEntity
 from .base import (
-    _TIME_FORMAT_KEYS,
-    _TIMESTAMP_KEYS,
-    _TIMESTAMP_SUFFIXES,
+    VALUE_FORMAT_ROUNDED,
+    VALUE_FORMAT_STOPWATCH,
+    VALUE_FORMAT_TEXT,
+    VALUE_FORMAT_TIMESTAMP,
+    compile_value_format,
     format_seconds_to_readable,
-    is_text_sensor,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -54,6 +55,7 @@ class VioletSensor(VioletPoolControllerEntity, SensorEntity):
         """
         super().__init__(coordinator, config_entry, description)
         self._logger = logging.getLogger(f"{DOMAIN}.sensor.{description.key}")
+        self._value_format = compile_value_format(description.key)
         _LOGGER.debug(
             "Sensor initialized: %s (Key: %s, Class: %s)",
             description.name or description.translation_key,
@@ -61,6 +63,10 @@ class VioletSensor(VioletPoolControllerEntity, SensorEntity):
             description.device_class,
         )
 
+    def _data_dependencies(self, entity_description) -> frozenset[str] | None:
+        """Subscribe to the sensor's own key only."""
+        return frozenset({entity_description.key})
+
     @property
     def state_class(self) -> SensorStateClass | None:
         """Override state_class for contact sensors to prevent numeric
@@ -96,13 +102,9 @@ class VioletSensor(VioletPoolControllerEntity, SensorEntity):
         if raw_value is None:
             return None
 
-        # Check if key indicates a timestamp sensor
-        # (by suffix or membership in _TIMESTAMP_KEYS)
-        is_timestamp_key = key in _TIMESTAMP_KEYS or any(
-            key.upper().endswith(suffix) for suffix in _TIMESTAMP_SUFFIXES
-        )
+        kind, digits = self._value_format
 
-        if is_timestamp_key and key not in _TIME_FORMAT_KEYS:
+        if kind == VALUE_FORMAT_TIMESTAMP:
             try:
                 timestamp = float(raw_value)
                 # 0 means "never" / "no timer running" - not 1970-01-01
@@ -122,63 +124,35 @@ class VioletSensor(VioletPoolControllerEntity, SensorEntity):
                 )
                 return None
 
-        if is_text_sensor(key):
+        if kind == VALUE_FORMAT_TEXT:
             return str(raw_value)
 
-        # Format DI-Rule stopwatch remaining time (seconds) to readable format
-        if "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_STOPWATCH" in key:
-            try:
-                return format_seconds_to_readable(float(raw_value))
-            except (ValueError, TypeError):
-                return str(raw_value)
-
         try:
             num_value = float(raw_value)
-
-            # Water chemistry values (pH, ORP, Chlorine) -
-            # 2 decimal places for precision
-            if key in {"pH_value", "orp_value", "pot_value"}:
-                return round(num_value, 2)
-
-            # Temperature sensors (all onewire, CPU temps) - 2 decimal places
-            # IMPORTANT: Exclude freezecount, faultcount -
-            # these are counters, NOT temperatures!
-            # ROM-code sensors are excluded via the is_text_sensor() return above.
-            if (
-                ("temp" in key.lower() or "onewire" in key.lower())
-                and "freezecount" not in key.lower()
-                and "faultcount" not in key.lower()
-            ):
-                return round(num_value, 2)
-
-            # Analog sensors (ADC, IMP) - 2 decimal places for precision
-            if key.startswith(("ADC", "IMP")):
-                return round(num_value, 2)
-
-            # Percentage values - 1 decimal place
-            if (
-                key.startswith("SYSTEM_")
-                or "_" in key
-                and key.split("_")[-1] in ["PERCENT", "PERCENTAGE"]
-            ):
-                return round(num_value, 1)
-
-            # Integer values (counts, RPM, etc.) -
-            # round to integer if close to whole number
-            if num_value.is_integer():
-                return int(num_value)
-
-            # All other numeric values - 2 decimal places for consistency
-            return round(num_value, 2)
-
         except (ValueError, TypeError):
             # Explicitly cast to string to match return type
             return str(raw_value)
 
+        if kind == VALUE_FORMAT_STOPWATCH:
+            return format_seconds_to_readable(num_value)
+
+        if kind == VALUE_FORMAT_ROUNDED:
+            return round(num_value, digits)
+
+        # VALUE_FORMAT_NUMBER: counts, RPM, etc. are integers when whole
+        if num_value.is_integer():
+            return int(num_value)
+        return round(num_value, 2)
+
 
 class VioletStatusSensor(VioletSensor):
     """Represents a sensor for status values that use VioletState."""
 
+    def _data_dependencies(self, entity_description) -> frozenset[str] | None:
+        """Subscribe to the key and its ``*STATE`` companion."""
+        key = entity_description.key
+        return frozenset({key, f"{key}STATE"})
+
     def _resolve_raw_value(self) -> Any | None:
         """Resolve the best raw value, preferring *STATE key with fallback."""
         key = self.entity_description.key
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,6 +19,7 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import EntityCategory
 
+from ..circuit_breaker import CIRCUIT_STATES
 from ..device import VioletPoolDataUpdateCoordinator
 from ..entity import VioletPoolControllerEntity
 
@@ -177,3 +179,50 @@ class VioletAverageLatencySensor(VioletPoolControllerEntity, SensorEntity):
     def native_value(self) -> float | None:
         """Return the average connection latency."""
         return round(self.coordinator.device.average_latency, 0)
+
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the latency percentiles over the same window."""
+        device = self.coordinator.device
+        attributes: dict[str, Any] = {
+            f"p{pct}_ms": round(value, 1) for pct, value in device.latency_percentiles.items()
+        }
+        attributes["samples"] = device.poll_history.latency_samples
+        return attributes
+
+
+class VioletCircuitBreakerSensor(VioletPoolControllerEntity, SensorEntity):
+    """Diagnostic sensor for the state of the API circuit breaker."""
+
+    def __init__(
+        self,
+        coordinator: VioletPoolDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the circuit breaker sensor."""
+        description = SensorEntityDescription(
+            key="api_circuit_state",
+            translation_key="api_circuit_state",
+            name="API Circuit State",
+            icon="mdi:electric-switch",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=SensorDeviceClass.ENUM,
+            options=list(CIRCUIT_STATES),
+            entity_registry_enabled_default=False,
+        )
+        super().__init__(coordinator, config_entry, description)
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the controller is down - that is when it matters."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return closed, open or half_open."""
+        return self.coordinator.device.circuit_breaker.state
+
+    def _extra_attributes(self) -> dict[str, Any]:
+        """Return the failure count and the time until the next probe."""
+        attributes = self.coordinator.device.circuit_breaker.as_dict()
+        attributes.pop("state")
+        return attributes
@@ -77,8 +77,7 @@ class VioletErrorCodeSensor(VioletSensor):
         code = str(self.coordinator.data.get(self.entity_description.key, "")).strip()
         return get_error_info(code)["subject"] if code else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """Return detailed information about the error code as attributes."""
         if self.coordinator.data is None:
             return {}
@@ -223,8 +222,7 @@ class VioletHealthSensor(VioletPoolControllerEntity, SensorEntity):
             return "warning"
         return "ok"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """Return detailed lists of active problems and warnings."""
         if self.coordinator.data is None:
             return {"state": "offline"}
@@ -291,8 +289,7 @@ class VioletActiveErrorsSensor(VioletPoolControllerEntity, SensorEntity):
 
         return " | ".join(error_names)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """Return detailed information about all active errors."""
         if self.coordinator.data is None:
             return {}
@@ -388,8 +385,7 @@ class VioletDosingStateSensor(VioletPoolControllerEntity, SensorEntity):
 
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         raw_value = self.get_value(self.entity_description.key)
 
@@ -449,8 +445,7 @@ class VioletFlowRateSensor(VioletPoolControllerEntity, SensorEntity):
                     continue
         return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str]:
+    def _extra_attributes(self) -> dict[str, str]:
         """Return the raw source values for debugging purposes."""
         if self.coordinator.data is None:
             return {"data_source": "None"}
@@ -618,8 +613,7 @@ class VioletSaturationIndexSensor(VioletPoolControllerEntity, SensorEntity):
         except (ValueError, TypeError):
             return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str | float | bool]:
+    def _extra_attributes(self) -> dict[str, str | float | bool]:
         """Return the input values, interpretation and warning state."""
         try:
             values = self._get_inputs()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from typing import Any
 
@@ -12,10 +14,15 @@ from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
+from .api_trace import ApiTrace
+from .poll_ring import PollRing
 from .service_helpers import (
+    DEFAULT_EXPORT_RESPONSE_KB,
+    ExportStream,
     as_device_id_list,
+    collect_export_text,
     read_recent_violet_log_lines,
-    write_text_file,
+    write_export_file,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +35,7 @@ _POLL_SNAPSHOT_FIELDS = (
     "Flow",
     "Inflow",
 )
+_SENSITIVE_KEYS = ("wifi_password", "password", "key", "token", "secret")
 
 
 class VioletDiagnosticServiceHandlers:
@@ -57,7 +65,13 @@ class VioletDiagnosticServiceHandlers:
         return getattr(device, "device_name", "Unknown")
 
     async def handle_export_diagnostic_logs(self, call: ServiceCall) -> dict[str, Any]:
-        """Handle the export diagnostic logs service."""
+        """Handle the export diagnostic logs service.
+
+        The sections are rendered lazily and streamed in the executor: to a
+        (optionally gzip-compressed) file, or into the response up to
+        ``max_response_kb``. Only the snapshots of the live state are taken
+        on the event loop.
+        """
         device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
         lines = max(10, min(10000, int(call.data.get("lines", 100))))
         include_timestamps = call.data.get("include_timestamps", True)
@@ -66,70 +80,88 @@ class VioletDiagnosticServiceHandlers:
         include_states = call.data.get("include_states", True)
         include_raw_data = call.data.get("include_raw_data", True)
         save_to_file = call.data.get("save_to_file", False)
+        compress = call.data.get("compress", False)
+        max_response_kb = int(call.data.get("max_response_kb", DEFAULT_EXPORT_RESPONSE_KB))
 
         coordinator = await self._get_first_coordinator(device_ids)
 
         try:
-            log_entries: list[str] = []
             device_name = coordinator.device.device_name
+            log_lines: list[str] = []
 
             log_path = self.hass.config.path("home-assistant.log")
             try:
-                log_entries.extend(
-                    await self.hass.async_add_executor_job(
-                        self._read_recent_violet_log_lines,
-                        log_path,
-                        lines,
-                        include_timestamps,
-                    )
+                log_lines = await self.hass.async_add_executor_job(
+                    self._read_recent_violet_log_lines,
+                    log_path,
+                    lines,
+                    include_timestamps,
                 )
             except Exception as err:
                 _LOGGER.warning("Could not read log file: %s", err)
 
-            self._append_system_snapshot(
-                log_entries,
-                coordinator,
-                include_config=include_config,
-                include_history=include_history,
-                include_states=include_states,
-                include_raw_data=include_raw_data,
+            stream = ExportStream(
+                self._export_header(device_name),
+                [
+                    log_lines,
+                    *self._export_sections(
+                        coordinator,
+                        include_config=include_config,
+                        include_history=include_history,
+                        include_states=include_states,
+                        include_raw_data=include_raw_data,
+                    ),
+                ],
             )
 
-            export_text = self._build_export_text(device_name, log_entries)
-
             if save_to_file:
-                filename = f"violet_diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+                suffix = ".txt.gz" if compress else ".txt"
+                filename = (
+                    f"violet_diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}{suffix}"
+                )
                 filepath = self.hass.config.path(filename)
 
                 try:
-                    await self.hass.async_add_executor_job(write_text_file, filepath, export_text)
+                    size = await self.hass.async_add_executor_job(
+                        write_export_file, filepath, stream, compress
+                    )
                 except Exception as err:
                     _LOGGER.error("Failed to save log file: %s", err)
                     raise HomeAssistantError(f"Failed to save log file: {err}") from err
 
                 _LOGGER.info(
-                    "Diagnostic logs exported to file: %s (%d lines)",
+                    "Diagnostic logs exported to file: %s (%d lines, %d bytes)",
                     filename,
-                    len(log_entries),
+                    stream.lines,
+                    size,
                 )
                 return {
                     "success": True,
                     "filename": filename,
                     "filepath": filepath,
-                    "lines_exported": len(log_entries),
-                    "message": f"Logs saved to {filename} ({len(log_entries)} lines)",
+                    "lines_exported": stream.lines,
+                    "bytes_written": size,
+                    "compressed": compress,
+                    "message": f"Logs saved to {filename} ({stream.lines} lines)",
                 }
 
+            export_text, truncated = await self.hass.async_add_executor_job(
+                collect_export_text, stream, max_response_kb * 1024
+            )
+
             _LOGGER.info(
-                "Diagnostic logs exported: %d lines for device %s",
-                len(log_entries),
+                "Diagnostic logs exported: %d lines for device %s%s",
+                stream.lines,
                 device_name,
+                " (truncated)" if truncated else "",
             )
             return {
                 "success": True,
-                "lines_exported": len(log_entries),
+                "lines_exported": stream.lines,
                 "logs": export_text,
-                "message": f"Exported {len(log_entries)} log lines",
+                "truncated": truncated,
+                "message": f"Exported {stream.lines} log lines"
+                + (f" (truncated to {max_response_kb} KB)" if truncated else ""),
             }
 
         except Exception as err:
@@ -138,15 +170,12 @@ class VioletDiagnosticServiceHandlers:
 
     async def handle_get_connection_status(self, call: ServiceCall) -> dict[str, Any]:
         """Handle get connection status diagnostic service."""
-        from .error_handler import get_enhanced_error_handler
-
         device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
         results = []
 
         for device_id in device_ids:
             try:
                 device = await self._get_device_for_id(device_id)
-                error_handler = get_enhanced_error_handler()
 
                 results.append(
                     {
@@ -155,11 +184,14 @@ class VioletDiagnosticServiceHandlers:
                         "available": getattr(device, "_available", False),
                         "last_update": getattr(device, "_last_update_time", 0),
                         "connection_latency_ms": getattr(device, "_connection_latency", 0),
+                        "api_metrics": device.api_metrics_summary(),
+                        "circuit_breaker": device.circuit_breaker.as_dict(),
+                        "stale_data": device.is_stale,
                         "system_health": getattr(device, "_system_health", 0),
                         "consecutive_failures": getattr(device, "_consecutive_failures", 0),
                         "api_url": getattr(device, "api_url", "Unknown"),
                         "use_ssl": getattr(device, "use_ssl", False),
-                        "error_summary": error_handler.get_error_summary(),
+                        "error_summary": device.error_handler.get_error_summary(),
                     }
                 )
 
@@ -175,8 +207,6 @@ class VioletDiagnosticServiceHandlers:
 
     async def handle_get_error_summary(self, call: ServiceCall) -> dict[str, Any]:
         """Handle get error summary diagnostic service."""
-        from .error_handler import get_enhanced_error_handler
-
         device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
         include_history = call.data.get("include_history", False)
         results = []
@@ -184,7 +214,7 @@ class VioletDiagnosticServiceHandlers:
         for device_id in device_ids:
             try:
                 device = await self._get_device_for_id(device_id)
-                error_handler = get_enhanced_error_handler()
+                error_handler = device.error_handler
 
                 result: dict[str, Any] = {
                     "device_name": self._device_label(device),
@@ -209,6 +239,111 @@ class VioletDiagnosticServiceHandlers:
             "message": f"Retrieved error summary for {len(results)} device(s)",
         }
 
+    async def handle_get_poll_profile(self, call: ServiceCall) -> dict[str, Any]:
+        """Return the per-stage timing histograms of the poll cycle."""
+        device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
+        reset = call.data.get("reset", False)
+        results = []
+
+        for device_id in device_ids:
+            try:
+                device = await self._get_device_for_id(device_id)
+                profiler = device.poll_profiler
+                results.append(
+                    {
+                        "device_name": self._device_label(device),
+                        "device_id": device_id,
+                        "profile": profiler.as_dict(),
+                    }
+                )
+                if reset:
+                    profiler.reset()
+
+            except Exception as err:
+                _LOGGER.error("Get poll profile error: %s", err)
+                raise HomeAssistantError(f"Failed to get poll profile: {err}") from err
+
+        return {
+            "success": True,
+            "devices": results,
+            "message": f"Retrieved poll profile for {len(results)} device(s)",
+        }
+
+    async def handle_profile_entities(self, call: ServiceCall) -> dict[str, Any]:
+        """Start, stop or report an entity profiling run.
+
+        ``start`` times the state properties of every entity over the next
+        ``polls`` coordinator updates; ``results`` returns the ``top``
+        entities with the highest mean cost so far.
+        """
+        device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
+        action = call.data.get("action", "results")
+        polls = call.data.get("polls", 10)
+        top = call.data.get("top", 10)
+        results = []
+
+        for device_id in device_ids:
+            try:
+                coordinator = await self.manager.get_coordinator_for_device(device_id)
+                if not coordinator or not hasattr(coordinator, "entity_profiler"):
+                    raise HomeAssistantError(f"Device {device_id} not found")
+                profiler = coordinator.entity_profiler
+                if action == "start":
+                    profiler.start(polls)
+                elif action == "stop":
+                    profiler.stop()
+                results.append(
+                    {
+                        "device_name": self._device_label(coordinator.device),
+                        "device_id": device_id,
+                        "profile": profiler.summary(top),
+                    }
+                )
+
+            except Exception as err:
+                _LOGGER.error("Profile entities error: %s", err)
+                raise HomeAssistantError(f"Failed to profile entities: {err}") from err
+
+        return {
+            "success": True,
+            "devices": results,
+            "message": f"Entity profiling {action} for {len(results)} device(s)",
+        }
+
+    async def handle_get_api_trace(self, call: ServiceCall) -> dict[str, Any]:
+        """Return the most recent controller requests of each device.
+
+        ``endpoint`` narrows the calls to endpoints containing the text, e.g.
+        ``setConfig``; ``limit`` caps the number of calls returned.
+        """
+        device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
+        limit = call.data.get("limit", 50)
+        endpoint = call.data.get("endpoint")
+        results = []
+
+        for device_id in device_ids:
+            try:
+                device = await self._get_device_for_id(device_id)
+                trace = device.api_trace
+                results.append(
+                    {
+                        "device_name": self._device_label(device),
+                        "device_id": device_id,
+                        "summary": trace.summary(),
+                        "calls": trace.entries(limit, endpoint),
+                    }
+                )
+
+            except Exception as err:
+                _LOGGER.error("Get API trace error: %s", err)
+                raise HomeAssistantError(f"Failed to get API trace: {err}") from err
+
+        return {
+            "success": True,
+            "devices": results,
+            "message": f"Retrieved API trace for {len(results)} device(s)",
+        }
+
     async def handle_test_connection(self, call: ServiceCall) -> dict[str, Any]:
         """Handle test connection diagnostic service."""
         import time
@@ -259,15 +394,12 @@ class VioletDiagnosticServiceHandlers:
 
     async def handle_clear_error_history(self, call: ServiceCall) -> dict[str, Any]:
         """Handle clear error history service."""
-        from .error_handler import get_enhanced_error_handler
-
         device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
-        error_handler = get_enhanced_error_handler()
-        error_handler.clear_history()
 
         for device_id in device_ids:
             try:
-                await self._get_device_for_id(device_id)
+                device = await self._get_device_for_id(device_id)
+                device.error_handler.clear_history()
             except Exception as err:
                 _LOGGER.error("Clear error history error: %s", err)
                 raise HomeAssistantError(f"Failed to clear error history: {err}") from err
@@ -359,62 +491,74 @@ class VioletDiagnosticServiceHandlers:
         """Wrapper kept local for stable executor introspection in tests."""
         return read_recent_violet_log_lines(log_path, lines, include_timestamps)
 
-    def _append_system_snapshot(
+    def _export_sections(
         self,
-        log_entries: list[str],
         coordinator: Any,
         *,
         include_config: bool,
         include_history: bool,
         include_states: bool,
         include_raw_data: bool,
-    ) -> None:
-        """Populate fallback diagnostic details when no raw HA logs are found."""
-        log_entries.append("=== Violet Pool Controller Diagnostic Export ===")
-        log_entries.append(f"Device: {coordinator.device.device_name}")
-        log_entries.append(f"Timestamp: {datetime.now().isoformat()}")
-        log_entries.append("")
-        log_entries.append("Controller Information:")
-        log_entries.append(f"  Name: {coordinator.device.controller_name}")
-        log_entries.append(f"  API URL: {coordinator.device.api_url}")
-        log_entries.append(f"  Device ID: {coordinator.device.device_id}")
-        log_entries.append(f"  Available: {coordinator.device.available}")
-        log_entries.append(f"  Firmware: {coordinator.device.firmware_version or 'Unknown'}")
-        log_entries.append(f"  Last Update: {coordinator.device.last_event_age:.1f}s ago")
-        log_entries.append(f"  Connection Latency: {coordinator.device.connection_latency:.1f}ms")
-        log_entries.append(f"  System Health: {coordinator.device.system_health:.0f}%")
-        log_entries.append(f"  Update Counter: {coordinator.device._update_counter}")
-        log_entries.append(f"  Consecutive Failures: {coordinator.device.consecutive_failures}")
-        log_entries.append("")
+    ) -> list[Iterable[str]]:
+        """Return the sections of the system snapshot.
 
-        self._append_system_info(log_entries)
+        Runs on the event loop. The large sections (poll history, entity
+        states, raw data) are generators over copies taken here and are
+        formatted by the executor that writes the export.
+        """
+        device = coordinator.device
+        sections: list[Iterable[str]] = [
+            [
+                "=== Violet Pool Controller Diagnostic Export ===",
+                f"Device: {device.device_name}",
+                f"Timestamp: {datetime.now().isoformat()}",
+                "",
+                "Controller Information:",
+                f"  Name: {device.controller_name}",
+                f"  API URL: {device.api_url}",
+                f"  Device ID: {device.device_id}",
+                f"  Available: {device.available}",
+                f"  Firmware: {device.firmware_version or 'Unknown'}",
+                f"  Last Update: {device.last_event_age:.1f}s ago",
+                f"  Connection Latency: {device.connection_latency:.1f}ms",
+                f"  System Health: {device.system_health:.0f}%",
+                f"  Update Counter: {device._update_counter}",
+                f"  Consecutive Failures: {device.consecutive_failures}",
+                "",
+            ],
+            self._system_info_lines(),
+        ]
 
         if include_config:
-            self._append_config_info(log_entries, coordinator)
-        if include_history:
-            self._append_poll_history(log_entries, coordinator)
+            sections.append(self._config_info_lines(coordinator))
         if include_states:
-            self._append_entity_states(log_entries, coordinator)
+            sections.append(self._entity_states_section(coordinator))
         if include_raw_data:
-            self._append_raw_data(log_entries, coordinator)
-
-        log_entries.append("No detailed log entries found in home-assistant.log.")
-        log_entries.append("Logs may have been rotated or not contain recent entries.")
+            sections.append(self._raw_data_section(coordinator))
+        sections.append(self._api_trace_section(coordinator))
+        # Last: with the persisted history this is the longest section.
+        if include_history:
+            sections.append(self._poll_history_section(coordinator))
 
+        footer = [
+            "No detailed log entries found in home-assistant.log.",
+            "Logs may have been rotated or not contain recent entries.",
+        ]
         try:
             logger = logging.getLogger("custom_components.violet_pool_controller")
             if logger.getEffectiveLevel() > logging.DEBUG:
-                log_entries.append("")
-                log_entries.append("NOTE: Debug logging is currently disabled.")
-                log_entries.append(
-                    "To see more details, enable debug logging for this integration."
-                )
+                footer.append("")
+                footer.append("NOTE: Debug logging is currently disabled.")
+                footer.append("To see more details, enable debug logging for this integration.")
         except Exception as err:
             _LOGGER.debug("Failed to check debug logging status: %s", err)
+        sections.append(footer)
 
-    def _append_system_info(self, log_entries: list[str]) -> None:
-        """Append generic Home Assistant system information."""
-        log_entries.append("System Information:")
+        return sections
+
+    def _system_info_lines(self) -> list[str]:
+        """Return generic Home Assistant system information."""
+        log_entries = ["System Information:"]
         try:
             log_entries.append(f"  Home Assistant: {HA_VERSION}")
 
@@ -443,11 +587,12 @@ class VioletDiagnosticServiceHandlers:
             log_entries.append(f"  Error retrieving system info: {err}")
 
         log_entries.append("")
+        return log_entries
 
-    def _append_config_info(self, log_entries: list[str], coordinator: Any) -> None:
-        """Append sanitized configuration details."""
+    def _config_info_lines(self, coordinator: Any) -> list[str]:
+        """Return sanitized configuration details."""
         if not hasattr(coordinator, "config_entry") or not coordinator.config_entry:
-            return
+            return []
 
         from .const import (
             CONF_ACTIVE_FEATURES,
@@ -464,7 +609,7 @@ class VioletDiagnosticServiceHandlers:
         from .const_features import AVAILABLE_FEATURES
 
         config = coordinator.config_entry.data
-        log_entries.append("Configuration Settings:")
+        log_entries = ["Configuration Settings:"]
 
         safe_keys = {
             "Polling Interval": CONF_POLLING_INTERVAL,
@@ -503,124 +648,81 @@ class VioletDiagnosticServiceHandlers:
             log_entries.append(f"  Selected Sensors: {len(sensors)} enabled")
 
         log_entries.append("")
+        return log_entries
 
     @staticmethod
-    def _append_poll_history(log_entries: list[str], coordinator: Any) -> None:
-        """Append recent polling history when available."""
-        if not hasattr(coordinator.device, "_first_poll") or not coordinator.device._first_poll:
-            return
-
-        log_entries.append("Polling History:")
-        log_entries.append(
-            f"  First Poll: {coordinator.device._first_poll.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+    def _poll_history_section(coordinator: Any) -> Iterable[str]:
+        """Return the polling history when available.
 
-        if hasattr(coordinator.device, "_poll_history") and coordinator.device._poll_history:
-            history = coordinator.device._poll_history
-            log_entries.append(f"  Last {len(history)} Polls:")
-            for item in history:
-                if len(item) == 4:
-                    timestamp, count, latency, snapshot = item
-                    details = []
-                    if isinstance(snapshot, dict):
-                        for key in _POLL_SNAPSHOT_FIELDS:
-                            if key in snapshot:
-                                details.append(f"{key}: {snapshot[key]}")
-                    else:
-                        for key, value in zip(_POLL_SNAPSHOT_FIELDS, snapshot):
-                            if value is not None:
-                                details.append(f"{key}: {value}")
-
-                    detail_str = " | ".join(details)
-                    log_entries.append(
-                        f"    - {timestamp.strftime('%H:%M:%S')}:"
-                        f" {count} items ({latency:.1f}ms) -> {detail_str}"
-                    )
-                else:
-                    timestamp, count, latency = item
-                    log_entries.append(
-                        f"    - {timestamp.strftime('%H:%M:%S')}: {count} items ({latency:.1f}ms)"
-                    )
-        else:
-            log_entries.append("  No history available.")
-
-        log_entries.append("")
+        The persisted ring file covers earlier sessions too and is read by
+        the executor; without it the in-memory history of this session is
+        used.
+        """
+        ring = getattr(coordinator.device, "poll_ring", None)
+        if isinstance(ring, PollRing):
+            return _iter_ring_history(ring)
+        first_poll = getattr(coordinator.device, "_first_poll", None)
+        if not first_poll:
+            return []
+        history = getattr(coordinator.device, "_poll_history", None)
+        return _iter_poll_history(first_poll, list(history) if history else [])
 
-    def _append_entity_states(self, log_entries: list[str], coordinator: Any) -> None:
-        """Append entity state dump for the config entry."""
+    @staticmethod
+    def _api_trace_section(coordinator: Any) -> Iterable[str]:
+        """Return the most recent controller requests."""
+        trace = getattr(coordinator.device, "api_trace", None)
+        if not isinstance(trace, ApiTrace) or not len(trace):
+            return []
+        return _iter_api_trace(trace.entries())
+
+    def _entity_states_section(self, coordinator: Any) -> Iterable[str]:
+        """Return the entity state dump for the config entry."""
         try:
             if not hasattr(coordinator, "config_entry") or not coordinator.config_entry:
-                return
+                return []
 
             entry_id = coordinator.config_entry.entry_id
             registry = er.async_get(self.hass)
             entities = er.async_entries_for_config_entry(registry, entry_id)
 
             if not entities:
-                return
-
-            log_entries.append("Entity States:")
-            sorted_entities = sorted(entities, key=lambda entity: entity.entity_id)
-
-            for entity in sorted_entities:
-                state = self.hass.states.get(entity.entity_id)
-                if state:
-                    attrs = dict(state.attributes)
-                    attr_str = str(attrs)
-                    if len(attr_str) > 200:
-                        attr_str = attr_str[:197] + "..."
+                return []
 
-                    log_entries.append(f"  - {entity.entity_id}: {state.state} (attrs: {attr_str})")
-                else:
-                    log_entries.append(f"  - {entity.entity_id}: <No State>")
-
-            log_entries.append("")
+            # State objects are immutable, so they can be formatted later.
+            states = [
+                (entity.entity_id, self.hass.states.get(entity.entity_id))
+                for entity in sorted(entities, key=lambda entity: entity.entity_id)
+            ]
         except Exception as err:
             _LOGGER.warning("Could not dump entity states: %s", err)
-            log_entries.append(f"Error dumping entity states: {err}")
-            log_entries.append("")
+            return [f"Error dumping entity states: {err}", ""]
+
+        return _iter_entity_states(states)
 
     @staticmethod
-    def _append_raw_data(log_entries: list[str], coordinator: Any) -> None:
-        """Append redacted raw coordinator data."""
+    def _raw_data_section(coordinator: Any) -> Iterable[str]:
+        """Return the redacted raw coordinator data."""
         try:
-            import json
-
             if not hasattr(coordinator, "data") or not coordinator.data:
-                return
-
-            log_entries.append("Latest Raw Data:")
+                return []
             raw_data = dict(coordinator.data)
-            sensitive_keys = ["wifi_password", "password", "key", "token", "secret"]
-
-            redacted_data = {}
-            for key, value in raw_data.items():
-                lower_key = str(key).lower()
-                if any(sensitive in lower_key for sensitive in sensitive_keys):
-                    redacted_data[key] = "***REDACTED***"
-                else:
-                    redacted_data[key] = value
-
-            log_entries.append(json.dumps(redacted_data, indent=2, default=str, sort_keys=True))
-            log_entries.append("")
         except Exception as err:
             _LOGGER.warning("Could not dump raw data: %s", err)
-            log_entries.append(f"Error dumping raw data: {err}")
-            log_entries.append("")
+            return [f"Error dumping raw data: {err}", ""]
+
+        return _iter_raw_data(raw_data)
 
     @staticmethod
-    def _build_export_text(device_name: str, log_entries: list[str]) -> str:
-        """Build the final exported text block."""
-        export_header = f"""
+    def _export_header(device_name: str) -> str:
+        """Build the header of the exported text."""
+        return f"""
 {"=" * 80}
 Violet Pool Controller - Diagnostic Log Export
 {"=" * 80}
 Device: {device_name}
 Exported: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Lines: {len(log_entries)}
 {"=" * 80}
 """
-        return export_header + "\n".join(log_entries)
 
     # ------------------------------------------------------------------
     # Maintenance: fault-blocking + canister management
@@ -634,8 +736,6 @@ Lines: {len(log_entries)}
         reboot.  Equivalent to the "Reset" button on the controller's web UI
         error page.
         """
-        from .error_handler import get_enhanced_error_handler
-
         device_ids = as_device_id_list(call.data[ATTR_DEVICE_ID])
         cleared_count = 0
 
@@ -644,7 +744,7 @@ Lines: {len(log_entries)}
                 device = await self._get_device_for_id(device_id)
                 await device.api.reset_blocking()
                 # Also clear our local error history so stale alarms disappear.
-                get_enhanced_error_handler().clear_history()
+                device.error_handler.clear_history()
                 cleared_count += 1
             except Exception as err:
                 _LOGGER.error("reset_blocking error for %s: %s", device_id, err)
@@ -812,3 +912,95 @@ Lines: {len(log_entries)}
             _LOGGER.error("get_live_trace error: %s", err)
             raise HomeAssistantError(f"Failed to fetch live trace: {err}") from err
         return {"success": True, "snapshot": snapshot, "field_count": len(snapshot)}
+
+
+def _iter_poll_history(first_poll: datetime, history: list[Any]) -> Iterator[str]:
+    """Yield the polling history section."""
+    yield "Polling History:"
+    yield f"  First Poll: {first_poll.strftime('%Y-%m-%d %H:%M:%S')}"
+
+    if history:
+        yield f"  Last {len(history)} Polls:"
+        for item in history:
+            if len(item) == 4:
+                timestamp, count, latency, snapshot = item
+                details = []
+                if isinstance(snapshot, dict):
+                    for key in _POLL_SNAPSHOT_FIELDS:
+                        if key in snapshot:
+                            details.append(f"{key}: {snapshot[key]}")
+                else:
+                    for key, value in zip(_POLL_SNAPSHOT_FIELDS, snapshot):
+                        if value is not None:
+                            details.append(f"{key}: {value}")
+
+                detail_str = " | ".join(details)
+                yield (
+                    f"    - {timestamp.strftime('%H:%M:%S')}:"
+                    f" {count} items ({latency:.1f}ms) -> {detail_str}"
+                )
+            else:
+                timestamp, count, latency = item
+                yield f"    - {timestamp.strftime('%H:%M:%S')}: {count} items ({latency:.1f}ms)"
+    else:
+        yield "  No history available."
+
+    yield ""
+
+
+def _iter_ring_history(ring: PollRing) -> Iterator[str]:
+    """Yield the polling history stored in the ring file."""
+    history = ring.records()
+    if history:
+        yield from _iter_poll_history(history[0][0], history)
+
+
+def _iter_api_trace(calls: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield the API trace section, oldest call first."""
+    yield f"API Trace (last {len(calls)} requests):"
+    for call in calls:
+        params = f" [{call['params']}]" if call["params"] else ""
+        streak = call["failed_poll_streak"]
+        failed = f" after {streak} failed polls" if streak else ""
+        yield (
+            f"  - {call['time']}: {call['method']} {call['endpoint']}{params}"
+            f" -> {call['status']} {call['bytes']} B {call['duration_ms']:.1f}ms{failed}"
+        )
+    yield ""
+
+
+def _iter_entity_states(states: list[tuple[str, Any]]) -> Iterator[str]:
+    """Yield the entity state dump."""
+    yield "Entity States:"
+    for entity_id, state in states:
+        if state:
+            attr_str = str(dict(state.attributes))
+            if len(attr_str) > 200:
+                attr_str = attr_str[:197] + "..."
+
+            yield f"  - {entity_id}: {state.state} (attrs: {attr_str})"
+        else:
+            yield f"  - {entity_id}: <No State>"
+    yield ""
+
+
+def _iter_raw_data(raw_data: dict[str, Any]) -> Iterator[str]:
+    """Yield the redacted raw data as indented JSON, line by line."""
+    yield "Latest Raw Data:"
+    redacted_data = {}
+    for key, value in raw_data.items():
+        lower_key = str(key).lower()
+        if any(sensitive in lower_key for sensitive in _SENSITIVE_KEYS):
+            redacted_data[key] = "***REDACTED***"
+        else:
+            redacted_data[key] = value
+
+    encoder = json.JSONEncoder(indent=2, default=str, sort_keys=True)
+    pending = ""
+    for fragment in encoder.iterencode(redacted_data):
+        pending += fragment
+        if "\n" in pending:
+            *complete, pending = pending.split("\n")
+            yield from complete
+    yield pending
+    yield ""
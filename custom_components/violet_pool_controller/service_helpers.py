@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import gzip
 import os
-from collections.abc import Iterable
-from typing import Any, TextIO
+from collections.abc import Iterable, Iterator
+from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -62,34 +63,77 @@ MAX_TEMPERATURE = 40.0
 MIN_PH = 6.8
 MAX_PH = 7.8
 DEFAULT_SAFETY_INTERVAL = 300
-
-
-def _tail_file(file_handle: TextIO, line_count: int) -> list[str]:
-    """Read only the tail of a file without loading the entire file."""
-    file_handle.seek(0, os.SEEK_END)
-    file_size = file_handle.tell()
-    buffer_size = min(file_size, max(8192, line_count * 200))
-    file_handle.seek(max(0, file_size - buffer_size))
-    lines = file_handle.readlines()
-    if file_size > buffer_size:
-        lines = lines[-line_count:]
-    return lines
+# Backwards scan of home-assistant.log (see read_recent_violet_log_lines).
+LOG_SCAN_BLOCK_SIZE = 64 * 1024
+LOG_SCAN_BYTE_BUDGET = 32 * 1024 * 1024
+LOG_SCAN_MAX_LINE = 64 * 1024
+# Size cap of an export returned in the service response (save_to_file=False).
+DEFAULT_EXPORT_RESPONSE_KB = 512
+MAX_EXPORT_RESPONSE_KB = 8192
+EXPORT_TRUNCATED_MARKER = "\n... export truncated, use save_to_file for the full export ...\n"
+
+
+def _iter_lines_reversed(path: str, byte_budget: int) -> Iterator[bytes]:
+    """Yield the lines of a file from the last to the first.
+
+    Fixed-size blocks are read backwards from the end of the file, so memory
+    stays at one block plus one line however large the file is. Scanning
+    stops after ``byte_budget`` bytes; the partial line at that point is
+    dropped, as are lines longer than ``LOG_SCAN_MAX_LINE``.
+    """
+    with open(path, "rb") as log_file:
+        position = log_file.seek(0, os.SEEK_END)
+        stop = max(0, position - byte_budget)
+        carry = b""
+        oversized = False
+        while position > stop:
+            size = min(LOG_SCAN_BLOCK_SIZE, position - stop)
+            position -= size
+            log_file.seek(position)
+            parts = (log_file.read(size) + carry).split(b"\n")
+            # The first part may continue in the block before this one.
+            carry = parts[0]
+            for line in reversed(parts[1:]):
+                if oversized:
+                    oversized = False
+                    continue
+                yield line
+            if len(carry) > LOG_SCAN_MAX_LINE:
+                carry = b""
+                oversized = True
+        if position == 0 and not oversized:
+            yield carry
 
 
 def read_recent_violet_log_lines(
     log_path: str,
     lines: int,
     include_timestamps: bool,
+    *,
+    byte_budget: int = LOG_SCAN_BYTE_BUDGET,
+    include_rotated: bool = True,
 ) -> list[str]:
-    """Read the most recent Violet-related log lines from disk."""
-    if not os.path.exists(log_path):
-        return []
-
-    with open(log_path, encoding="utf-8", errors="ignore") as log_file:
-        tail_lines = _tail_file(log_file, lines * 10)
-
-    violet_lines = [line for line in tail_lines if "violet_pool_controller" in line.lower()]
-    recent_lines = violet_lines[-lines:] if len(violet_lines) > lines else violet_lines
+    """Read the most recent Violet-related log lines from disk.
+
+    The log is scanned backwards until ``lines`` matching lines are found or
+    ``byte_budget`` bytes have been read, continuing in the rotated
+    ``<log_path>.1`` if the current log runs out first.
+    """
+    paths = [log_path, f"{log_path}.1"] if include_rotated else [log_path]
+    matches: list[bytes] = []
+    remaining = byte_budget
+
+    for path in paths:
+        if len(matches) >= lines or remaining <= 0 or not os.path.exists(path):
+            break
+        for line in _iter_lines_reversed(path, remaining):
+            if b"violet_pool_controller" in line.lower():
+                matches.append(line)
+                if len(matches) >= lines:
+                    break
+        remaining -= os.path.getsize(path)
+
+    recent_lines = [line.decode("utf-8", errors="ignore") for line in reversed(matches)]
 
     if include_timestamps:
         return [line.rstrip() for line in recent_lines]
@@ -99,7 +143,66 @@ def read_recent_violet_log_lines(
     return [re.sub(r"^\[?\d{4}-\d{2}-\d{2}[^]]*\]?\s*", "", line).rstrip() for line in recent_lines]
 
 
-def write_text_file(filepath: str, content: str) -> None:
-    """Write text content to disk."""
-    with open(filepath, "w", encoding="utf-8") as output_file:
-        output_file.write(content)
+class ExportStream:
+    """Lazily rendered text of a diagnostic export.
+
+    Iterating yields the header and then every line of every section as a
+    newline-terminated chunk, so a section may be a generator that formats
+    its lines only when the writer reaches it. ``lines`` counts the section
+    lines yielded so far.
+    """
+
+    def __init__(self, header: str, sections: Iterable[Iterable[str]]) -> None:
+        """Initialize the stream.
+
+        Args:
+            header: Text written before the first section.
+            sections: Line iterables, rendered in order.
+        """
+        self._header = header
+        self._sections = sections
+        self.lines = 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the export text chunk by chunk."""
+        yield self._header
+        for section in self._sections:
+            for line in section:
+                self.lines += 1
+                yield line + "\n"
+
+
+def write_export_file(filepath: str, chunks: Iterable[str], compress: bool = False) -> int:
+    """Stream export chunks to disk, gzip-compressed if requested.
+
+    Returns:
+        The size of the written file in bytes.
+    """
+    if compress:
+        with gzip.open(filepath, "wt", encoding="utf-8") as output_file:
+            output_file.writelines(chunks)
+    else:
+        with open(filepath, "w", encoding="utf-8") as output_file:
+            output_file.writelines(chunks)
+    return os.path.getsize(filepath)
+
+
+def collect_export_text(chunks: Iterable[str], max_bytes: int) -> tuple[str, bool]:
+    """Join export chunks until their UTF-8 size reaches ``max_bytes``.
+
+    The chunks after the cap are never rendered.
+
+    Returns:
+        The text and whether it was truncated.
+    """
+    parts: list[str] = []
+    size = 0
+    for chunk in chunks:
+        encoded = chunk.encode("utf-8")
+        if size + len(encoded) > max_bytes:
+            parts.append(encoded[: max_bytes - size].decode("utf-8", errors="ignore"))
+            parts.append(EXPORT_TRUNCATED_MARKER)
+            return "".join(parts), True
+        parts.append(chunk)
+        size += len(encoded)
+    return "".join(parts), False
@@ -12,7 +12,6 @@ from violet_poolcontroller_api.api import VioletPoolAPIError
 from ..const import (
     ACTION_AUTO,
 )
-from ..http_control import VioletControlClient
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -105,7 +104,7 @@ class ClimateServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 if action == "on":
@@ -133,7 +132,7 @@ class ClimateServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 if action == "on":
@@ -190,7 +189,7 @@ class ClimateServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Temperature rule %d configured on %s",
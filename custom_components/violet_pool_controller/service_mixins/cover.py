@@ -9,7 +9,6 @@ from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from violet_poolcontroller_api.api import VioletPoolAPIError
 
-from ..http_control import VioletControlClient
 from ..service_helpers import (
     DEFAULT_SAFETY_INTERVAL,
 )
@@ -63,7 +62,7 @@ class CoverServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 if action == "open":
@@ -103,7 +102,7 @@ class CoverServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 if action == "fill":
@@ -13,7 +13,6 @@ from ..const import (
     ACTION_OFF,
     DEVICE_PARAMETERS,
 )
-from ..http_control import VioletControlClient
 from ..service_helpers import (
     DEFAULT_SAFETY_INTERVAL,
     DOSING_API_MAPPING,
@@ -153,7 +152,7 @@ class DosingServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 # Enforce the cooldown before dispatching any dosing command.
@@ -214,7 +213,7 @@ class DosingServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 await control.set_config({full_key: value})
@@ -249,7 +248,7 @@ class DosingServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 await control.set_config({key: target_value})
@@ -286,7 +285,7 @@ class DosingServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 await control.set_config(config_updates)
@@ -318,7 +317,7 @@ class DosingServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 await control.set_config({key: max_ml})
@@ -350,7 +349,7 @@ class DosingServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 await control.set_config({key: value})
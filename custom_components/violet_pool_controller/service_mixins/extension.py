@@ -18,7 +18,6 @@ from ..const import (
     ACTION_OFF,
     ACTION_ON,
 )
-from ..http_control import VioletControlClient
 from ..service_helpers import (
     as_device_id_list,
 )
@@ -223,7 +222,7 @@ class ExtensionServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
 
                 if state is not None:
                     await control.set_function_manually(f"EXT{relay_id}_1", str(state), duration)
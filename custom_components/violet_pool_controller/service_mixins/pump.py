@@ -14,7 +14,6 @@ from ..const import (
     ACTION_OFF,
     ACTION_ON,
 )
-from ..http_control import VioletControlClient
 from ..service_helpers import (
     DEFAULT_SAFETY_INTERVAL,
 )
@@ -138,7 +137,7 @@ class PumpServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 if force_off:
@@ -185,7 +184,7 @@ class PumpServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 device_name = coordinator.device.device_name
 
                 if action == "run":
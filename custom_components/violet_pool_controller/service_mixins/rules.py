@@ -10,7 +10,6 @@ from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from violet_poolcontroller_api.api import VioletPoolAPIError
 
-from ..http_control import VioletControlClient
 from ..service_helpers import (
     as_device_id_list,
 )
@@ -136,7 +135,7 @@ class RulesServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Analog rule %d configured on %s",
@@ -176,7 +175,7 @@ class RulesServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Switching rule %d configured on %s",
@@ -216,7 +215,7 @@ class RulesServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Timer rule %d configured on %s",
@@ -250,7 +249,7 @@ class RulesServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config({key: value})
                 state = "enabled" if enabled else "disabled"
                 _LOGGER.info(
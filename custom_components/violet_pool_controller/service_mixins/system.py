@@ -10,7 +10,6 @@ from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from violet_poolcontroller_api.api import VioletPoolAPIError
 
-from ..http_control import VioletControlClient
 from ..service_helpers import (
     as_device_id_list,
 )
@@ -118,7 +117,7 @@ class SystemServiceHandlersMixin:
 
         for coordinator in coordinators:
             try:
-                control = VioletControlClient(coordinator.device.api)
+                control = coordinator.device.control_client()
                 await control.set_config(config_updates)
                 _LOGGER.info(
                     "Sensor %d calibration configured on %s",
@@ -6,11 +6,14 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.const import ATTR_DEVICE_ID, ATTR_ENTITY_ID
 
+from .const import API_TRACE_SIZE
 from .refill_overflow_schemas import get_refill_overflow_schemas
 from .service_helpers import (
+    DEFAULT_EXPORT_RESPONSE_KB,
     DEVICE_ID_SELECTOR,
     DOSING_TYPE_MAPPING,
     MAX_DOSING_DURATION,
+    MAX_EXPORT_RESPONSE_KB,
     MAX_PUMP_SPEED,
     MIN_DOSING_DURATION,
     MIN_PUMP_SPEED,
@@ -247,6 +250,10 @@ def get_service_schemas() -> dict[str, vol.Schema]:
                 vol.Optional("include_states", default=True): cv.boolean,
                 vol.Optional("include_raw_data", default=True): cv.boolean,
                 vol.Optional("save_to_file", default=False): cv.boolean,
+                vol.Optional("compress", default=False): cv.boolean,
+                vol.Optional("max_response_kb", default=DEFAULT_EXPORT_RESPONSE_KB): vol.All(
+                    vol.Coerce(int), vol.Range(min=16, max=MAX_EXPORT_RESPONSE_KB)
+                ),
             }
         ),
         "get_connection_status": vol.Schema({vol.Required(ATTR_DEVICE_ID): DEVICE_ID_SELECTOR}),
@@ -256,6 +263,33 @@ def get_service_schemas() -> dict[str, vol.Schema]:
                 vol.Optional("include_history", default=False): cv.boolean,
             }
         ),
+        "get_poll_profile": vol.Schema(
+            {
+                vol.Required(ATTR_DEVICE_ID): DEVICE_ID_SELECTOR,
+                vol.Optional("reset", default=False): cv.boolean,
+            }
+        ),
+        "profile_entities": vol.Schema(
+            {
+                vol.Required(ATTR_DEVICE_ID): DEVICE_ID_SELECTOR,
+                vol.Optional("action", default="results"): vol.In(["start", "results", "stop"]),
+                vol.Optional("polls", default=10): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=100)
+                ),
+                vol.Optional("top", default=10): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=100)
+                ),
+            }
+        ),
+        "get_api_trace": vol.Schema(
+            {
+                vol.Required(ATTR_DEVICE_ID): DEVICE_ID_SELECTOR,
+                vol.Optional("limit", default=50): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=API_TRACE_SIZE)
+                ),
+                vol.Optional("endpoint"): cv.string,
+            }
+        ),
         "test_connection": vol.Schema({vol.Required(ATTR_DEVICE_ID): DEVICE_ID_SELECTOR}),
         "clear_error_history": vol.Schema({vol.Required(ATTR_DEVICE_ID): DEVICE_ID_SELECTOR}),
         # NEW HTTP-based control services (Direct setFunctionManually API)
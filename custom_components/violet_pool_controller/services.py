@@ -190,6 +190,30 @@ async def async_register_services(hass: HomeAssistant) -> None:
         supports_response=SupportsResponse.ONLY,
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        "get_poll_profile",
+        handlers.handle_get_poll_profile,
+        schema=schemas.get("get_poll_profile"),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "profile_entities",
+        handlers.handle_profile_entities,
+        schema=schemas.get("profile_entities"),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_api_trace",
+        handlers.handle_get_api_trace,
+        schema=schemas.get("get_api_trace"),
+        supports_response=SupportsResponse.ONLY,
+    )
+
     hass.services.async_register(
         DOMAIN,
         "test_connection",
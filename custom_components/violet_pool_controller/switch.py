@@ -39,6 +39,7 @@ from .entity import VioletPoolControllerEntity, get_state_attributes, interpret_
 from .entity_cleanup import track_provided_entities
 from .entity_names import EntityNameResolver
 from .entity_selection import async_get_selection
+from .key_index import classify_key
 from .runtime_data import SERVICE_MANAGER_KEY
 from .service_helpers import MAX_DOSING_DURATION
 
@@ -99,6 +100,8 @@ class VioletSwitch(VioletPoolControllerEntity, SwitchEntity):
     """Switch with change-only logging and thread safety."""
 
     entity_description: SwitchEntityDescription
+    # Named through EntityNameResolver in async_setup_entry.
+    _follow_hardware_name = True
 
     def __init__(
         self,
@@ -190,8 +193,7 @@ class VioletSwitch(VioletPoolControllerEntity, SwitchEntity):
 
         return result
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _extra_attributes(self) -> dict[str, Any]:
         """
         Return additional state attributes with descriptive status information.
 
@@ -531,6 +533,8 @@ class VioletSwitch(VioletPoolControllerEntity, SwitchEntity):
 
                 self._optimistic_state = action == ACTION_ON
                 self.async_write_ha_state()
+                # The output's runtime counter starts or stops moving now.
+                self.device.request_runtimes_refresh()
 
                 _LOGGER.debug(
                     "Optimistic update: %s = %s (local cache, coordinator.data not mutated)",
@@ -798,7 +802,8 @@ async def async_setup_entry(
             entity_registry_enabled_default=entity_enabled_default,
         )
 
-        feature_id = switch_config.get("feature_id")
+        # An explicit feature_id (even None) wins over the key classification.
+        feature_id = switch_config.get("feature_id", classify_key(description.key).feature)
 
         if feature_id and feature_id not in active_features:
             _LOGGER.debug(
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the memoized key classification index.
+
+Compares classifying every key of a payload from scratch (feature, sub-device
+group and sensor traits, as every platform setup and reload used to do) with
+the warm index in key_index.py. Run from the repository root inside the test
+environment:
+
+    python scripts/bench_key_index.py
+"""
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+from typing import Any
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from custom_components.violet_pool_controller.device_hierarchy import (  # noqa: E402
+    match_group,
+)
+from custom_components.violet_pool_controller.feature_keys import (  # noqa: E402
+    feature_for_key,
+)
+from custom_components.violet_pool_controller.key_index import (  # noqa: E402
+    classify_key,
+    clear_key_index,
+    sensor_traits,
+)
+from custom_components.violet_pool_controller.sensor_modules.base import (  # noqa: E402
+    _is_boolean_value,
+    derive_sensor_traits,
+)
+
+ROUNDS = 50
+
+
+def build_payload(size: int) -> dict[str, Any]:
+    """Return a payload of ``size`` keys with a typical key mix.
+
+    Same mix as scripts/bench_module_classifier.py: system values, analog
+    inputs, dosing, extension relays, digital input rules and runtimes.
+    """
+    payload: dict[str, Any] = {}
+    index = 0
+    while len(payload) < size:
+        bucket = index % 20
+        if bucket == 0:
+            payload[f"SYSTEM_value_{index}"] = f"{index}.5"
+        elif bucket < 10:
+            payload[f"ADC{index}_value"] = f"{index}.25"
+        elif bucket < 13:
+            payload[f"DOS_{index}_CL_STATE"] = "N/A" if bucket == 10 else "1"
+        elif bucket == 13:
+            payload[f"EXT1_{index}"] = 0
+        elif bucket == 14:
+            payload[f"onewire{index}_value"] = "24.5"
+        elif bucket == 15:
+            payload[f"DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_{index}"] = 0
+        else:
+            payload[f"PUMP_{index}_RUNTIME"] = "00h 10m"
+        index += 1
+    return payload
+
+
+def uncached_pass(payload: dict[str, Any]) -> None:
+    """Classify every key from scratch."""
+    for key, value in payload.items():
+        feature_for_key(key)
+        match_group(key)
+        derive_sensor_traits(key, _is_boolean_value(value))
+
+
+def indexed_pass(payload: dict[str, Any]) -> None:
+    """Classify every key through the index."""
+    for key, value in payload.items():
+        classify_key(key)
+        sensor_traits(key, _is_boolean_value(value))
+
+
+def main() -> None:
+    """Time both approaches on a real-sized and a synthetic payload."""
+    print(f"{'keys':>6}  {'uncached ms':>11}  {'indexed ms':>10}  {'speed-up':>8}")
+    for size in (400, 4000):
+        payload = build_payload(size)
+        clear_key_index()
+        indexed_pass(payload)
+
+        uncached = timeit.timeit(lambda: uncached_pass(payload), number=ROUNDS)
+        indexed = timeit.timeit(lambda: indexed_pass(payload), number=ROUNDS)
+        uncached_ms = uncached / ROUNDS * 1e3
+        indexed_ms = indexed / ROUNDS * 1e3
+        print(f"{size:>6}  {uncached_ms:>11.2f}  {indexed_ms:>10.2f}  {uncached_ms / indexed_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
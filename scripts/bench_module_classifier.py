@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the hardware module detection in device.py.
+
+Compares the former per-module ``any(k.startswith(...))`` scans plus the
+full-payload restore loop with the single-pass classifier and the cached
+prefix index. Run from the repository root inside the test environment:
+
+    python scripts/bench_module_classifier.py
+"""
+# ruff: noqa: T201
+
+from __future__ import annotations
+
+import os
+import sys
+import timeit
+from typing import Any
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from custom_components.violet_pool_controller.device import (  # noqa: E402
+    MODULE_KEY_PREFIXES,
+    _classify_module_keys,
+    _is_valid_value,
+)
+
+ROUNDS = 2000
+
+
+def build_payload(size: int) -> dict[str, Any]:
+    """Return a payload of ``size`` keys with a typical module/key mix.
+
+    Modelled on a real ~400-key getReadings response from a controller with
+    the dosing module, extension board 1 and digital input rules, but without
+    DMX. Module keys sit in the middle of the payload, as they do in the
+    firmware's output order. Larger sizes repeat the mix with numbered keys.
+    """
+    payload: dict[str, Any] = {}
+    index = 0
+    while len(payload) < size:
+        bucket = index % 20
+        if bucket == 0:
+            payload[f"SYSTEM_value_{index}"] = f"{index}.5"
+        elif bucket < 10:
+            payload[f"ADC{index}_value"] = f"{index}.25"
+        elif bucket < 13:
+            payload[f"DOS_{index}_CL_STATE"] = "N/A" if bucket == 10 else "1"
+        elif bucket == 13:
+            payload[f"EXT1_{index}"] = 0
+        elif bucket == 14:
+            payload[f"EXT2_{index}"] = 1
+        elif bucket == 15:
+            payload[f"DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_{index}"] = 0
+        else:
+            payload[f"PUMP_{index}_RUNTIME"] = "00h 10m"
+        index += 1
+    return payload
+
+
+def legacy_detection(data: dict[str, Any], previous: dict[str, Any]) -> None:
+    """Reproduce the former detection: one scan per module, one per restore."""
+    present = {
+        tag: any(k.startswith(prefix) and _is_valid_value(v) for k, v in data.items())
+        for tag, prefix in MODULE_KEY_PREFIXES
+    }
+    for tag, prefix in MODULE_KEY_PREFIXES:
+        if not present[tag]:
+            for prev_key, prev_val in previous.items():
+                if prev_key.startswith(prefix) and prev_key not in data:
+                    data[prev_key] = prev_val
+
+
+def indexed_detection(
+    data: dict[str, Any], previous: dict[str, Any], index: dict[str, list[str]]
+) -> None:
+    """The current detection: one classification pass plus indexed restore."""
+    buckets, present = _classify_module_keys(data)
+    for tag, _prefix in MODULE_KEY_PREFIXES:
+        if tag not in present:
+            for key in index.get(tag, ()):
+                if key in previous and key not in data:
+                    data[key] = previous[key]
+
+
+def main() -> None:
+    """Time both implementations on a real-sized and a synthetic payload."""
+    print(f"{'keys':>6}  {'legacy µs':>10}  {'indexed µs':>10}  {'speed-up':>8}")
+    for size in (400, 4000):
+        previous = build_payload(size)
+        index, _present = _classify_module_keys(previous)
+        # Extension board 2 dropped out of this poll, so its keys are restored.
+        current = {k: v for k, v in previous.items() if not k.startswith("EXT2_")}
+
+        legacy = timeit.timeit(lambda: legacy_detection(dict(current), previous), number=ROUNDS)
+        indexed = timeit.timeit(
+            lambda: indexed_detection(dict(current), previous, index), number=ROUNDS
+        )
+        legacy_us = legacy / ROUNDS * 1e6
+        indexed_us = indexed / ROUNDS * 1e6
+        print(f"{size:>6}  {legacy_us:>10.1f}  {indexed_us:>10.1f}  {legacy_us / indexed_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,10 @@ Regression coverage for three bugs in the previous "dynamic polling" logic:
    after the first update.
 3. Polling was sped up to half the configured interval whenever the pump ran,
    i.e. the configured value was not respected as the fastest rate.
+
+The scheduler tests at the end cover the trend tracking: moving chemistry
+readings or an alarm flip cancel the idle back-off, and long calm periods
+stretch the interval further.
 """
 
 from __future__ import annotations
@@ -22,7 +26,10 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.violet_pool_controller.const import (
+    ADAPTIVE_ALARM_HOLD_POLLS,
     ADAPTIVE_IDLE_MAX_INTERVAL,
+    ADAPTIVE_STABLE_MAX_INTERVAL,
+    ADAPTIVE_STABLE_POLLS,
     CONF_ADAPTIVE_POLLING,
     CONF_API_URL,
     CONF_CONTROLLER_NAME,
@@ -36,6 +43,7 @@ from custom_components.violet_pool_controller.device import (
     VioletPoolControllerDevice,
     VioletPoolDataUpdateCoordinator,
 )
+from custom_components.violet_pool_controller.poll_scheduler import AdaptivePollScheduler
 
 IDLE_DATA = {"PUMP": 0, "pH_value": "7.2"}
 
@@ -243,3 +251,80 @@ class TestAdaptivePollingOption:
         await coordinator._async_update_data()
 
         assert coordinator.update_interval == timedelta(seconds=10)
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _observe(scheduler: AdaptivePollScheduler, clock: FakeClock, readings: list[dict]) -> None:
+    """Feed one idle poll per reading, 30 seconds apart."""
+    for data in readings:
+        scheduler.observe(data, is_active=False)
+        clock.now += 30
+
+
+class TestAdaptivePollScheduler:
+    """Reading trends and alarm flips steer the idle back-off."""
+
+    def test_moving_ph_keeps_the_configured_interval(self) -> None:
+        clock = FakeClock()
+        scheduler = AdaptivePollScheduler(clock)
+
+        _observe(scheduler, clock, [{"pH_value": "7.40"}, {"pH_value": "7.30"}])
+
+        assert scheduler.moving
+        assert scheduler.interval(10, is_active=False) == 10
+
+    def test_steady_readings_back_off(self) -> None:
+        clock = FakeClock()
+        scheduler = AdaptivePollScheduler(clock)
+
+        _observe(scheduler, clock, [{"pH_value": "7.20", "orp_value": "720"}] * 3)
+
+        assert not scheduler.moving
+        assert scheduler.interval(10, is_active=False) == 30
+
+    def test_trend_decays_once_the_reading_settles(self) -> None:
+        clock = FakeClock()
+        scheduler = AdaptivePollScheduler(clock)
+
+        _observe(scheduler, clock, [{"orp_value": "700"}, {"orp_value": "720"}])
+        _observe(scheduler, clock, [{"orp_value": "720"}] * 20)
+
+        assert not scheduler.moving
+
+    def test_alarm_flip_is_held_for_a_few_polls(self) -> None:
+        clock = FakeClock()
+        scheduler = AdaptivePollScheduler(clock)
+
+        _observe(scheduler, clock, [{"PRESSURE_STATE": "0"}, {"PRESSURE_STATE": "1"}])
+        assert scheduler.interval(10, is_active=False) == 10
+
+        _observe(scheduler, clock, [{"PRESSURE_STATE": "1"}] * ADAPTIVE_ALARM_HOLD_POLLS)
+        assert scheduler.interval(10, is_active=False) == 30
+
+    def test_long_calm_period_stretches_further(self) -> None:
+        clock = FakeClock()
+        scheduler = AdaptivePollScheduler(clock)
+
+        _observe(scheduler, clock, [{"pH_value": "7.2"}] * ADAPTIVE_STABLE_POLLS)
+
+        assert scheduler.interval(10, is_active=False) == 60
+        assert scheduler.interval(40, is_active=False) == ADAPTIVE_STABLE_MAX_INTERVAL
+
+    def test_activity_resets_the_calm_period(self) -> None:
+        clock = FakeClock()
+        scheduler = AdaptivePollScheduler(clock)
+        _observe(scheduler, clock, [{"pH_value": "7.2"}] * ADAPTIVE_STABLE_POLLS)
+
+        scheduler.observe({"pH_value": "7.2"}, is_active=True)
+
+        assert scheduler.stable_polls == 0
+        assert scheduler.interval(10, is_active=True) == 10
@@ -0,0 +1,134 @@
+"""Tests for the sliding-window API request metrics.
+
+api_request_rate used to divide the lifetime request count by the uptime, so
+after a few days a burst or a stall no longer showed. Requests, failures,
+payload bytes and polls repeating a failed one are now counted in time
+buckets and summed over 1 minute, 5 minutes and 1 hour.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.api_metrics import (
+    WindowedCounters,
+    payload_size,
+)
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWindowedCounters:
+    """Bucketing and window sums."""
+
+    def test_windows_only_see_recent_buckets(self) -> None:
+        clock = FakeClock()
+        counters = WindowedCounters(("requests",), horizon=300, resolution=5, clock=clock)
+
+        counters.add(requests=3)
+        clock.now += 120
+        counters.add(requests=2)
+
+        assert counters.total("requests", 60) == 2
+        assert counters.total("requests", 300) == 5
+
+    def test_buckets_are_reused_after_the_horizon(self) -> None:
+        clock = FakeClock()
+        counters = WindowedCounters(("requests",), horizon=60, resolution=5, clock=clock)
+
+        counters.add(requests=7)
+        clock.now += 60
+        counters.add(requests=1)
+
+        assert counters.total("requests", 60) == 1
+
+    def test_totals_cover_every_field(self) -> None:
+        counters = WindowedCounters(("requests", "failures"), clock=FakeClock())
+
+        counters.add(requests=2, failures=1)
+
+        assert counters.totals(60) == {"requests": 2, "failures": 1}
+
+    def test_payload_size_estimates_json_length(self) -> None:
+        assert payload_size({"a": 1}) == len('{"a": "1"}')
+        assert payload_size(None) == 0
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> VioletPoolControllerDevice:
+    """Create a device whose API answers every request."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1})
+    api.get_output_runtimes = AsyncMock(return_value={"PUMP_RUNTIME": "00h 10m"})
+    api.get_config = AsyncMock(return_value={"HEATER_set_temp": "28"})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+
+class TestDeviceMetrics:
+    """The device counts every controller request it issues."""
+
+    async def test_poll_requests_are_counted(self, device) -> None:
+        await device.async_update()
+
+        last_minute = device.api_metrics_summary()["1m"]
+        assert last_minute["requests"] == 3
+        assert last_minute["failures"] == 0
+        assert last_minute["bytes"] > 0
+
+    async def test_request_rate_covers_the_elapsed_time(self, device) -> None:
+        await device.async_update()
+
+        # The 3 requests of the poll, 30 s after setup: 6 per minute.
+        with patch(
+            "custom_components.violet_pool_controller.device.time.monotonic",
+            return_value=time.monotonic() + 30,
+        ):
+            assert device.api_request_rate == pytest.approx(6, rel=0.01)
+
+    async def test_failures_and_repeated_polls_are_counted(self, device) -> None:
+        device.api.get_readings = AsyncMock(side_effect=RuntimeError("timeout"))
+        await device.async_update()
+        await device.async_update()
+
+        last_hour = device.api_metrics_summary()["1h"]
+        assert last_hour["failures"] == 2
+        assert last_hour["repeated_polls"] == 1
+        assert last_hour["error_rate"] > 0
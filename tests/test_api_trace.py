@@ -0,0 +1,155 @@
+"""Tests for the per-device API call trace.
+
+Individual controller requests were not recorded anywhere: the control client
+only logs at info/debug level and a poll only logs totals. The device now
+keeps the last calls - endpoint, method, parameter fingerprint, outcome, size,
+duration and failed poll streak - for the ``get_api_trace`` service and the
+diagnostics.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from violet_poolcontroller_api.api import VioletPoolAPIError
+
+from custom_components.violet_pool_controller.api_metrics import payload_size
+from custom_components.violet_pool_controller.api_trace import ApiTrace, fingerprint
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+from custom_components.violet_pool_controller.http_control import VioletControlClient
+
+
+class TestApiTrace:
+    """The trace keeps the newest calls and their outcome."""
+
+    def test_oldest_calls_are_dropped(self) -> None:
+        trace = ApiTrace(3)
+        for index in range(5):
+            trace.record(f"/endpoint{index}", "GET", None, "ok", index, 0.001)
+
+        assert [call["endpoint"] for call in trace.entries()] == [
+            "/endpoint2",
+            "/endpoint3",
+            "/endpoint4",
+        ]
+        assert [call["endpoint"] for call in trace.entries(limit=1)] == ["/endpoint4"]
+
+    def test_fingerprint_ignores_order_but_not_values(self) -> None:
+        assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+        assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+        assert fingerprint(["X", "Y"]) == fingerprint(["Y", "X"])
+        assert fingerprint(None) == fingerprint({}) == ""
+
+    async def test_call_records_the_response_size(self) -> None:
+        trace = ApiTrace(5)
+
+        result = await trace.call(AsyncMock(return_value={"PUMP": 1})(), "/getReadings")
+
+        assert result == {"PUMP": 1}
+        assert trace.last_size == payload_size(result) > 0
+
+    async def test_failed_call_is_recorded_and_raised(self) -> None:
+        trace = ApiTrace(5)
+
+        with pytest.raises(TimeoutError):
+            await trace.call(AsyncMock(side_effect=TimeoutError)(), "/getReadings")
+
+        (call,) = trace.entries()
+        assert call["status"] == "TimeoutError"
+        assert trace.summary()["endpoints"]["/getReadings"]["failures"] == 1
+
+
+class TestControlClientTrace:
+    """Manual commands are recorded in the device's trace."""
+
+    async def test_set_function_manually(self) -> None:
+        api = MagicMock()
+        api._request = AsyncMock(return_value="OK\nPUMP\nON")
+        trace = ApiTrace(5)
+        client = VioletControlClient(api, trace=trace)
+
+        assert await client.set_function_manually("PUMP", "ON", 2) is True
+
+        (call,) = trace.entries()
+        assert call["endpoint"] == "/setFunctionManually"
+        assert call["method"] == "GET"
+        assert call["params"] == fingerprint("PUMP,ON,2")
+        assert call["status"] == "ok"
+
+    async def test_failed_dosing_is_recorded(self) -> None:
+        api = MagicMock()
+        api._request = AsyncMock(side_effect=VioletPoolAPIError("boom"))
+        trace = ApiTrace(5)
+        client = VioletControlClient(api, trace=trace)
+
+        with pytest.raises(VioletPoolAPIError):
+            await client.trigger_manual_dosing(0, 30)
+
+        (call,) = trace.entries()
+        assert call["endpoint"] == "/triggerManualDosing"
+        assert call["method"] == "POST"
+        assert call["status"] == "VioletPoolAPIError"
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> VioletPoolControllerDevice:
+    """Create a device backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1, "pH_value": "7.2"})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+
+class TestDeviceTrace:
+    """Poll requests are recorded with the failed polls they repeat."""
+
+    async def test_poll_requests_are_traced(self, device) -> None:
+        await device.async_update()
+
+        endpoints = [call["endpoint"] for call in device.api_trace.entries()]
+
+        assert "/getReadings" in endpoints
+        assert "/getConfig" in endpoints
+
+    async def test_poll_after_a_failure_records_the_streak(self, device) -> None:
+        device.api.get_readings.side_effect = [VioletPoolAPIError("down"), {"PUMP": 1}]
+
+        for _ in range(2):
+            # The first poll is meant to fail.
+            with contextlib.suppress(Exception):
+                await device.async_update()
+
+        readings = device.api_trace.entries(endpoint="/getReadings")
+        assert [(call["status"], call["failed_poll_streak"]) for call in readings] == [
+            ("VioletPoolAPIError", 0),
+            ("ok", 1),
+        ]
@@ -0,0 +1,164 @@
+"""Tests for the circuit breaker on the controller API.
+
+A controller that was switched off still cost two to three timeouts per poll.
+After a few failed polls the breaker now opens and polls skip the network
+until a single cheap probe request shows the controller is back.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+from custom_components.violet_pool_controller.error_handler import CircuitBreakerError
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """State transitions."""
+
+    def test_opens_after_the_threshold(self) -> None:
+        breaker = CircuitBreaker("test", failure_threshold=3, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        with pytest.raises(CircuitBreakerError):
+            breaker.before_request()
+
+    def test_half_open_after_the_timeout(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now += 30
+
+        assert breaker.state == STATE_HALF_OPEN
+        breaker.before_request()
+
+    def test_failed_probe_doubles_the_timeout(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        assert breaker.state == STATE_HALF_OPEN
+
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_in == 60
+
+    def test_retry_after_extends_the_timeout(self) -> None:
+        breaker = CircuitBreaker(
+            "test", failure_threshold=1, recovery_timeout=30, clock=FakeClock()
+        )
+
+        breaker.record_failure(retry_after=60.0)
+
+        assert breaker.retry_in == 60
+
+    def test_success_closes(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", failure_threshold=1, clock=clock)
+        breaker.record_failure()
+
+        breaker.record_success()
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker.failure_count == 0
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> VioletPoolControllerDevice:
+    """Create a device whose controller does not answer."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(side_effect=TimeoutError("timeout"))
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    device._circuit = CircuitBreaker("test", failure_threshold=3, clock=FakeClock())
+    return device
+
+
+class TestDeviceCircuit:
+    """The breaker guards the poll requests."""
+
+    async def test_open_circuit_skips_the_network(self, device) -> None:
+        for _ in range(3):
+            await device.async_update()
+        assert device.circuit_breaker.state == STATE_OPEN
+
+        await device.async_update()
+
+        assert device.api.get_readings.await_count == 3
+        assert device._consecutive_failures == 4
+
+    async def test_probe_closes_the_circuit(self, device) -> None:
+        for _ in range(3):
+            await device.async_update()
+        device.api.get_config.reset_mock()
+        device.api.get_readings = AsyncMock(return_value={"PUMP": 1})
+        device.circuit_breaker._clock.now += device.circuit_breaker.retry_in
+
+        data = await device.async_update()
+
+        assert device.api.get_config.await_args_list[0].args == (["SYSTEM_swversion"],)
+        assert device.circuit_breaker.state == STATE_CLOSED
+        assert data["PUMP"] == 1
+
+    async def test_failed_probe_skips_the_full_poll(self, device) -> None:
+        for _ in range(3):
+            await device.async_update()
+        device.api.get_config = AsyncMock(side_effect=TimeoutError("timeout"))
+        device.circuit_breaker._clock.now += device.circuit_breaker.retry_in
+
+        await device.async_update()
+
+        assert device.api.get_readings.await_count == 3
+        assert device.circuit_breaker.state == STATE_OPEN
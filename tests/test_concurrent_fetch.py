@@ -0,0 +1,143 @@
+"""Tests for issuing the requests of a poll concurrently.
+
+getReadings, getOutputRuntimes and getConfig are independent, so with the
+concurrent_fetch option on they are issued together; the sequential path stays
+the default. The merge order must not depend on the mode: readings win over
+runtimes, and the config values are layered on top.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONCURRENT_FETCH,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+
+READINGS = {"PUMP": 1, "PUMP_RUNTIME": "00h 10m", "HEATER_set_temp": "20"}
+RUNTIMES = {"PUMP_RUNTIME": "99h 99m", "SOLAR_RUNTIME": "01h 00m"}
+CONFIG = {"HEATER_set_temp": "28", "SYSTEM_swversion": "1.2.3"}
+
+
+def _make_device(hass: HomeAssistant, concurrent: bool | None) -> VioletPoolControllerDevice:
+    """Create a device whose API records the order requests start and finish.
+
+    ``concurrent=None`` leaves the option unset.
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+        options={} if concurrent is None else {CONF_CONCURRENT_FETCH: concurrent},
+    )
+    events: list[str] = []
+
+    def _request(name: str, payload: dict):
+        async def _call(*_args):
+            events.append(f"start:{name}")
+            await asyncio.sleep(0)
+            events.append(f"end:{name}")
+            return payload
+
+        return AsyncMock(side_effect=_call)
+
+    api = MagicMock()
+    api.get_readings = _request("readings", READINGS)
+    api.get_output_runtimes = _request("runtimes", RUNTIMES)
+    api.get_config = _request("config", CONFIG)
+    api.dosing_standalone = False
+
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    device.events = events  # type: ignore[attr-defined]
+    return device
+
+
+class TestMergeOrder:
+    """Both modes produce the same payload."""
+
+    @pytest.mark.parametrize("concurrent", [True, False])
+    async def test_readings_win_and_config_is_layered_on_top(
+        self, hass: HomeAssistant, concurrent: bool
+    ) -> None:
+        """Runtimes never overwrite readings; config overwrites both."""
+        device = _make_device(hass, concurrent)
+
+        data = await device.async_update()
+
+        assert data["PUMP_RUNTIME"] == "00h 10m"
+        assert data["SOLAR_RUNTIME"] == "01h 00m"
+        assert data["HEATER_set_temp"] == "28"
+        assert data["SYSTEM_swversion"] == "1.2.3"
+
+
+class TestRequestScheduling:
+    """The option decides whether the requests overlap."""
+
+    async def test_concurrent_mode_overlaps_requests(self, hass: HomeAssistant) -> None:
+        """All three requests start before the first one finishes."""
+        device = _make_device(hass, concurrent=True)
+
+        await device.async_update()
+
+        first_end = next(i for i, e in enumerate(device.events) if e.startswith("end:"))
+        assert set(device.events[:first_end]) == {
+            "start:readings",
+            "start:runtimes",
+            "start:config",
+        }
+
+    async def test_sequential_mode_awaits_each_request(self, hass: HomeAssistant) -> None:
+        """With the option off, each request finishes before the next starts."""
+        device = _make_device(hass, concurrent=False)
+
+        await device.async_update()
+
+        assert device.events == [
+            "start:readings",
+            "end:readings",
+            "start:runtimes",
+            "end:runtimes",
+            "start:config",
+            "end:config",
+        ]
+
+    async def test_requests_are_sequential_by_default(self, hass: HomeAssistant) -> None:
+        """Without the option the poll keeps the sequential path."""
+        device = _make_device(hass, concurrent=None)
+
+        await device.async_update()
+
+        assert not device.concurrent_fetch
+        assert device.events[:2] == ["start:readings", "end:readings"]
+
+    async def test_failing_runtimes_do_not_fail_the_poll(self, hass: HomeAssistant) -> None:
+        """getOutputRuntimes stays optional in concurrent mode."""
+        device = _make_device(hass, concurrent=True)
+        device.api.get_output_runtimes = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        data = await device.async_update()
+
+        assert data["PUMP"] == 1
+        assert "SOLAR_RUNTIME" not in data
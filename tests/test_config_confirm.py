@@ -0,0 +1,129 @@
+"""Tests for confirming setpoint writes with a targeted getConfig read.
+
+A setpoint write used to force the next poll to re-read the whole config set.
+The coordinator now reads back only the written keys shortly after the write,
+publishes them and drops the optimistic cache entries, without a full poll.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> VioletPoolDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={"HEATER_set_temp": "28"})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    return VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+
+
+async def _write_and_confirm(coordinator, key: str, value: float) -> None:
+    """Write a setpoint and wait for its confirm read."""
+    with patch("custom_components.violet_pool_controller.device.CONFIG_CONFIRM_DELAY", 0):
+        coordinator.update_setpoint_cache(key, value)
+        await coordinator._confirm_task
+
+
+class TestConfigConfirm:
+    """Setpoint writes are confirmed without a full poll."""
+
+    async def test_confirm_reads_only_the_written_key(self, coordinator) -> None:
+        await coordinator.async_refresh()
+        api = coordinator.device.api
+        api.get_config = AsyncMock(return_value={"HEATER_set_temp": "29"})
+
+        await _write_and_confirm(coordinator, "HEATER_set_temp", 29.0)
+
+        api.get_config.assert_awaited_once_with(["HEATER_set_temp"])
+        assert api.get_readings.await_count == 1
+        assert coordinator.data["HEATER_set_temp"] == "29"
+        assert coordinator.data["PUMP"] == 1
+        assert "HEATER_set_temp" not in coordinator._setpoint_cache
+
+    async def test_writes_before_the_read_share_it(self, coordinator) -> None:
+        await coordinator.async_refresh()
+        api = coordinator.device.api
+        api.get_config = AsyncMock(
+            return_value={"HEATER_set_temp": "29", "SOLAR_set_temp": "31"}
+        )
+
+        with patch("custom_components.violet_pool_controller.device.CONFIG_CONFIRM_DELAY", 0):
+            coordinator.update_setpoint_cache("HEATER_set_temp", 29.0)
+            coordinator.update_setpoint_cache("SOLAR_set_temp", 31.0)
+            await coordinator._confirm_task
+
+        api.get_config.assert_awaited_once_with(["HEATER_set_temp", "SOLAR_set_temp"])
+
+    async def test_failed_read_falls_back_to_the_next_poll(self, coordinator) -> None:
+        await coordinator.async_refresh()
+        device = coordinator.device
+        device.api.get_config = AsyncMock(side_effect=TimeoutError("boom"))
+
+        await _write_and_confirm(coordinator, "HEATER_set_temp", 29.0)
+
+        assert coordinator._setpoint_cache["HEATER_set_temp"] == 29.0
+        assert device._force_config_fetch
+
+    async def test_confirm_is_not_counted_as_a_poll(self, coordinator) -> None:
+        await coordinator.async_refresh()
+        counter = coordinator.device._update_counter
+        generation = coordinator.data.generation
+        coordinator.device.api.get_config = AsyncMock(return_value={"HEATER_set_temp": "29"})
+
+        await _write_and_confirm(coordinator, "HEATER_set_temp", 29.0)
+
+        assert coordinator.device._update_counter == counter
+        assert coordinator.data.generation == generation
+
+    async def test_confirm_keeps_the_scheduled_refresh(self, coordinator) -> None:
+        await coordinator.async_refresh()
+        coordinator.device.api.get_config = AsyncMock(return_value={"HEATER_set_temp": "29"})
+        listener = MagicMock()
+
+        with patch.object(coordinator, "async_set_updated_data") as set_updated_data:
+            unsubscribe = coordinator.async_add_listener(listener)
+            await _write_and_confirm(coordinator, "HEATER_set_temp", 29.0)
+            unsubscribe()
+
+        set_updated_data.assert_not_called()
+        assert listener.call_count == 2  # the optimistic write, then the confirm
+        assert coordinator.data["HEATER_set_temp"] == "29"
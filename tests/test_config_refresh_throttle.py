@@ -108,19 +108,23 @@ class TestConfigFetchThrottling:
 
         assert mock_api.get_config.await_count == 2
 
-    async def test_setpoint_cache_update_requests_a_refetch(
+    async def test_setpoint_cache_update_reads_back_only_that_key(
         self, hass: HomeAssistant, device, mock_api
     ) -> None:
-        """Writing through the coordinator triggers the same refresh."""
+        """Writing through the coordinator confirms just the written key."""
         coordinator = VioletPoolDataUpdateCoordinator(
             hass=hass, device=device, name="test", polling_interval=30
         )
         await coordinator._async_update_data()
 
-        coordinator.update_setpoint_cache("HEATER_set_temp", 29.0)
-        await coordinator._async_update_data()
+        with patch(
+            "custom_components.violet_pool_controller.device.CONFIG_CONFIRM_DELAY", 0
+        ):
+            coordinator.update_setpoint_cache("HEATER_set_temp", 29.0)
+            await coordinator._confirm_task
 
         assert mock_api.get_config.await_count == 2
+        mock_api.get_config.assert_awaited_with(["HEATER_set_temp"])
 
     async def test_failed_fetch_keeps_previous_values(self, device, mock_api) -> None:
         """A failing getConfig must not drop the setpoints from the data."""
@@ -0,0 +1,121 @@
+"""Tests for batching setConfig writes.
+
+Setting several targets at once used to send one setConfig request per value.
+Writes issued within a short window now go out as one request, the last value
+per key wins, and every caller gets the result of that request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.violet_pool_controller.config_writer import ConfigWriteBatcher
+from custom_components.violet_pool_controller.http_control import VioletControlClient
+
+
+def _recording_task_factory(
+    tasks: list[asyncio.Task[None]],
+) -> Callable[[Coroutine[Any, Any, None]], asyncio.Task[None]]:
+    """Return a create_task hook that keeps the batch tasks it starts."""
+
+    def create_task(flush: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        tasks.append(asyncio.get_running_loop().create_task(flush))
+        return tasks[-1]
+
+    return create_task
+
+
+class TestConfigWriteBatcher:
+    """Merging and result delivery."""
+
+    async def test_writes_in_one_window_share_a_request(self) -> None:
+        send = AsyncMock(return_value={"success": True})
+        batcher = ConfigWriteBatcher(send, 0.01)
+
+        results = await asyncio.gather(
+            batcher.write({"HEATER_set_temp": 28}),
+            batcher.write({"DOSAGE_phminus_setpoint": 7.2}),
+            batcher.write({"HEATER_set_temp": 29}),
+        )
+
+        send.assert_awaited_once_with({"HEATER_set_temp": 29, "DOSAGE_phminus_setpoint": 7.2})
+        assert results == [{"success": True}] * 3
+
+    async def test_writes_in_separate_windows_are_separate_requests(self) -> None:
+        send = AsyncMock(return_value=True)
+        batcher = ConfigWriteBatcher(send, 0)
+
+        await batcher.write({"a": 1})
+        await batcher.write({"b": 2})
+
+        assert send.await_count == 2
+
+    async def test_error_reaches_every_caller(self) -> None:
+        batcher = ConfigWriteBatcher(AsyncMock(side_effect=RuntimeError("boom")), 0.01)
+
+        results = await asyncio.gather(
+            batcher.write({"a": 1}), batcher.write({"b": 2}), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_on_written_only_after_success(self) -> None:
+        written = MagicMock()
+        batcher = ConfigWriteBatcher(AsyncMock(return_value=False), 0, on_written=written)
+        await batcher.write({"a": 1})
+        written.assert_not_called()
+
+        batcher = ConfigWriteBatcher(AsyncMock(return_value=True), 0, on_written=written)
+        await batcher.write({"a": 1})
+        written.assert_called_once_with({"a": 1})
+
+    async def test_failing_on_written_still_releases_the_callers(self) -> None:
+        tasks: list[asyncio.Task[None]] = []
+        batcher = ConfigWriteBatcher(
+            AsyncMock(return_value=True),
+            0,
+            on_written=MagicMock(side_effect=RuntimeError("boom")),
+            create_task=_recording_task_factory(tasks),
+        )
+
+        assert await batcher.write({"a": 1}) is True
+        # The error surfaces on the batch's task.
+        with pytest.raises(RuntimeError):
+            await tasks[0]
+
+    async def test_cancelled_batch_releases_the_callers(self) -> None:
+        """Unloading the entry cancels the batch task; its callers are not left waiting."""
+        tasks: list[asyncio.Task[None]] = []
+        send = AsyncMock(return_value=True)
+        batcher = ConfigWriteBatcher(send, 0.01, create_task=_recording_task_factory(tasks))
+        caller = asyncio.ensure_future(batcher.write({"a": 1}))
+        await asyncio.sleep(0)
+
+        tasks[0].cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        send.assert_not_awaited()
+        # The next write opens a new batch.
+        assert await batcher.write({"b": 2}) is True
+        send.assert_awaited_once_with({"b": 2})
+
+
+class TestControlClientWriter:
+    """VioletControlClient hands its writes to the device's batcher."""
+
+    async def test_normalized_updates_go_through_the_writer(self) -> None:
+        api = MagicMock()
+        api.set_config = AsyncMock()
+        writer = AsyncMock(return_value=True)
+        client = VioletControlClient(api, config_writer=writer)
+
+        assert await client.set_config({"EXT1_1_use": True, "HEATER_set_temp": 28.0}) is True
+
+        writer.assert_awaited_once_with({"EXT1_1_use": 1, "HEATER_set_temp": 28.0})
+        api.set_config.assert_not_awaited()
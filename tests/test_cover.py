@@ -54,6 +54,7 @@ class MockDevice:
         self.available = True
         self.api = MockAPI()
         self.hardware_config = None
+        self.hardware_config_generation = 0
         self.device_info = {
             "identifiers": {("violet_pool_controller", "192.168.1.100_1")},
             "name": "Test Pool",
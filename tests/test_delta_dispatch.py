@@ -0,0 +1,171 @@
+"""Tests for delta-aware listener dispatch in the coordinator.
+
+Every poll used to notify every entity, so ~300 entities wrote a new state
+every interval although most of the ~400 controller keys are static. Entities
+now declare the keys they render and the coordinator only wakes the ones whose
+keys changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+    _changed_keys,
+)
+
+
+def _make_coordinator(hass: HomeAssistant, readings: dict) -> VioletPoolDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API returning ``readings``."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value=readings)
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+    return VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+
+
+@pytest.fixture
+async def make_coordinator(
+    hass: HomeAssistant,
+) -> AsyncIterator[Callable[[dict], VioletPoolDataUpdateCoordinator]]:
+    """Return a coordinator factory; the coordinators are shut down afterwards.
+
+    Adding a listener schedules the coordinator's refresh timer, which must
+    not outlive the test.
+    """
+    coordinators: list[VioletPoolDataUpdateCoordinator] = []
+
+    def _make(readings: dict) -> VioletPoolDataUpdateCoordinator:
+        coordinator = _make_coordinator(hass, readings)
+        coordinators.append(coordinator)
+        return coordinator
+
+    yield _make
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+
+class TestChangedKeys:
+    """The diff between two polls."""
+
+    def test_first_poll_marks_everything_changed(self) -> None:
+        """Without a previous poll every key is new."""
+        assert _changed_keys(None, {"a": 1, "b": 2}) == {"a", "b"}
+
+    def test_only_moved_values_are_reported(self) -> None:
+        """Unchanged values are left out."""
+        assert _changed_keys({"a": 1, "b": 2}, {"a": 1, "b": 3}) == {"b"}
+
+    def test_added_and_removed_keys_count_as_changed(self) -> None:
+        """Keys appearing or disappearing must reach their entities."""
+        assert _changed_keys({"a": 1, "gone": 2}, {"a": 1, "new": 3}) == {"gone", "new"}
+
+
+class TestListenerDispatch:
+    """Only subscribed listeners are woken after a poll."""
+
+    async def test_unchanged_keys_skip_listeners(self, make_coordinator) -> None:
+        """A listener bound to a static key is not notified again."""
+        coordinator = make_coordinator({"pH_value": "7.2", "onewire1_value": "24.0"})
+        ph_listener = MagicMock()
+        temp_listener = MagicMock()
+        coordinator.async_add_listener(ph_listener, frozenset({"pH_value"}))
+        coordinator.async_add_listener(temp_listener, frozenset({"onewire1_value"}))
+
+        await coordinator.async_refresh()
+        assert ph_listener.call_count == 1
+        assert temp_listener.call_count == 1
+
+        coordinator.device.api.get_readings.return_value = {
+            "pH_value": "7.3",
+            "onewire1_value": "24.0",
+        }
+        await coordinator.async_refresh()
+
+        assert coordinator.last_changed_keys == frozenset({"pH_value"})
+        assert ph_listener.call_count == 2
+        assert temp_listener.call_count == 1
+
+    async def test_listener_without_keys_always_notified(self, make_coordinator) -> None:
+        """Entities that declare no keys keep receiving every update."""
+        coordinator = make_coordinator({"pH_value": "7.2"})
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+
+        assert listener.call_count == 2
+
+    async def test_failed_poll_notifies_everyone(self, make_coordinator) -> None:
+        """A failure changes availability, so every listener must re-render."""
+        coordinator = make_coordinator({"pH_value": "7.2"})
+        listener = MagicMock()
+        coordinator.async_add_listener(listener, frozenset({"pH_value"}))
+        await coordinator.async_refresh()
+
+        coordinator.device.api.get_readings.side_effect = RuntimeError("boom")
+        coordinator.device._consecutive_failures = coordinator.device._max_consecutive_failures
+        await coordinator.async_refresh()
+
+        assert coordinator.last_update_success is False
+        assert listener.call_count == 2
+
+    async def test_setpoint_write_notifies_only_its_key(self, make_coordinator) -> None:
+        """A cached setpoint wakes the entities bound to that key."""
+        coordinator = make_coordinator({"pH_value": "7.2", "onewire1_value": "24.0"})
+        await coordinator.async_refresh()
+        ph_listener = MagicMock()
+        temp_listener = MagicMock()
+        coordinator.async_add_listener(ph_listener, frozenset({"pH_value"}))
+        coordinator.async_add_listener(temp_listener, frozenset({"onewire1_value"}))
+
+        coordinator.update_setpoint_cache("pH_value", 7.4)
+
+        assert ph_listener.call_count == 1
+        assert temp_listener.call_count == 0
+
+    async def test_cleared_setpoint_re_renders_unchanged_key(self, make_coordinator) -> None:
+        """Dropping a cached setpoint counts as a change even if the poll agrees."""
+        coordinator = make_coordinator({"pH_value": "7.2"})
+        await coordinator.async_refresh()
+        coordinator._setpoint_cache["pH_value"] = 7.4
+
+        await coordinator.async_refresh()
+
+        assert "pH_value" in coordinator.last_changed_keys
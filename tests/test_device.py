@@ -15,6 +15,7 @@ from custom_components.violet_pool_controller.const import (
     FIRMWARE_VERSION_REFRESH_POLLS,
 )
 from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+from custom_components.violet_pool_controller.readings_snapshot import ReadingsSnapshot
 
 
 class TestVioletPoolControllerDevice:
@@ -87,6 +88,31 @@ class TestVioletPoolControllerDevice:
         assert updated_info["name"] == "Neuer Pool Name"
         assert updated_info["suggested_area"] == "Neuer Pool Name"
 
+    async def test_device_info_built_once_per_generation(self, device):
+        """device_info wird pro Poll-Generation nur einmal gebaut."""
+        device._data = ReadingsSnapshot({"EXT1_1": 0, "DOS_1_CL_STATE": "1"}).freeze(1)
+
+        with patch.object(
+            device,
+            "_detect_current_hardware_modules",
+            wraps=device._detect_current_hardware_modules,
+        ) as detect:
+            first = device.device_info
+            second = device.device_info
+
+        assert first is second
+        assert detect.call_count == 1
+        assert first["model"] == "Violet Pool Controller (Dosing, Ext1)"
+
+    async def test_device_info_rebuilt_for_new_generation(self, device):
+        """Ein neuer Snapshot baut das Modell neu auf."""
+        device._data = ReadingsSnapshot({"PUMP": 1}).freeze(1)
+        assert device.device_info["model"] == "Violet Pool Controller"
+
+        device._data = ReadingsSnapshot({"PUMP": 1, "DMX_SCENE1": 0}).freeze(2)
+
+        assert device.device_info["model"] == "Violet Pool Controller (DMX)"
+
     def test_build_config_keys_always_includes_swversion_and_setpoints(self):
         """Every poll must include swversion and the setpoint keys."""
         device = VioletPoolControllerDevice.__new__(VioletPoolControllerDevice)
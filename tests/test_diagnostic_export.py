@@ -0,0 +1,89 @@
+"""Tests for the streaming diagnostic export.
+
+The export used to build a list of lines on the event loop - including an
+indented JSON dump of the whole payload and every entity state - and joined
+it into one string before writing it. The sections are now generators that
+the executor renders straight into the (optionally gzip-compressed) file, or
+into a size-capped service response.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+from custom_components.violet_pool_controller.service_diagnostics import _iter_raw_data
+from custom_components.violet_pool_controller.service_helpers import (
+    EXPORT_TRUNCATED_MARKER,
+    ExportStream,
+    collect_export_text,
+    write_export_file,
+)
+
+
+class TestExportStream:
+    """Lazy rendering and line counting."""
+
+    def test_lines_are_counted_while_streaming(self) -> None:
+        stream = ExportStream("header\n", [["a", "b"], iter(["c"])])
+
+        assert "".join(stream) == "header\na\nb\nc\n"
+        assert stream.lines == 3
+
+    def test_sections_after_the_cap_are_not_rendered(self) -> None:
+        rendered: list[str] = []
+
+        def section(name: str):
+            rendered.append(name)
+            yield name * 100
+
+        stream = ExportStream("", [section("a"), section("b"), section("c")])
+
+        text, truncated = collect_export_text(stream, 150)
+
+        assert truncated is True
+        assert rendered == ["a", "b"]
+        assert text.endswith(EXPORT_TRUNCATED_MARKER)
+        assert len(text.encode()) == 150 + len(EXPORT_TRUNCATED_MARKER.encode())
+
+    def test_small_export_is_returned_whole(self) -> None:
+        text, truncated = collect_export_text(ExportStream("h\n", [["x"]]), 1024)
+
+        assert text == "h\nx\n"
+        assert truncated is False
+
+
+class TestExportFile:
+    """Writing the export to disk."""
+
+    def test_plain_file(self, tmp_path) -> None:
+        path = tmp_path / "export.txt"
+
+        size = write_export_file(str(path), ExportStream("h\n", [["x"]]))
+
+        assert path.read_text(encoding="utf-8") == "h\nx\n"
+        assert size == 4
+
+    def test_compressed_file(self, tmp_path) -> None:
+        path = tmp_path / "export.txt.gz"
+        lines = [f"line {index}" for index in range(1000)]
+
+        size = write_export_file(str(path), ExportStream("", [lines]), compress=True)
+
+        with gzip.open(path, "rt", encoding="utf-8") as export_file:
+            assert export_file.read().splitlines() == lines
+        assert size == path.stat().st_size
+
+
+class TestRawDataSection:
+    """The raw data is dumped line by line."""
+
+    def test_matches_an_indented_dump(self) -> None:
+        data = {"pH_value": 7.2, "PUMP": 1, "wifi_password": "hunter2", "nested": {"a": [1]}}
+
+        lines = list(_iter_raw_data(data))
+
+        expected = dict(data, wifi_password="***REDACTED***")
+        assert lines[0] == "Latest Raw Data:"
+        assert lines[1:-1] == json.dumps(expected, indent=2, sort_keys=True).split("\n")
+        assert lines[-1] == ""
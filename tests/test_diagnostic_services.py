@@ -6,6 +6,10 @@ import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 
+from custom_components.violet_pool_controller.api_trace import ApiTrace
+from custom_components.violet_pool_controller.entity_profile import EntityProfiler
+from custom_components.violet_pool_controller.error_handler import EnhancedErrorHandler
+from custom_components.violet_pool_controller.poll_profile import PollProfiler
 from custom_components.violet_pool_controller.services import (
     VioletServiceHandlers,
     VioletServiceManager,
@@ -37,6 +41,7 @@ def mock_coordinator():
     coordinator.device._consecutive_failures = 0
     coordinator.device.api_url = "192.168.1.100"
     coordinator.device.use_ssl = False
+    coordinator.device.error_handler = EnhancedErrorHandler()
     coordinator.config_entry = Mock()
     coordinator.config_entry.entry_id = "test_entry_id"
 
@@ -60,6 +65,8 @@ def service_manager(hass):
         coordinator.device._consecutive_failures = 0
         coordinator.device.api_url = "192.168.1.100"
         coordinator.device.use_ssl = False
+        coordinator.device.error_handler = EnhancedErrorHandler()
+        coordinator.device.poll_profiler = PollProfiler()
         return coordinator
 
     manager.get_coordinator_for_device = AsyncMock(side_effect=mock_get_coordinator)
@@ -298,6 +305,107 @@ class TestServiceErrorHandling:
             await service_handlers.handle_clear_error_history(call)
 
 
+class TestGetPollProfile:
+    """Test get_poll_profile service."""
+
+    @pytest.mark.asyncio
+    async def test_get_poll_profile_success(self, service_handlers):
+        """Test that the recorded stages are returned."""
+        call = Mock()
+        call.data = {"device_id": ["test_device_id"], "reset": False}
+
+        result = await service_handlers.handle_get_poll_profile(call)
+
+        assert result["success"] is True
+        assert result["devices"][0]["device_name"] == "Test Pool"
+        assert result["devices"][0]["profile"] == {}
+
+    @pytest.mark.asyncio
+    async def test_get_poll_profile_reset(self, service_handlers):
+        """Test that reset starts new histograms after returning the old ones."""
+        coordinator = Mock()
+        coordinator.device.device_name = "Test Pool"
+        coordinator.device.poll_profiler = PollProfiler()
+        coordinator.device.poll_profiler.record("poll", 0.02)
+        service_handlers.manager.get_coordinator_for_device = AsyncMock(
+            return_value=coordinator
+        )
+        call = Mock()
+        call.data = {"device_id": ["test_device_id"], "reset": True}
+
+        result = await service_handlers.handle_get_poll_profile(call)
+
+        assert result["devices"][0]["profile"]["poll"]["count"] == 1
+        assert coordinator.device.poll_profiler.as_dict() == {}
+
+
+class TestProfileEntities:
+    """Test profile_entities service."""
+
+    @pytest.mark.asyncio
+    async def test_profile_entities_start(self, service_handlers):
+        """Test that start arms the profiler of the coordinator."""
+        coordinator = Mock()
+        coordinator.device.device_name = "Test Pool"
+        coordinator.entity_profiler = EntityProfiler()
+        service_handlers.manager.get_coordinator_for_device = AsyncMock(
+            return_value=coordinator
+        )
+        call = Mock()
+        call.data = {"device_id": ["test_device_id"], "action": "start", "polls": 5, "top": 3}
+
+        result = await service_handlers.handle_profile_entities(call)
+
+        assert result["success"] is True
+        assert result["devices"][0]["profile"]["active"] is True
+        assert result["devices"][0]["profile"]["updates_left"] == 5
+
+    @pytest.mark.asyncio
+    async def test_profile_entities_device_not_found(self, service_handlers):
+        """Test that an unknown device raises."""
+        service_handlers.manager.get_coordinator_for_device = AsyncMock(return_value=None)
+        call = Mock()
+        call.data = {"device_id": ["missing"], "action": "results"}
+
+        with pytest.raises(HomeAssistantError, match="Failed to profile entities"):
+            await service_handlers.handle_profile_entities(call)
+
+
+class TestGetApiTrace:
+    """Test get_api_trace service."""
+
+    @pytest.mark.asyncio
+    async def test_get_api_trace_filters_by_endpoint(self, service_handlers):
+        """Test that the calls are narrowed to the endpoint and the limit."""
+        trace = ApiTrace(10)
+        trace.record("/getReadings", "GET", None, "ok", 4000, 0.2)
+        trace.record("/setConfig", "POST", {"HEATER_set_temp": 28}, "ok", 2, 0.1)
+        trace.record("/setConfig", "POST", {"HEATER_set_temp": 29}, "TimeoutError", 0, 10.0)
+        device = Mock()
+        device.device_name = "Test Pool"
+        device.api_trace = trace
+        service_handlers._get_device_for_id = AsyncMock(return_value=device)
+        call = Mock()
+        call.data = {"device_id": ["test_device_id"], "limit": 1, "endpoint": "setConfig"}
+
+        result = await service_handlers.handle_get_api_trace(call)
+
+        assert result["success"] is True
+        calls = result["devices"][0]["calls"]
+        assert [call["status"] for call in calls] == ["TimeoutError"]
+        assert result["devices"][0]["summary"]["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_api_trace_device_not_found(self, service_handlers):
+        """Test that an unknown device raises."""
+        service_handlers.manager.get_coordinator_for_device = AsyncMock(return_value=None)
+        call = Mock()
+        call.data = {"device_id": ["missing"], "limit": 50}
+
+        with pytest.raises(HomeAssistantError, match="Failed to get API trace"):
+            await service_handlers.handle_get_api_trace(call)
+
+
 class TestServiceRegistration:
     """Test service registration."""
 
@@ -312,5 +420,8 @@ class TestServiceRegistration:
         # Check that all diagnostic services have schemas
         assert "get_connection_status" in schemas
         assert "get_error_summary" in schemas
+        assert "get_poll_profile" in schemas
+        assert "profile_entities" in schemas
+        assert "get_api_trace" in schemas
         assert "test_connection" in schemas
         assert "clear_error_history" in schemas
@@ -148,7 +148,7 @@ class TestSetpointWriting:
     """Writes must land on the channel the value was read from."""
 
     async def test_orp_write_targets_the_electrolysis_key(self) -> None:
-        """set_orp_target() would write the unused chlorine key."""
+        """The chlorine key would hold an unused value on this pool."""
         number = _make_number(
             ORP_SETPOINT,
             {
@@ -157,18 +157,18 @@ class TestSetpointWriting:
                 "DOSAGE_electrolysis_setpoint_orp": 710,
             },
         )
-        api = number.device.api
-        api.set_target_value = AsyncMock(return_value={"success": True})
+        device = number.device
+        device.async_set_config = AsyncMock(return_value={"success": True})
         number._delayed_refresh = AsyncMock()
         number.async_write_ha_state = MagicMock()
 
         await number.async_set_native_value(720)
         await asyncio.sleep(0)  # let the follow-up refresh task finish
 
-        api.set_target_value.assert_awaited_once_with("DOSAGE_electrolysis_setpoint_orp", 720)
+        device.async_set_config.assert_awaited_once_with({"DOSAGE_electrolysis_setpoint_orp": 720})
 
-    async def test_orp_write_keeps_the_api_helper_for_chlorine_pools(self) -> None:
-        """Chlorine pools keep using the dedicated ORP helper."""
+    async def test_orp_write_targets_the_chlorine_key_for_chlorine_pools(self) -> None:
+        """Chlorine pools write the key the setpoint is read back from."""
         number = _make_number(
             ORP_SETPOINT,
             {
@@ -177,15 +177,16 @@ class TestSetpointWriting:
                 "DOSAGE_chlorine_setpoint_orp": 770,
             },
         )
-        api = number.device.api
-        api.set_orp_target = AsyncMock(return_value={"success": True})
+        device = number.device
+        device.async_set_config = AsyncMock(return_value={"success": True})
         number._delayed_refresh = AsyncMock()
         number.async_write_ha_state = MagicMock()
 
         await number.async_set_native_value(720)
         await asyncio.sleep(0)  # let the follow-up refresh task finish
 
-        api.set_orp_target.assert_awaited_once_with(720.0)
+        device.async_set_config.assert_awaited_once_with({"DOSAGE_chlorine_setpoint_orp": 720})
+        device.api.set_orp_target.assert_not_called()
 
 
 class TestBothChannelsActive:
@@ -255,17 +256,15 @@ class TestBothChannelsActive:
             {**ORP_SETPOINT, "pinned_to_electrolysis": True},
             {**self.BOTH, "DOSAGE_electrolysis_setpoint_orp": 710},
         )
-        api = number.device.api
-        api.set_target_value = AsyncMock(return_value={"success": True})
-        api.set_orp_target = AsyncMock(return_value={"success": True})
+        device = number.device
+        device.async_set_config = AsyncMock(return_value={"success": True})
         number._delayed_refresh = AsyncMock()
         number.async_write_ha_state = MagicMock()
 
         await number.async_set_native_value(720)
         await asyncio.sleep(0)
 
-        api.set_target_value.assert_awaited_once_with("DOSAGE_electrolysis_setpoint_orp", 720)
-        api.set_orp_target.assert_not_awaited()
+        device.async_set_config.assert_awaited_once_with({"DOSAGE_electrolysis_setpoint_orp": 720})
 
     def test_the_chlorine_setpoint_gets_a_second_entity_too(self) -> None:
         """Both setpoints are per channel, not just the ORP one."""
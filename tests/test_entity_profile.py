@@ -0,0 +1,179 @@
+"""Tests for the opt-in entity property profiling.
+
+The poll profile shows how long the entity writes take in total but not which
+entities cost the most. While a profiling run is active every entity woken by
+the coordinator times its state properties, and the ``profile_entities``
+service ranks the entities by their mean cost.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+from custom_components.violet_pool_controller.entity_profile import EntityProfiler
+
+
+class FakeClock:
+    """perf_counter replacement advanced by the fake entities."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+CLOCK = FakeClock()
+
+
+class FakeSensor:
+    """Entity with a native_value that takes ``cost_us`` to compute."""
+
+    def __init__(self, entity_id: str, cost_us: float) -> None:
+        self.entity_id = entity_id
+        self.entity_description = SimpleNamespace(key=entity_id)
+        self.cost_us = cost_us
+
+    @property
+    def native_value(self) -> int:
+        CLOCK.now += self.cost_us / 1e6
+        return 1
+
+
+class FailingSwitch:
+    """Entity whose is_on raises."""
+
+    entity_id = None
+    entity_description = SimpleNamespace(key="PUMP")
+
+    @property
+    def is_on(self) -> bool:
+        raise ValueError("bad value")
+
+
+@pytest.fixture(autouse=True)
+def fake_clock():
+    """Time the fake entities with CLOCK."""
+    with patch(
+        "custom_components.violet_pool_controller.entity_profile.time.perf_counter", CLOCK
+    ):
+        yield
+
+
+class TestEntityProfiler:
+    """Sampling, ranking and the update countdown."""
+
+    def test_inactive_until_started(self) -> None:
+        profiler = EntityProfiler()
+
+        assert profiler.active is False
+        assert profiler.summary(10)["top"] == []
+
+    def test_entities_are_ranked_by_mean_cost(self) -> None:
+        profiler = EntityProfiler()
+        profiler.start(3)
+
+        for _ in range(3):
+            profiler.sample(FakeSensor("sensor.cheap", 10))
+            profiler.sample(FakeSensor("sensor.slow", 500))
+            profiler.update_done()
+
+        summary = profiler.summary(1)
+        assert summary["entities_profiled"] == 2
+        assert summary["updates_profiled"] == 3
+        assert [row["entity"] for row in summary["top"]] == ["sensor.slow"]
+        stats = summary["top"][0]["properties"]["native_value"]
+        assert stats["samples"] == 3
+        assert stats["mean_us"] == pytest.approx(500, abs=0.1)
+        assert stats["p95_us"] == pytest.approx(500, abs=0.1)
+
+    def test_only_defined_properties_are_timed(self) -> None:
+        profiler = EntityProfiler()
+        profiler.start(1)
+
+        profiler.sample(FakeSensor("sensor.ph", 1))
+        profiler.sample(FailingSwitch())
+
+        entities = {row["entity"]: row for row in profiler.summary(10)["top"]}
+        assert list(entities["sensor.ph"]["properties"]) == ["native_value"]
+        assert list(entities["PUMP"]["properties"]) == ["is_on"]
+
+    def test_run_ends_after_the_requested_updates(self) -> None:
+        profiler = EntityProfiler()
+        profiler.start(2)
+
+        profiler.update_done()
+        assert profiler.active is True
+        profiler.update_done()
+
+        assert profiler.active is False
+        profiler.update_done()
+        assert profiler.summary(10)["updates_profiled"] == 2
+
+    def test_restart_drops_the_samples(self) -> None:
+        profiler = EntityProfiler()
+        profiler.start(1)
+        profiler.sample(FakeSensor("sensor.ph", 1))
+
+        profiler.start(1)
+
+        assert profiler.summary(10)["entities_profiled"] == 0
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> VioletPoolDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    return VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+
+
+class TestCoordinatorRun:
+    """The coordinator counts its updates into the run."""
+
+    async def test_each_dispatch_counts_one_update(self, coordinator) -> None:
+        coordinator.entity_profiler.start(2)
+
+        await coordinator.async_refresh()
+        assert coordinator.entity_profiler.summary(10)["updates_left"] == 1
+
+        await coordinator.async_refresh()
+        assert coordinator.entity_profiler.active is False
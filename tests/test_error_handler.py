@@ -11,7 +11,6 @@ from custom_components.violet_pool_controller.error_handler import (
     IntegrationError,
     NetworkError,
     VioletErrorCodes,
-    get_enhanced_error_handler,
 )
 
 
@@ -335,15 +334,45 @@ class TestEnhancedErrorHandler:
         assert suggestion is None
 
 
-class TestGlobalErrorHandler:
-    """Test global error handler instance."""
+class TestBoundedHistory:
+    """Test the bounded history and its incremental counters."""
 
-    def test_get_enhanced_error_handler_singleton(self):
-        """Test that get_enhanced_error_handler returns singleton."""
-        handler1 = get_enhanced_error_handler()
-        handler2 = get_enhanced_error_handler()
+    def test_evicted_errors_leave_the_counts(self):
+        """Counts follow the history when old errors are dropped."""
+        handler = EnhancedErrorHandler(max_history=3)
 
-        assert handler1 is handler2
+        handler.record_error(
+            IntegrationError(ErrorType.AUTH_ERROR, ErrorSeverity.HIGH, "Auth failed")
+        )
+        for i in range(3):
+            handler.record_error(
+                IntegrationError(ErrorType.NETWORK_ERROR, ErrorSeverity.MEDIUM, f"Error {i}")
+            )
+
+        summary = handler.get_error_summary()
+        assert summary["total_errors"] == 3
+        assert summary["error_counts"] == {"network_error": 3}
+        assert [e.message for e in handler.get_recent_errors(2)] == ["Error 1", "Error 2"]
+
+    def test_offline_duration_uses_the_monotonic_clock(self):
+        """The offline duration is a small positive number, not the epoch."""
+        handler = EnhancedErrorHandler()
+        handler.record_error(
+            IntegrationError(ErrorType.NETWORK_ERROR, ErrorSeverity.MEDIUM, "Network down")
+        )
+
+        assert 0 <= handler.get_error_summary()["offline_duration_seconds"] < 60
+
+    def test_handlers_do_not_share_history(self):
+        """Every controller keeps its own history."""
+        first = EnhancedErrorHandler()
+        second = EnhancedErrorHandler()
+
+        first.record_error(
+            IntegrationError(ErrorType.TIMEOUT_ERROR, ErrorSeverity.MEDIUM, "Timeout")
+        )
+
+        assert second.get_error_summary()["total_errors"] == 0
 
 
 class TestLegacyErrorClasses:
@@ -0,0 +1,203 @@
+"""Tests for the persisted hardware config.
+
+load_hardware_config read 13 getConfig prefixes on every setup and reload, and
+a failed read stuck for the rest of the session. The raw response is now
+persisted with the warm-start payload, keyed by controller and firmware, served
+on startup and re-read in the background; renamed outputs reach the entities
+without a reload.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.switch import SwitchEntityDescription
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+from custom_components.violet_pool_controller.entity import VioletPoolControllerEntity
+from custom_components.violet_pool_controller.switch import VioletSwitch
+
+IDENTITY = {"controller": "192.168.178.55_1", "firmware_version": "1.2.3"}
+
+
+def _payload(hardware: dict[str, Any] | None) -> dict[str, Any]:
+    """Return a persisted payload carrying ``hardware``."""
+    return {
+        "saved_at": 0,
+        "firmware_version": "1.2.3",
+        "data": {"PUMP": 1, "EXT1_1": 0},
+        "config": {},
+        "hw_detected": ["EXT1"],
+        "hardware_config": hardware,
+    }
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> VioletPoolControllerDevice:
+    """Create a device backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1, "EXT1_1": 0})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={"NAMES_ext1relay1": "Fountain"})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+
+def _relay_name(device: VioletPoolControllerDevice) -> str:
+    return device.hardware_config["extension_relays"]["EXT1_1"]["name"]
+
+
+class TestRestore:
+    """The hardware config is served from the payload."""
+
+    def test_matching_identity_is_restored(self, device) -> None:
+        device.restore_payload(
+            _payload({"identity": IDENTITY, "config": {"NAMES_ext1relay1": "Fountain"}})
+        )
+
+        assert _relay_name(device) == "Fountain"
+        assert device.hardware_config_due is False
+
+    def test_other_firmware_is_ignored(self, device) -> None:
+        identity = {**IDENTITY, "firmware_version": "1.1.0"}
+
+        device.restore_payload(
+            _payload({"identity": identity, "config": {"NAMES_ext1relay1": "Fountain"}})
+        )
+
+        assert device.hardware_config is None
+
+    async def test_load_does_not_hit_the_controller(self, device) -> None:
+        device.restore_payload(
+            _payload({"identity": IDENTITY, "config": {"NAMES_ext1relay1": "Fountain"}})
+        )
+
+        await device.load_hardware_config()
+
+        device.api.get_config.assert_not_awaited()
+
+
+class TestRefresh:
+    """Background re-reads."""
+
+    async def test_refresh_bumps_the_generation_on_change(self, device) -> None:
+        device.restore_payload(
+            _payload({"identity": IDENTITY, "config": {"NAMES_ext1relay1": "Fountain"}})
+        )
+        generation = device.hardware_config_generation
+        device.api.get_config = AsyncMock(return_value={"NAMES_ext1relay1": "Waterfall"})
+
+        await device.load_hardware_config(refresh=True)
+
+        assert _relay_name(device) == "Waterfall"
+        assert device.hardware_config_generation == generation + 1
+
+    async def test_unchanged_refresh_keeps_the_generation(self, device) -> None:
+        await device.load_hardware_config()
+        generation = device.hardware_config_generation
+
+        await device.load_hardware_config(refresh=True)
+
+        assert device.hardware_config_generation == generation
+
+    async def test_failure_is_retried_later(self, device) -> None:
+        device.api.get_config = AsyncMock(side_effect=TimeoutError("timeout"))
+
+        assert await device.load_hardware_config() is None
+        assert device.hardware_config_due is False
+
+        device._hardware_config_attempt -= 3600
+
+        assert device.hardware_config_due is True
+
+    async def test_coordinator_wakes_every_entity_on_change(
+        self, hass: HomeAssistant, device
+    ) -> None:
+        coordinator = VioletPoolDataUpdateCoordinator(
+            hass=hass, device=device, name="test_coordinator", polling_interval=30
+        )
+        await coordinator.async_refresh()
+        listener = MagicMock()
+        coordinator.async_add_listener(listener, frozenset({"UNRELATED"}))
+
+        coordinator.schedule_hardware_config_refresh()
+        await coordinator._hardware_task
+        # The listener scheduled the refresh timer.
+        await coordinator.async_shutdown()
+
+        listener.assert_called_once()
+        assert _relay_name(device) == "Fountain"
+
+
+def _renamed_coordinator() -> MagicMock:
+    """Return a coordinator whose hardware config renamed relay EXT1_1."""
+    coordinator = MagicMock()
+    coordinator.device.hardware_config = {"extension_relays": {"EXT1_1": {"name": "Fountain"}}}
+    coordinator.device.hardware_config_generation = 0
+    coordinator.device.device_info = {}
+    coordinator.device.device_name = "Test Pool"
+    coordinator.device.controller_name = "Test Pool"
+    coordinator.entity_profiler.active = False
+    return coordinator
+
+
+class TestEntityRename:
+    """Only entities named through EntityNameResolver follow a rename."""
+
+    def _rename(self, entity: VioletPoolControllerEntity) -> None:
+        entity.async_write_ha_state = MagicMock()
+        entity.coordinator.device.hardware_config = {
+            "extension_relays": {"EXT1_1": {"name": "Waterfall"}}
+        }
+        entity.coordinator.device.hardware_config_generation = 1
+        entity._handle_coordinator_update()
+
+    def test_resolver_named_entity_is_renamed(self) -> None:
+        description = SwitchEntityDescription(
+            key="EXT1_1", name="Fountain", translation_key="ext1_1"
+        )
+        switch = VioletSwitch(_renamed_coordinator(), MagicMock(), description)
+
+        self._rename(switch)
+
+        assert switch._attr_name == "Waterfall"
+
+    def test_translated_entity_keeps_its_name(self) -> None:
+        description = SensorEntityDescription(key="EXT1_1", translation_key="ext1_1")
+        entity = VioletPoolControllerEntity(_renamed_coordinator(), MagicMock(), description)
+
+        self._rename(entity)
+
+        assert "_attr_name" not in vars(entity)
+        assert entity._attr_translation_key == "ext1_1"
@@ -0,0 +1,100 @@
+"""Tests for the memoized key classification index.
+
+Every platform setup, reload and config flow step used to work out the
+feature, sub-device group and sensor description of each key again by walking
+the regex tables. The answers are now computed once per key and shared.
+``scripts/bench_key_index.py`` times both approaches.
+"""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.helpers.entity import EntityCategory
+
+from custom_components.violet_pool_controller.device_hierarchy import match_group
+from custom_components.violet_pool_controller.feature_keys import (
+    feature_for_key,
+    is_key_feature_active,
+)
+from custom_components.violet_pool_controller.key_index import (
+    classify_key,
+    clear_key_index,
+    sensor_traits,
+)
+from custom_components.violet_pool_controller.sensor_modules.base import (
+    derive_sensor_traits,
+)
+
+KEYS = [
+    "pH_value",
+    "orp_value",
+    "onewire1_value",
+    "onewire1_romcode",
+    "PUMP",
+    "HEATER_set_temp",
+    "SOLAR_RUNTIME",
+    "DOS_1_CL_STATE",
+    "EXT1_1",
+    "SYSTEM_cpu_temperature",
+    "UNKNOWN_KEY",
+]
+
+
+@pytest.fixture(autouse=True)
+def _empty_index():
+    """Start every test with an empty index."""
+    clear_key_index()
+    yield
+    clear_key_index()
+
+
+class TestClassifyKey:
+    """Feature and group lookups."""
+
+    @pytest.mark.parametrize("key", KEYS)
+    def test_matches_the_uncached_lookups(self, key) -> None:
+        result = classify_key(key)
+
+        assert result.feature == feature_for_key(key)
+        assert result.group == match_group(key)
+
+    def test_repeated_lookups_hit_the_cache(self) -> None:
+        for _ in range(3):
+            for key in KEYS:
+                classify_key(key)
+
+        info = classify_key.cache_info()
+        assert info.misses == len(KEYS)
+        assert info.hits == 2 * len(KEYS)
+
+    def test_feature_filter_uses_the_index(self) -> None:
+        assert not is_key_feature_active("SOLAR_RUNTIME", ["heating"])
+        assert is_key_feature_active("SOLAR_RUNTIME", ["solar"])
+
+        info = classify_key.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestSensorTraits:
+    """Key-derived parts of the sensor description."""
+
+    @pytest.mark.parametrize("key", KEYS)
+    def test_matches_the_uncached_derivation(self, key) -> None:
+        assert sensor_traits(key, False) == derive_sensor_traits(key, False)
+
+    def test_boolean_value_is_part_of_the_key(self) -> None:
+        assert sensor_traits("UNKNOWN_KEY", False).icon != "mdi:toggle-switch"
+
+        traits = sensor_traits("UNKNOWN_KEY", True)
+
+        assert traits.icon == "mdi:toggle-switch"
+        assert traits.unit is None
+        assert traits.device_class is None
+        assert sensor_traits.cache_info().currsize == 2
+
+    def test_system_keys_are_diagnostic(self) -> None:
+        traits = sensor_traits("SYSTEM_cpu_temperature", False)
+
+        assert traits.entity_category == EntityCategory.DIAGNOSTIC
+        assert traits.enabled_default is False
@@ -0,0 +1,88 @@
+"""Tests for the backwards scan of home-assistant.log.
+
+The export used to read the last ``lines * 10`` lines of the log and then keep
+the integration's ones, so on a busy log they were crowded out and the export
+came back nearly empty. The log is now read backwards block by block until
+enough matching lines are found or a byte budget is used up, continuing in the
+rotated ``home-assistant.log.1``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.violet_pool_controller import service_helpers
+from custom_components.violet_pool_controller.service_helpers import (
+    read_recent_violet_log_lines,
+)
+
+
+def _line(index: int, violet: bool) -> str:
+    logger = "custom_components.violet_pool_controller" if violet else "homeassistant.core"
+    return f"2026-01-01 00:00:00.000 INFO (MainThread) [{logger}] message {index}"
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    """Use tiny blocks so lines straddle block boundaries."""
+    monkeypatch.setattr(service_helpers, "LOG_SCAN_BLOCK_SIZE", 64)
+
+
+class TestReverseScan:
+    """Matching lines are found however far back they are."""
+
+    def test_lines_crowded_out_by_other_loggers(self, tmp_path) -> None:
+        log = tmp_path / "home-assistant.log"
+        lines = [_line(0, True), _line(1, True)]
+        lines += [_line(index, False) for index in range(2, 5000)]
+        log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        result = read_recent_violet_log_lines(str(log), 10, True)
+
+        assert result == [_line(0, True), _line(1, True)]
+
+    def test_returns_the_most_recent_matches_in_order(self, tmp_path) -> None:
+        log = tmp_path / "home-assistant.log"
+        log.write_text(
+            "\n".join(_line(index, index % 3 == 0) for index in range(300)), encoding="utf-8"
+        )
+
+        result = read_recent_violet_log_lines(str(log), 3, False)
+
+        assert result == ["message 291", "message 294", "message 297"]
+
+    def test_continues_in_the_rotated_log(self, tmp_path) -> None:
+        log = tmp_path / "home-assistant.log"
+        log.write_text(_line(2, True) + "\n", encoding="utf-8")
+        (tmp_path / "home-assistant.log.1").write_text(
+            _line(0, True) + "\n" + _line(1, True) + "\n", encoding="utf-8"
+        )
+
+        assert read_recent_violet_log_lines(str(log), 10, False) == [
+            "message 0",
+            "message 1",
+            "message 2",
+        ]
+        assert read_recent_violet_log_lines(str(log), 10, False, include_rotated=False) == [
+            "message 2"
+        ]
+
+    def test_byte_budget_limits_the_scan(self, tmp_path) -> None:
+        log = tmp_path / "home-assistant.log"
+        lines = [_line(0, True)] + [_line(index, False) for index in range(1, 100)]
+        log.write_text("\n".join(lines), encoding="utf-8")
+
+        assert read_recent_violet_log_lines(str(log), 10, True, byte_budget=1000) == []
+
+    def test_overlong_lines_are_skipped(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(service_helpers, "LOG_SCAN_MAX_LINE", 200)
+        log = tmp_path / "home-assistant.log"
+        overlong = _line(1, True) + " " + "x" * 1000
+        log.write_text(
+            "\n".join([_line(0, True), overlong, _line(2, True)]), encoding="utf-8"
+        )
+
+        assert read_recent_violet_log_lines(str(log), 10, False) == ["message 0", "message 2"]
+
+    def test_missing_log(self, tmp_path) -> None:
+        assert read_recent_violet_log_lines(str(tmp_path / "missing.log"), 10, True) == []
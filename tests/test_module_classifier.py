@@ -0,0 +1,117 @@
+"""Tests for the single-pass optional-module classifier.
+
+Module detection used to scan the whole payload once per module, and once
+more per module to restore keys of a module that dropped out. Keys are now
+bucketed by module prefix in a single pass, and the buckets of the previous
+payload drive the restoration. ``scripts/bench_module_classifier.py`` times
+both approaches.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    _classify_module_keys,
+)
+
+
+@pytest.fixture
+def device(hass):
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.dosing_standalone = False
+    api.get_output_runtimes = AsyncMock(return_value={})
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+
+class TestClassifyModuleKeys:
+    """Bucketing and presence detection."""
+
+    def test_keys_are_bucketed_by_prefix(self):
+        buckets, _present = _classify_module_keys(
+            {
+                "DOS_1_CL": 1,
+                "EXT1_1": 0,
+                "EXT2_3": 0,
+                "DMX_SCENE1": 0,
+                "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_1": 0,
+                "PUMP": 1,
+            }
+        )
+
+        assert buckets == {
+            "DOSING": ["DOS_1_CL"],
+            "EXT1": ["EXT1_1"],
+            "EXT2": ["EXT2_3"],
+            "DMX": ["DMX_SCENE1"],
+            "DIRULE": ["DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_1"],
+        }
+
+    def test_lookalike_keys_are_not_classified(self):
+        """Only the exact module prefixes count."""
+        buckets, present = _classify_module_keys(
+            {"DOSAGE_phminus_use": 1, "EXT10": 1, "DIGITALINPUT_1": 1, "DMXSTATE": 1}
+        )
+
+        assert not any(buckets.values())
+        assert present == set()
+
+    def test_only_valid_values_mark_a_module_present(self):
+        _buckets, present = _classify_module_keys(
+            {"DOS_1_CL": "N/A", "DMX_SCENE1": None, "EXT1_1": 0}
+        )
+
+        assert present == {"EXT1"}
+
+
+class TestIndexedRestoration:
+    """A module that drops out is restored from the previous payload's index."""
+
+    async def test_dmx_keys_restored_from_previous_poll(self, device):
+        device.api.get_readings = AsyncMock(
+            return_value={"PUMP": 1, "DMX_SCENE1": 1, "DMX_SCENE2": 0}
+        )
+        device._data = await device._fetch_controller_data()
+
+        device.api.get_readings = AsyncMock(return_value={"PUMP": 1})
+        data = await device._fetch_controller_data()
+
+        assert data["DMX_SCENE1"] == 1
+        assert data["DMX_SCENE2"] == 0
+        assert data["HW_DMX_MODULE"] is True
+
+    async def test_restored_keys_survive_a_second_missing_poll(self, device):
+        """The index keeps the restored keys, so they are restored again."""
+        device.api.get_readings = AsyncMock(return_value={"PUMP": 1, "DMX_SCENE1": 1})
+        device._data = await device._fetch_controller_data()
+
+        device.api.get_readings = AsyncMock(return_value={"PUMP": 1})
+        device._data = await device._fetch_controller_data()
+        data = await device._fetch_controller_data()
+
+        assert data["DMX_SCENE1"] == 1
@@ -0,0 +1,146 @@
+"""Tests for the OpenMetrics exposition.
+
+The integration's health data was only visible as a few diagnostic sensors and
+in the config entry diagnostics. An authenticated view now renders it - plus
+the numeric readings - in the OpenMetrics text format for Prometheus.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+from custom_components.violet_pool_controller.openmetrics import render_openmetrics
+from custom_components.violet_pool_controller.safety_guard import SafetyGuard
+
+
+class _FakePersistence:
+    async def async_load(self) -> dict:
+        return {}
+
+    async def async_save(self, data: dict) -> None:
+        return None
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> VioletPoolDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(
+        return_value={"PUMP": 1, "pH_value": "7.2", "PUMPSTATE": "3|PUMP_ANTI_FREEZE"}
+    )
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    return VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+
+
+def _samples(text: str) -> dict[str, float]:
+    """Map each sample line's name and labels to its value."""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+class TestRenderOpenMetrics:
+    """Content and format of the exposition."""
+
+    async def test_health_counters_and_readings(self, coordinator) -> None:
+        await coordinator.async_refresh()
+
+        text = render_openmetrics(coordinator)
+        samples = _samples(text)
+
+        assert text.endswith("# EOF\n")
+        assert samples["violet_up"] == 1
+        assert samples["violet_consecutive_failures"] == 0
+        assert samples["violet_api_requests_total"] == coordinator.device.api_totals["requests"]
+        assert samples["violet_api_requests_total"] > 0
+        assert samples["violet_polls_total"] == 1
+        assert samples['violet_circuit_breaker{violet_circuit_breaker="closed"}'] == 1
+        assert samples['violet_reading{key="pH_value"}'] == 7.2
+        assert samples['violet_reading{key="PUMP"}'] == 1
+        assert not any("PUMPSTATE" in name for name in samples)
+
+    async def test_stage_histogram_is_cumulative(self, coordinator) -> None:
+        await coordinator.async_refresh()
+
+        samples = _samples(render_openmetrics(coordinator))
+
+        assert samples['violet_poll_stage_duration_seconds_bucket{stage="poll",le="+Inf"}'] == 1
+        assert samples['violet_poll_stage_duration_seconds_count{stage="poll"}'] == 1
+
+    async def test_every_family_is_declared_once(self, coordinator) -> None:
+        await coordinator.async_refresh()
+
+        types = [
+            line.split()[2]
+            for line in render_openmetrics(coordinator).splitlines()
+            if line.startswith("# TYPE")
+        ]
+
+        assert len(types) == len(set(types))
+
+    async def test_safety_locks(self, hass: HomeAssistant, coordinator) -> None:
+        guard = SafetyGuard(hass, _FakePersistence())
+        guard.set_lock("DOS_1_CL", 300)
+
+        samples = _samples(render_openmetrics(coordinator, guard))
+
+        assert 298 <= samples['violet_safety_lock_remaining_seconds{key="DOS_1_CL"}'] <= 300
+
+    def test_label_values_are_escaped(self) -> None:
+        coordinator = MagicMock()
+        coordinator.data = {'odd"key': 1}
+        coordinator.device.device_name = "Pool\nA"
+        coordinator.device.api_totals = {}
+        coordinator.device.latency_percentiles = {}
+        coordinator.device.poll_profiler = SimpleNamespace(stages={})
+        for attr in ("consecutive_failures", "system_health", "last_event_age"):
+            setattr(coordinator.device, attr, 0)
+        coordinator.device.connection_latency = 0.0
+        coordinator.device.poll_count = 0
+        coordinator.device.is_stale = False
+
+        text = render_openmetrics(coordinator)
+
+        assert 'name="Pool\\nA"' in text
+        assert 'violet_reading{key="odd\\"key"} 1' in text
@@ -0,0 +1,124 @@
+"""Tests for throttling the getOutputRuntimes request.
+
+The runtime counters only advance while an output runs. getOutputRuntimes is
+therefore requested on every poll while an output is active, on a long timer
+while everything is idle, and right after a switch command.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+    OUTPUT_RUNTIMES_REFRESH_INTERVAL,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+
+IDLE_READINGS = {"PUMP": 0, "SOLAR": "6", "pH_value": "7.2"}
+ACTIVE_READINGS = {"PUMP": "3|PUMP_ANTI_FREEZE", "pH_value": "7.2"}
+RUNTIMES = {"PUMP_RUNTIME": "01h 10m", "SOLAR_RUNTIME": "00h 00m"}
+
+
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create a mocked API reporting idle outputs."""
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value=IDLE_READINGS)
+    api.get_output_runtimes = AsyncMock(return_value=RUNTIMES)
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    return api
+
+
+@pytest.fixture
+def device(hass: HomeAssistant, mock_api: MagicMock) -> VioletPoolControllerDevice:
+    """Create a device instance."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=mock_api)
+
+
+class TestRuntimesFetchThrottling:
+    """getOutputRuntimes is skipped on idle polls."""
+
+    async def test_idle_poll_reuses_cached_runtimes(self, device, mock_api) -> None:
+        """While everything is off the counters are served from the cache."""
+        await device.async_update()
+        data = await device.async_update()
+
+        assert mock_api.get_output_runtimes.await_count == 1
+        assert data["PUMP_RUNTIME"] == "01h 10m"
+
+    async def test_active_output_fetches_every_poll(self, device, mock_api) -> None:
+        """A running output keeps its runtime counter live."""
+        mock_api.get_readings = AsyncMock(return_value=ACTIVE_READINGS)
+
+        await device.async_update()
+        await device.async_update()
+        await device.async_update()
+
+        assert mock_api.get_output_runtimes.await_count == 3
+
+    async def test_first_idle_poll_after_activity_still_fetches(
+        self, device, mock_api
+    ) -> None:
+        """The final counter values are picked up once the output stops."""
+        mock_api.get_readings = AsyncMock(return_value=ACTIVE_READINGS)
+        await device.async_update()
+
+        mock_api.get_readings = AsyncMock(return_value=IDLE_READINGS)
+        await device.async_update()
+        await device.async_update()
+
+        assert mock_api.get_output_runtimes.await_count == 2
+
+    async def test_idle_runtimes_refetched_after_interval(self, device, mock_api) -> None:
+        """The idle timer still refreshes the counters eventually."""
+        await device.async_update()
+        device._last_runtimes_fetch -= OUTPUT_RUNTIMES_REFRESH_INTERVAL
+
+        await device.async_update()
+
+        assert mock_api.get_output_runtimes.await_count == 2
+
+    async def test_switch_command_forces_a_refetch(self, device, mock_api) -> None:
+        """A switch command is confirmed on the very next poll."""
+        await device.async_update()
+        device.request_runtimes_refresh()
+
+        await device.async_update()
+
+        assert mock_api.get_output_runtimes.await_count == 2
+
+    async def test_failed_fetch_keeps_previous_values(self, device, mock_api) -> None:
+        """A failing getOutputRuntimes must not drop the counters."""
+        await device.async_update()
+        mock_api.get_output_runtimes = AsyncMock(side_effect=TimeoutError("boom"))
+        device.request_runtimes_refresh()
+
+        data = await device.async_update()
+
+        assert data["PUMP_RUNTIME"] == "01h 10m"
@@ -0,0 +1,133 @@
+"""Tests for the columnar poll history.
+
+The device used to keep every poll as a tuple of Python objects in a deque,
+and a second deque of latencies that was summed on every sensor read. Both
+live in one array-backed ring buffer now, with running sums for the averages
+and percentiles over the latency window.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+from custom_components.violet_pool_controller.poll_history import PollHistory
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+FIELDS = ("Pool Temp", "pH")
+
+
+def _fill(history: PollHistory, latencies: list[float]) -> None:
+    for index, latency in enumerate(latencies):
+        history.append(START + timedelta(seconds=10 * index), index, latency, ("24.5", None))
+
+
+class TestRingBuffer:
+    """Storage and eviction."""
+
+    def test_records_round_trip(self) -> None:
+        history = PollHistory(4, FIELDS)
+
+        history.append(START, 312, 42.5, ("24.5", "n/a"))
+
+        assert len(history) == 1
+        assert history[0] == (START, 312, 42.5, (24.5, None))
+        assert history.first_timestamp == history.last_timestamp == START
+
+    def test_oldest_polls_are_overwritten(self) -> None:
+        history = PollHistory(3, FIELDS)
+
+        _fill(history, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        assert [count for _, count, _, _ in history] == [2, 3, 4]
+        assert history[-1][1] == 4
+        assert history.average_count == pytest.approx(3.0)
+        with pytest.raises(IndexError):
+            history[3]
+
+    def test_empty_history(self) -> None:
+        history = PollHistory(3, FIELDS)
+
+        assert not history
+        assert history.first_timestamp is None
+        assert history.average_latency == 0.0
+        assert history.latency_percentiles() == {}
+
+
+class TestLatencyStatistics:
+    """Averages and percentiles only cover the latency window."""
+
+    def test_average_follows_the_window(self) -> None:
+        history = PollHistory(10, FIELDS, latency_window=3)
+
+        _fill(history, [100.0, 1.0, 2.0, 3.0])
+
+        assert history.latency_samples == 3
+        assert history.average_latency == pytest.approx(2.0)
+
+    def test_average_when_window_equals_capacity(self) -> None:
+        history = PollHistory(3, FIELDS)
+
+        _fill(history, [100.0, 1.0, 2.0, 3.0])
+
+        assert history.average_latency == pytest.approx(2.0)
+
+    def test_percentiles(self) -> None:
+        history = PollHistory(200, FIELDS, latency_window=100)
+
+        _fill(history, [float(value) for value in range(1, 101)])
+
+        assert history.latency_percentiles() == {50: 50.0, 95: 95.0, 99: 99.0}
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> VioletPoolControllerDevice:
+    """Create a device backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1, "pH_value": "7.2"})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+
+class TestDevicePoll:
+    """A real poll goes through the device into the history."""
+
+    async def test_successful_poll_is_recorded(self, device) -> None:
+        await device.async_update()
+
+        assert len(device.poll_history) == 1
+        _, count, latency, readings = device.poll_history[-1]
+        assert count >= 2
+        assert latency >= 0
+        assert 7.2 in readings
+        assert device.average_latency == pytest.approx(latency)
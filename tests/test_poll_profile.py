@@ -0,0 +1,131 @@
+"""Tests for the per-stage timing histograms of the poll cycle.
+
+The connection latency covered the whole fetch, so a slow poll could not be
+told apart from slow post-processing. Each stage (HTTP per endpoint, module
+detection, merge, listener dispatch, entity writes) now feeds a histogram.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+from custom_components.violet_pool_controller.poll_profile import (
+    PollProfiler,
+    StageHistogram,
+)
+
+
+class TestStageHistogram:
+    """Bucketing and summary values."""
+
+    def test_samples_land_in_their_bucket(self) -> None:
+        histogram = StageHistogram((1, 10, 100))
+
+        for duration in (0.5, 5, 5, 50, 500):
+            histogram.add(duration)
+
+        result = histogram.as_dict()
+        assert result["count"] == 5
+        assert result["max_ms"] == 500
+        assert result["buckets"] == {"<=1ms": 1, "<=10ms": 2, "<=100ms": 1, ">100ms": 1}
+
+    def test_percentiles_use_the_bucket_bounds(self) -> None:
+        histogram = StageHistogram((1, 10, 100))
+        for _ in range(19):
+            histogram.add(5)
+        histogram.add(80)
+
+        assert histogram.percentile(50) == 10
+        assert histogram.percentile(95) == 10
+        assert histogram.percentile(100) == 80
+
+    def test_profiler_reports_only_recorded_stages(self) -> None:
+        profiler = PollProfiler()
+
+        profiler.record("http_readings", 0.2)
+
+        assert list(profiler.as_dict()) == ["http_readings"]
+        profiler.reset()
+        assert profiler.as_dict() == {}
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> AsyncIterator[VioletPoolDataUpdateCoordinator]:
+    """Create a coordinator backed by a mocked API, shut down after the test."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1, "EXT1_1": 0})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={"HEATER_set_temp": "28"})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    coordinator = VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+class TestPollStages:
+    """A poll records every stage once."""
+
+    async def test_poll_records_each_stage(self, coordinator) -> None:
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+
+        await coordinator.async_refresh()
+
+        profile = coordinator.device.poll_profiler.as_dict()
+        for stage in (
+            "http_readings",
+            "http_runtimes",
+            "http_config",
+            "snapshot",
+            "detection",
+            "merge",
+            "firmware",
+            "poll",
+            "dispatch",
+            "entity_writes",
+        ):
+            assert profile[stage]["count"] == 1, stage
+
+    async def test_failed_request_is_timed_too(self, coordinator) -> None:
+        coordinator.device.api.get_readings = AsyncMock(side_effect=TimeoutError("timeout"))
+
+        await coordinator.async_refresh()
+
+        profile = coordinator.device.poll_profiler.as_dict()
+        assert profile["http_readings"]["count"] == 1
+        assert "poll" not in profile
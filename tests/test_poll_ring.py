@@ -0,0 +1,143 @@
+"""Tests for the persisted poll history.
+
+The poll history and the latency statistics lived in memory only and started
+empty after every restart or reload. Each poll is now also appended to a
+memory-mapped ring file per config entry, which seeds the history on the next
+start.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import VioletPoolControllerDevice
+from custom_components.violet_pool_controller.poll_ring import PollRing
+
+FIELDS = ("Pool Temp", "pH")
+
+
+def _ring(tmp_path, capacity: int = 4, fields=FIELDS) -> PollRing:
+    ring = PollRing(str(tmp_path / "polls"), capacity, fields)
+    ring.open()
+    return ring
+
+
+class TestPollRing:
+    """Records survive closing and reopening the file."""
+
+    def test_round_trip(self, tmp_path) -> None:
+        ring = _ring(tmp_path)
+        ring.append(1_700_000_000.0, 120, 85.5, ("27.5", None))
+        ring.close()
+
+        reopened = _ring(tmp_path)
+
+        assert reopened.records() == [
+            (datetime.fromtimestamp(1_700_000_000.0), 120, 85.5, (27.5, None))
+        ]
+
+    def test_oldest_records_are_overwritten(self, tmp_path) -> None:
+        ring = _ring(tmp_path, capacity=3)
+        for index in range(5):
+            ring.append(1_700_000_000.0 + index, index, 1.0, (index, index))
+        ring.close()
+
+        reopened = _ring(tmp_path, capacity=3)
+
+        assert [record[1] for record in reopened.records()] == [2, 3, 4]
+        assert [record[1] for record in reopened.records(limit=2)] == [3, 4]
+        assert reopened.summary()["stored_polls"] == 3
+
+    def test_changed_layout_starts_empty(self, tmp_path) -> None:
+        ring = _ring(tmp_path)
+        ring.append(1_700_000_000.0, 1, 1.0, (1, 2))
+        ring.close()
+
+        reopened = _ring(tmp_path, fields=(*FIELDS, "Redox"))
+
+        assert reopened.records() == []
+        assert (tmp_path / "polls").stat().st_size == reopened.file_size
+
+    def test_closed_ring_ignores_appends(self, tmp_path) -> None:
+        ring = _ring(tmp_path)
+        ring.close()
+
+        ring.append(1_700_000_000.0, 1, 1.0, (1, 2))
+
+        assert ring.records() == []
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> VioletPoolControllerDevice:
+    """Create a device backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1, "pH_value": "7.2"})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        return VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+
+
+class TestDevicePollRing:
+    """The device persists its polls and restores them on the next start."""
+
+    async def test_polls_survive_a_restart(self, hass: HomeAssistant, device, tmp_path) -> None:
+        path = str(tmp_path / "polls")
+        await device.async_open_poll_ring(path)
+
+        await device.async_update()
+        await device.async_close_poll_ring()
+
+        with patch(
+            "custom_components.violet_pool_controller.device.async_get_clientsession",
+            return_value=MagicMock(),
+        ):
+            restarted = VioletPoolControllerDevice(hass, device.config_entry, device.api)
+        await restarted.async_open_poll_ring(path)
+
+        assert len(restarted.poll_history) == 1
+        assert restarted.poll_history[0][3][2] == 7.2
+        assert restarted.poll_ring.summary()["stored_polls"] == 1
+        await restarted.async_close_poll_ring()
+
+    async def test_close_waits_for_the_queued_appends(self, device, tmp_path) -> None:
+        path = str(tmp_path / "polls")
+        await device.async_open_poll_ring(path)
+        ring = device.poll_ring
+
+        await device.async_update()
+        await device.async_update()
+        await device.async_close_poll_ring()
+
+        assert not device._poll_ring_appends
+        ring.open()
+        assert ring.summary()["stored_polls"] == 2
+        ring.close()
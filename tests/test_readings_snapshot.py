@@ -0,0 +1,167 @@
+"""Tests for the shared read-only poll snapshot.
+
+One poll used to copy the payload five times on its way from the API to the
+entities. The device now fills a single ReadingsSnapshot, freezes it, and the
+same object becomes device.data, coordinator.data and the diagnostics payload.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+from custom_components.violet_pool_controller.readings_snapshot import ReadingsSnapshot
+
+
+def _violet_readings() -> type:
+    """Return the API package's VioletReadings, skipping without the package."""
+    readings_api = pytest.importorskip("violet_poolcontroller_api.readings")
+    # The test conftest installs a dict stand-in when the package is missing.
+    if getattr(readings_api, "__file__", None) is None:
+        pytest.skip("violet-poolcontroller-api is not installed")
+    return readings_api.VioletReadings
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> VioletPoolDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"pH_value": "7.2"})
+    api.get_output_runtimes = AsyncMock(return_value={"PUMP_RUNTIME": "01h 00m"})
+    api.get_config = AsyncMock(return_value={"HEATER_set_temp": "28"})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    return VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+
+
+class TestReadingsSnapshot:
+    """The snapshot is mutable while being built and read-only afterwards."""
+
+    def test_frozen_snapshot_rejects_writes(self) -> None:
+        snapshot = ReadingsSnapshot({"a": 1}).freeze(3)
+
+        with pytest.raises(TypeError):
+            snapshot["a"] = 2
+        with pytest.raises(TypeError):
+            snapshot.update(b=1)
+        with pytest.raises(TypeError):
+            snapshot.pop("a")
+        with pytest.raises(TypeError):
+            del snapshot["a"]
+        assert snapshot == {"a": 1}
+        assert snapshot.generation == 3
+
+    def test_unfrozen_snapshot_accepts_writes(self) -> None:
+        snapshot = ReadingsSnapshot({"a": 1})
+
+        snapshot["b"] = 2
+        snapshot.update(c=3)
+
+        assert snapshot == {"a": 1, "b": 2, "c": 3}
+
+    @pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy])
+    def test_copies_keep_the_generation(self, clone) -> None:
+        snapshot = ReadingsSnapshot({"a": [1]}).freeze(7)
+
+        cloned = clone(snapshot)
+
+        assert cloned == snapshot
+        assert cloned.generation == 7
+
+    def test_pickle_round_trip(self) -> None:
+        snapshot = ReadingsSnapshot({"a": 1}).freeze(2)
+
+        assert pickle.loads(pickle.dumps(snapshot)) == {"a": 1}
+
+
+class TestSharedSnapshot:
+    """Device and coordinator hand the same object around."""
+
+    async def test_coordinator_data_is_device_data(self, coordinator) -> None:
+        await coordinator.async_refresh()
+
+        assert coordinator.data is coordinator.device.data
+        assert isinstance(coordinator.data, ReadingsSnapshot)
+        assert coordinator.data["HEATER_set_temp"] == "28"
+        assert coordinator.data["PUMP_RUNTIME"] == "01h 00m"
+
+    async def test_generation_advances_per_poll(self, coordinator) -> None:
+        await coordinator.async_refresh()
+        first = coordinator.data
+        await coordinator.async_refresh()
+
+        assert coordinator.data is not first
+        assert coordinator.data.generation == first.generation + 1
+
+    async def test_entities_cannot_mutate_the_snapshot(self, coordinator) -> None:
+        await coordinator.async_refresh()
+
+        with pytest.raises(TypeError):
+            coordinator.data["pH_value"] = "0"
+
+    async def test_failed_poll_returns_previous_snapshot(self, coordinator) -> None:
+        """A tolerated failure keeps serving the last snapshot without a copy."""
+        await coordinator.async_refresh()
+        previous = coordinator.data
+        coordinator.device.api.get_readings.side_effect = RuntimeError("boom")
+
+        data = await coordinator.device.async_update()
+
+        assert data is previous
+
+
+class TestVioletReadings:
+    """Snapshots are built from the API package's immutable readings."""
+
+    def test_snapshot_copies_violet_readings(self) -> None:
+        readings = _violet_readings()({"pH_value": "7.2", "PUMP": 1})
+
+        snapshot = ReadingsSnapshot(readings).freeze(1)
+
+        assert snapshot == dict(readings)
+        assert json.loads(json.dumps(snapshot)) == snapshot
+
+    async def test_poll_of_violet_readings(self, coordinator) -> None:
+        readings = _violet_readings()({"pH_value": "7.2", "PUMP": 1})
+        coordinator.device.api.get_readings.return_value = readings
+
+        await coordinator.async_refresh()
+
+        assert isinstance(coordinator.data, dict)
+        assert coordinator.data.keys() >= readings.keys()
+        assert coordinator.data["HEATER_set_temp"] == "28"
@@ -0,0 +1,123 @@
+"""Tests for coalescing the refreshes requested after commands.
+
+Every switch, select, number and climate command used to start its own
+delayed coordinator refresh, so a scene toggling eight relays polled the
+controller eight times in a row. Requests that arrive while one is pending now
+share a single poll and await the same result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+)
+
+
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> VioletPoolDataUpdateCoordinator:
+    """Create a coordinator backed by a mocked API."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    api = MagicMock()
+    api.get_readings = AsyncMock(return_value={"PUMP": 1, "EXT1_1": 0})
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    with patch(
+        "custom_components.violet_pool_controller.device.async_get_clientsession",
+        return_value=MagicMock(),
+    ):
+        device = VioletPoolControllerDevice(hass=hass, config_entry=entry, api=api)
+    return VioletPoolDataUpdateCoordinator(
+        hass=hass, device=device, name="test_coordinator", polling_interval=30
+    )
+
+
+class TestRefreshCoalescing:
+    """Refresh requests inside one window share a poll."""
+
+    async def test_burst_shares_one_poll(self, coordinator) -> None:
+        results = await asyncio.gather(
+            *(coordinator.async_request_coalesced_refresh(0.01 * i) for i in range(8))
+        )
+
+        assert results == [True] * 8
+        assert coordinator.device.api.get_readings.await_count == 1
+
+    async def test_poll_waits_for_the_longest_delay(self, coordinator) -> None:
+        """A relay that needs more settle time delays the shared poll."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(
+            coordinator.async_request_coalesced_refresh(0.01),
+            coordinator.async_request_coalesced_refresh(0.05),
+        )
+
+        assert loop.time() - start >= 0.05
+        assert coordinator.device.api.get_readings.await_count == 1
+
+    async def test_requests_after_the_poll_start_a_new_window(self, coordinator) -> None:
+        await coordinator.async_request_coalesced_refresh(0)
+        await coordinator.async_request_coalesced_refresh(0)
+
+        assert coordinator.device.api.get_readings.await_count == 2
+
+    async def test_window_cap_opens_the_next_window(self, coordinator) -> None:
+        """A late joiner with a long delay gets its own poll instead."""
+        with patch(
+            "custom_components.violet_pool_controller.device.REFRESH_COALESCE_MAX_WAIT",
+            0.02,
+        ):
+            await asyncio.gather(
+                coordinator.async_request_coalesced_refresh(0.01),
+                coordinator.async_request_coalesced_refresh(0.05),
+            )
+
+        assert coordinator.device.api.get_readings.await_count == 2
+
+    async def test_failed_poll_is_reported_to_every_caller(self, coordinator) -> None:
+        coordinator.device.api.get_readings = AsyncMock(side_effect=RuntimeError("boom"))
+
+        results = await asyncio.gather(
+            coordinator.async_request_coalesced_refresh(0),
+            coordinator.async_request_coalesced_refresh(0),
+        )
+
+        assert results == [False, False]
+
+    async def test_shutdown_releases_the_callers(self, coordinator) -> None:
+        """Shutting down cancels a pending window instead of leaving it waiting."""
+        caller = asyncio.ensure_future(coordinator.async_request_coalesced_refresh(10))
+        await asyncio.sleep(0)
+
+        await coordinator.async_shutdown()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        coordinator.device.api.get_readings.assert_not_awaited()
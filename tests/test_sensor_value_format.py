@@ -0,0 +1,105 @@
+"""Tests for the per-key value format of generic sensors.
+
+VioletSensor.native_value used to work out the rendering of its key on every
+state write. The decision only depends on the key, so it is compiled once
+when the sensor is created and native_value just applies it.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.sensor import SensorEntityDescription
+
+from custom_components.violet_pool_controller.sensor_modules import compile_value_format
+from custom_components.violet_pool_controller.sensor_modules.base import (
+    VALUE_FORMAT_NUMBER,
+    VALUE_FORMAT_ROUNDED,
+    VALUE_FORMAT_STOPWATCH,
+    VALUE_FORMAT_TEXT,
+    VALUE_FORMAT_TIMESTAMP,
+    ValueFormat,
+)
+from custom_components.violet_pool_controller.sensor_modules.generic import VioletSensor
+
+
+def _make_sensor(key: str, value) -> VioletSensor:
+    """Create a generic sensor whose coordinator reports ``value`` for ``key``."""
+    coordinator = MagicMock()
+    coordinator.data = {key: value}
+    coordinator.device.available = True
+    coordinator.last_update_success = True
+    coordinator.device.device_info = {}
+
+    config_entry = MagicMock()
+    config_entry.entry_id = "test_entry_id"
+    config_entry.options.get.return_value = False
+    config_entry.data.get.return_value = False
+
+    description = SensorEntityDescription(key=key, name=key, translation_key=None)
+    return VioletSensor(coordinator, config_entry, description)
+
+
+class TestCompileValueFormat:
+    """The plan for representative keys."""
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("CURRENT_TIME_UNIX", ValueFormat(VALUE_FORMAT_TIMESTAMP)),
+            ("PUMP_LAST_ON", ValueFormat(VALUE_FORMAT_TIMESTAMP)),
+            ("PUMP_RPM_1_LAST_ON", ValueFormat(VALUE_FORMAT_TEXT)),
+            ("PUMP_RUNTIME", ValueFormat(VALUE_FORMAT_TEXT)),
+            ("onewire1_rcode", ValueFormat(VALUE_FORMAT_TEXT)),
+            (
+                "DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_STOPWATCH_1",
+                ValueFormat(VALUE_FORMAT_STOPWATCH),
+            ),
+            ("pH_value", ValueFormat(VALUE_FORMAT_ROUNDED, 2)),
+            ("onewire1_value", ValueFormat(VALUE_FORMAT_ROUNDED, 2)),
+            ("ADC1_value", ValueFormat(VALUE_FORMAT_ROUNDED, 2)),
+            ("SYSTEM_cpu_load", ValueFormat(VALUE_FORMAT_ROUNDED, 1)),
+            ("DOS_1_CL_REMAINING_PERCENT", ValueFormat(VALUE_FORMAT_ROUNDED, 1)),
+            ("onewire1_freezecount", ValueFormat(VALUE_FORMAT_NUMBER)),
+            ("PUMP_RPM_0_VALUE", ValueFormat(VALUE_FORMAT_NUMBER)),
+        ],
+    )
+    def test_plan(self, key: str, expected: ValueFormat) -> None:
+        assert compile_value_format(key) == expected
+
+    def test_plan_is_compiled_at_creation(self) -> None:
+        sensor = _make_sensor("pH_value", "7.234")
+
+        assert sensor._value_format == ValueFormat(VALUE_FORMAT_ROUNDED, 2)
+
+
+class TestNativeValue:
+    """native_value renders exactly as before."""
+
+    @pytest.mark.parametrize(
+        ("key", "raw", "expected"),
+        [
+            ("PUMP_LAST_ON", "1700000000", datetime.fromtimestamp(1700000000, tz=UTC)),
+            ("PUMP_LAST_ON", "1700000000000", datetime.fromtimestamp(1700000000, tz=UTC)),
+            ("PUMP_LAST_ON", "0", None),
+            ("PUMP_LAST_ON", "never", None),
+            ("PUMP_RUNTIME", "01h 10m", "01h 10m"),
+            ("DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_STOPWATCH_1", "3725", "1h 2m 5s"),
+            ("DIGITALINPUTRULE_STATE_DIGITALINPUT_RULE_STOPWATCH_1", "n/a", "n/a"),
+            ("pH_value", "7.234", 7.23),
+            ("onewire1_value", "24", 24.0),
+            ("SYSTEM_cpu_load", "12.345", 12.3),
+            ("onewire1_freezecount", "3.0", 3),
+            ("PUMP_RPM_0_VALUE", "1234.567", 1234.57),
+            ("PUMP_RPM_0_VALUE", "off", "off"),
+        ],
+    )
+    def test_rendering(self, key: str, raw, expected) -> None:
+        assert _make_sensor(key, raw).native_value == expected
+
+    def test_missing_value_is_none(self) -> None:
+        sensor = _make_sensor("pH_value", None)
+
+        assert sensor.native_value is None
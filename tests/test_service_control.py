@@ -1,6 +1,6 @@
 """Tests for VioletControlServiceHandlers control service handlers."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -320,51 +320,45 @@ class TestHandleControlExtensionRelay:
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
 
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.extension.VioletControlClient"
-        ) as mock_client_cls:
-            mock_client = mock_client_cls.return_value
-            mock_client.set_function_manually = AsyncMock(return_value=True)
+        mock_client = coord.device.control_client.return_value
+        mock_client.set_function_manually = AsyncMock(return_value=True)
 
-            await handlers.handle_control_extension_relay(
-                make_service_call(
-                    {
-                        "relay_id": 1,
-                        "action": "on",
-                        "duration": 0,
-                    }
-                )
+        await handlers.handle_control_extension_relay(
+            make_service_call(
+                {
+                    "relay_id": 1,
+                    "action": "on",
+                    "duration": 0,
+                }
             )
+        )
 
-            mock_client.set_function_manually.assert_awaited_once()
-            args = mock_client.set_function_manually.call_args[0]
-            assert args[0] == "EXT1_1"
-            assert args[1] == "4"
+        mock_client.set_function_manually.assert_awaited_once()
+        args = mock_client.set_function_manually.call_args[0]
+        assert args[0] == "EXT1_1"
+        assert args[1] == "4"
 
     async def test_relay_off(self, handlers):
         """Turning relay off sends state 6 (manual off)."""
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
 
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.extension.VioletControlClient"
-        ) as mock_client_cls:
-            mock_client = mock_client_cls.return_value
-            mock_client.set_function_manually = AsyncMock(return_value=True)
+        mock_client = coord.device.control_client.return_value
+        mock_client.set_function_manually = AsyncMock(return_value=True)
 
-            await handlers.handle_control_extension_relay(
-                make_service_call(
-                    {
-                        "relay_id": 3,
-                        "action": "off",
-                        "duration": 0,
-                    }
-                )
+        await handlers.handle_control_extension_relay(
+            make_service_call(
+                {
+                    "relay_id": 3,
+                    "action": "off",
+                    "duration": 0,
+                }
             )
+        )
 
-            args = mock_client.set_function_manually.call_args[0]
-            assert args[0] == "EXT3_1"
-            assert args[1] == "6"
+        args = mock_client.set_function_manually.call_args[0]
+        assert args[0] == "EXT3_1"
+        assert args[1] == "6"
 
     async def test_relay_invalid_id_high(self, handlers):
         """Relay ID > 8 raises HomeAssistantError."""
@@ -395,25 +389,22 @@ class TestHandleControlExtensionRelay:
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
 
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.extension.VioletControlClient"
-        ) as mock_client_cls:
-            mock_client = mock_client_cls.return_value
-            mock_client.set_function_manually = AsyncMock(return_value=True)
+        mock_client = coord.device.control_client.return_value
+        mock_client.set_function_manually = AsyncMock(return_value=True)
 
-            await handlers.handle_control_extension_relay(
-                make_service_call(
-                    {
-                        "relay_id": 2,
-                        "state": 1,
-                        "duration": 0,
-                    }
-                )
+        await handlers.handle_control_extension_relay(
+            make_service_call(
+                {
+                    "relay_id": 2,
+                    "state": 1,
+                    "duration": 0,
+                }
             )
+        )
 
-            args = mock_client.set_function_manually.call_args[0]
-            assert args[0] == "EXT2_1"
-            assert args[1] == "1"
+        args = mock_client.set_function_manually.call_args[0]
+        assert args[0] == "EXT2_1"
+        assert args[1] == "1"
 
 
 class TestHandleControlPumpHttp:
@@ -432,30 +423,24 @@ class TestHandleControlPumpHttp:
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
 
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.pump.VioletControlClient"
-        ) as mock_client_cls:
-            mock_client = mock_client_cls.return_value
-            mock_client.set_pump_speed = AsyncMock(return_value=True)
+        mock_client = coord.device.control_client.return_value
+        mock_client.set_pump_speed = AsyncMock(return_value=True)
 
-            await handlers.handle_control_pump_http(make_service_call({"action": "on", "speed": 2}))
+        await handlers.handle_control_pump_http(make_service_call({"action": "on", "speed": 2}))
 
-            mock_client.set_pump_speed.assert_awaited_once_with(2)
+        mock_client.set_pump_speed.assert_awaited_once_with(2)
 
     async def test_pump_off(self, handlers):
         """Pump off via HTTP sends PUMP OFF command."""
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
 
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.pump.VioletControlClient"
-        ) as mock_client_cls:
-            mock_client = mock_client_cls.return_value
-            mock_client.set_pump_off = AsyncMock(return_value=True)
+        mock_client = coord.device.control_client.return_value
+        mock_client.set_pump_off = AsyncMock(return_value=True)
 
-            await handlers.handle_control_pump_http(make_service_call({"action": "off"}))
+        await handlers.handle_control_pump_http(make_service_call({"action": "off"}))
 
-            mock_client.set_pump_off.assert_awaited_once()
+        mock_client.set_pump_off.assert_awaited_once()
 
 
 class TestHandleManualDosingHttp:
@@ -473,24 +458,21 @@ class TestHandleManualDosingHttp:
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
 
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.dosing.VioletControlClient"
-        ) as mock_client_cls:
-            mock_client = mock_client_cls.return_value
-            mock_client.trigger_manual_dosing = AsyncMock(return_value=True)
+        mock_client = coord.device.control_client.return_value
+        mock_client.trigger_manual_dosing = AsyncMock(return_value=True)
 
-            await handlers.handle_manual_dosing_http(
-                make_service_call(
-                    {
-                        "dosing_system": "chlorine",
-                        "runtime_seconds": 30,
-                    }
-                )
+        await handlers.handle_manual_dosing_http(
+            make_service_call(
+                {
+                    "dosing_system": "chlorine",
+                    "runtime_seconds": 30,
+                }
             )
+        )
 
-            mock_client.trigger_manual_dosing.assert_awaited_once()
-            args = mock_client.trigger_manual_dosing.call_args[0]
-            assert args[0] == DOSING_INDEX_MAP["chlorine"]
+        mock_client.trigger_manual_dosing.assert_awaited_once()
+        args = mock_client.trigger_manual_dosing.call_args[0]
+        assert args[0] == DOSING_INDEX_MAP["chlorine"]
 
     async def test_dosing_unknown_system(self, handlers):
         """Unknown dosing system raises HomeAssistantError."""
@@ -546,26 +528,22 @@ class TestHandleControlHeaterHttp:
     async def test_heater_on(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.climate.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_heater_on = AsyncMock(return_value=True)
-            cls.return_value.set_config = AsyncMock(return_value=True)
-            await handlers.handle_control_heater_http(
-                make_service_call({"action": "on", "target_temperature": 28.0})
-            )
-            cls.return_value.set_heater_on.assert_awaited_once()
-            cls.return_value.set_config.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_heater_on = AsyncMock(return_value=True)
+        control.set_config = AsyncMock(return_value=True)
+        await handlers.handle_control_heater_http(
+            make_service_call({"action": "on", "target_temperature": 28.0})
+        )
+        control.set_heater_on.assert_awaited_once()
+        control.set_config.assert_awaited_once()
 
     async def test_heater_off(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.climate.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_heater_off = AsyncMock(return_value=True)
-            await handlers.handle_control_heater_http(make_service_call({"action": "off"}))
-            cls.return_value.set_heater_off.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_heater_off = AsyncMock(return_value=True)
+        await handlers.handle_control_heater_http(make_service_call({"action": "off"}))
+        control.set_heater_off.assert_awaited_once()
 
 
 class TestHandleControlSolarHttp:
@@ -581,22 +559,18 @@ class TestHandleControlSolarHttp:
     async def test_solar_on(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.climate.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_solar_on = AsyncMock(return_value=True)
-            await handlers.handle_control_solar_http(make_service_call({"action": "on"}))
-            cls.return_value.set_solar_on.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_solar_on = AsyncMock(return_value=True)
+        await handlers.handle_control_solar_http(make_service_call({"action": "on"}))
+        control.set_solar_on.assert_awaited_once()
 
     async def test_solar_off(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.climate.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_solar_off = AsyncMock(return_value=True)
-            await handlers.handle_control_solar_http(make_service_call({"action": "off"}))
-            cls.return_value.set_solar_off.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_solar_off = AsyncMock(return_value=True)
+        await handlers.handle_control_solar_http(make_service_call({"action": "off"}))
+        control.set_solar_off.assert_awaited_once()
 
 
 class TestHandleControlCoverHttp:
@@ -620,12 +594,10 @@ class TestHandleControlCoverHttp:
     async def test_cover_actions(self, handlers, action, method):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.cover.VioletControlClient"
-        ) as cls:
-            setattr(cls.return_value, method, AsyncMock(return_value=True))
-            await handlers.handle_control_cover_http(make_service_call({"action": action}))
-            getattr(cls.return_value, method).assert_awaited_once()
+        control = coord.device.control_client.return_value
+        setattr(control, method, AsyncMock(return_value=True))
+        await handlers.handle_control_cover_http(make_service_call({"action": action}))
+        getattr(control, method).assert_awaited_once()
 
 
 class TestHandleControlBackwashHttp:
@@ -641,12 +613,10 @@ class TestHandleControlBackwashHttp:
     async def test_backwash_abort(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.pump.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_backwash_abort = AsyncMock(return_value=True)
-            await handlers.handle_control_backwash_http(make_service_call({"action": "abort"}))
-            cls.return_value.set_backwash_abort.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_backwash_abort = AsyncMock(return_value=True)
+        await handlers.handle_control_backwash_http(make_service_call({"action": "abort"}))
+        control.set_backwash_abort.assert_awaited_once()
 
     async def test_backwash_run_requires_duration(self, handlers):
         """Run action requires duration_seconds for safety."""
@@ -660,15 +630,13 @@ class TestHandleControlBackwashHttp:
     async def test_backwash_run_with_duration(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.pump.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_backwash_run = AsyncMock(return_value=True)
-            cls.return_value.set_backwash_abort = AsyncMock(return_value=True)
-            await handlers.handle_control_backwash_http(
-                make_service_call({"action": "run", "duration_seconds": 120})
-            )
-            cls.return_value.set_backwash_run.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_backwash_run = AsyncMock(return_value=True)
+        control.set_backwash_abort = AsyncMock(return_value=True)
+        await handlers.handle_control_backwash_http(
+            make_service_call({"action": "run", "duration_seconds": 120})
+        )
+        control.set_backwash_run.assert_awaited_once()
 
 
 class TestHandleControlRefillHttp:
@@ -684,12 +652,10 @@ class TestHandleControlRefillHttp:
     async def test_refill_stop(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.cover.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_function_manually = AsyncMock(return_value=True)
-            await handlers.handle_control_refill_http(make_service_call({"action": "stop"}))
-            cls.return_value.set_function_manually.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_function_manually = AsyncMock(return_value=True)
+        await handlers.handle_control_refill_http(make_service_call({"action": "stop"}))
+        control.set_function_manually.assert_awaited_once()
 
     async def test_refill_fill_requires_duration(self, handlers):
         """Fill action requires duration_seconds for safety."""
@@ -703,14 +669,12 @@ class TestHandleControlRefillHttp:
     async def test_refill_fill_with_duration(self, handlers):
         coord = make_coordinator()
         handlers.manager.get_coordinators_for_call = AsyncMock(return_value=[coord])
-        with patch(
-            "custom_components.violet_pool_controller.service_mixins.cover.VioletControlClient"
-        ) as cls:
-            cls.return_value.set_function_manually = AsyncMock(return_value=True)
-            await handlers.handle_control_refill_http(
-                make_service_call({"action": "fill", "duration_seconds": 60})
-            )
-            cls.return_value.set_function_manually.assert_awaited_once()
+        control = coord.device.control_client.return_value
+        control.set_function_manually = AsyncMock(return_value=True)
+        await handlers.handle_control_refill_http(
+            make_service_call({"action": "fill", "duration_seconds": 60})
+        )
+        control.set_function_manually.assert_awaited_once()
 
 
 class TestHandleManagePvSurplus:
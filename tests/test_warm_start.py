@@ -0,0 +1,173 @@
+"""Tests for the warm start from the persisted last payload.
+
+Setup used to block on the first getReadings and raised ConfigEntryNotReady
+while the controller was slow or down, so no entity existed until it answered.
+The last successful payload is now persisted, setup builds the coordinator from
+it (flagged stale) and the first live poll runs in the background.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.violet_pool_controller.binary_sensor import VioletBinarySensor
+from custom_components.violet_pool_controller.const import (
+    CONF_API_URL,
+    CONF_CONTROLLER_NAME,
+    CONF_DEVICE_ID,
+    CONF_DEVICE_NAME,
+    CONF_USE_SSL,
+    DOMAIN,
+)
+from custom_components.violet_pool_controller.device import (
+    PAYLOAD_STORAGE_VERSION,
+    VioletPoolControllerDevice,
+    VioletPoolDataUpdateCoordinator,
+    async_setup_device,
+    payload_storage_key,
+)
+
+PAYLOAD = {
+    "saved_at": 0,
+    "firmware_version": "1.2.3",
+    "data": {"PUMP": 1, "pH_value": "7.2", "EXT1_1": 0},
+    "config": {"HEATER_set_temp": "28"},
+    "hw_detected": ["EXT1"],
+    "hardware_config": {
+        "identity": {"controller": "192.168.178.55_1", "firmware_version": "1.2.3"},
+        "config": {"NAMES_ext1relay1": "Fountain"},
+    },
+}
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Create a config entry added to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test Pool",
+        data={
+            CONF_API_URL: "192.168.178.55",
+            CONF_USE_SSL: False,
+            CONF_DEVICE_ID: 1,
+            CONF_DEVICE_NAME: "Test Pool Controller",
+            CONF_CONTROLLER_NAME: "Test Pool",
+        },
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def mock_api() -> MagicMock:
+    """Create an API whose controller does not answer."""
+    api = MagicMock()
+    api.get_readings = AsyncMock(side_effect=TimeoutError("timeout"))
+    api.get_output_runtimes = AsyncMock(return_value={})
+    api.get_config = AsyncMock(return_value={})
+    api.dosing_standalone = False
+    return api
+
+
+def _store_payload(hass_storage: dict[str, Any], entry_id: str) -> None:
+    """Put PAYLOAD into hass.storage the way Store writes it."""
+    key = payload_storage_key(entry_id)
+    hass_storage[key] = {"version": PAYLOAD_STORAGE_VERSION, "key": key, "data": PAYLOAD}
+
+
+class TestRestorePayload:
+    """Restoring a payload on the device."""
+
+    def test_round_trip(self, hass: HomeAssistant, config_entry, mock_api) -> None:
+        with patch(
+            "custom_components.violet_pool_controller.device.async_get_clientsession",
+            return_value=MagicMock(),
+        ):
+            device = VioletPoolControllerDevice(hass, config_entry, mock_api)
+
+        assert device.restore_payload(PAYLOAD) is True
+
+        stored = device._stored_payload()
+        assert stored["data"] == PAYLOAD["data"]
+        assert stored["config"] == PAYLOAD["config"]
+        assert stored["hw_detected"] == ["EXT1"]
+        assert device.available is True
+        assert device.is_stale is True
+        assert device.hardware_config["extension_relays"]["EXT1_1"]["name"] == "Fountain"
+        assert stored["hardware_config"] == PAYLOAD["hardware_config"]
+
+    def test_empty_payload_is_ignored(self, hass: HomeAssistant, config_entry, mock_api) -> None:
+        with patch(
+            "custom_components.violet_pool_controller.device.async_get_clientsession",
+            return_value=MagicMock(),
+        ):
+            device = VioletPoolControllerDevice(hass, config_entry, mock_api)
+
+        assert device.restore_payload({"data": {}}) is False
+        assert device.available is False
+
+
+class TestWarmStart:
+    """Setup with a persisted payload."""
+
+    async def test_setup_does_not_wait_for_the_controller(
+        self, hass: HomeAssistant, hass_storage, config_entry, mock_api
+    ) -> None:
+        _store_payload(hass_storage, config_entry.entry_id)
+
+        with patch(
+            "custom_components.violet_pool_controller.device.async_get_clientsession",
+            return_value=MagicMock(),
+        ):
+            coordinator = await async_setup_device(hass, config_entry, mock_api)
+
+        assert coordinator.data["pH_value"] == "7.2"
+        assert coordinator.device.is_stale is True
+
+    async def test_live_poll_replaces_the_payload(
+        self, hass: HomeAssistant, hass_storage, config_entry, mock_api
+    ) -> None:
+        _store_payload(hass_storage, config_entry.entry_id)
+        mock_api.get_readings = AsyncMock(return_value={"PUMP": 0, "pH_value": "7.4"})
+
+        with patch(
+            "custom_components.violet_pool_controller.device.async_get_clientsession",
+            return_value=MagicMock(),
+        ):
+            coordinator = await async_setup_device(hass, config_entry, mock_api)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        assert coordinator.data["pH_value"] == "7.4"
+        assert coordinator.device.is_stale is False
+
+
+class TestStaleAttribute:
+    """Entities flag restored values as stale."""
+
+    def test_platform_attributes_keep_the_flag(
+        self, hass: HomeAssistant, config_entry, mock_api
+    ) -> None:
+        """The flag is merged into attributes a platform defines itself."""
+        with patch(
+            "custom_components.violet_pool_controller.device.async_get_clientsession",
+            return_value=MagicMock(),
+        ):
+            device = VioletPoolControllerDevice(hass, config_entry, mock_api)
+        device.restore_payload(PAYLOAD)
+        coordinator = VioletPoolDataUpdateCoordinator(
+            hass=hass, device=device, name="test_coordinator", polling_interval=30
+        )
+        sensor = VioletBinarySensor(
+            coordinator, config_entry, BinarySensorEntityDescription(key="PUMP", name="Pump")
+        )
+
+        attributes = sensor.extra_state_attributes
+
+        assert attributes["stale"] is True
+        assert attributes["raw_state"] == "1"